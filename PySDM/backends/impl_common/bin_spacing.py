@@ -0,0 +1,27 @@
+"""
+detection of uniform (linear or logarithmic) spacing of bin edges, allowing
+ the backend `spectrum_moments()` kernels to locate bins by direct index computation
+ (falling back to binary search for arbitrary edges)
+"""
+import numpy as np
+
+ARBITRARY = 0
+LINEAR = 1
+LOGARITHMIC = 2
+
+
+def detect_bin_spacing(edges, rtol=1e-6):
+    """returns one of `ARBITRARY`, `LINEAR` or `LOGARITHMIC`; index computation
+    is followed by exact comparisons against the edges in the kernels, hence
+    the tolerance only affects performance (not the binning)"""
+    edges = np.asarray(edges, dtype=float)
+    if len(edges) < 2 or not np.all(np.isfinite(edges)) or np.any(np.diff(edges) <= 0):
+        return ARBITRARY
+    widths = np.diff(edges)
+    if np.allclose(widths, widths[0], rtol=rtol, atol=0):
+        return LINEAR
+    if edges[0] > 0:
+        log_widths = np.diff(np.log(edges))
+        if np.allclose(log_widths, log_widths[0], rtol=rtol, atol=0):
+            return LOGARITHMIC
+    return ARBITRARY
@@ -0,0 +1,22 @@
+"""
+caching of objects built out of `PySDM.formulae.Formulae` (e.g., jit-compiled kernels)
+ keyed on `PySDM.formulae.Formulae.cache_key` so that equivalent `Formulae` instances
+ (e.g., in ensembles of simulations) share them instead of triggering recompilation
+"""
+from functools import wraps
+
+
+def cached_per_formulae(factory):
+    """decorator memoising `factory(formulae, **kwargs)` on `formulae.cache_key`
+    and the (hashable) keyword arguments"""
+    cache = {}
+
+    @wraps(factory)
+    def wrapper(formulae, **kwargs):
+        key = (formulae.cache_key, tuple(sorted(kwargs.items())))
+        if key not in cache:
+            cache[key] = factory(formulae, **kwargs)
+        return cache[key]
+
+    wrapper.cache = cache
+    return wrapper
@@ -1,10 +1,19 @@
 """
 specialised storage equipped with particle pair-handling methods
 """
+from .storage_utils import StorageSignature
 
 
 def make_PairwiseStorage(backend):
     class PairwiseStorage(backend.Storage):
+        def __getitem__(self, item):
+            result = backend.Storage.__getitem__(self, item)
+            if isinstance(result, backend.Storage):
+                return PairwiseStorage(
+                    StorageSignature(result.data, result.shape, result.dtype)
+                )
+            return result
+
         @staticmethod
         def empty(shape, dtype):
             result = PairwiseStorage(backend.Storage._get_empty_data(shape, dtype))
@@ -10,6 +10,9 @@ JIT_FLAGS = dict(
     parallel=True,
     fastmath=True,
     error_model="numpy",
+    # allowing overlap with, e.g., pipelined Eulerian advection
+    # (requires a thread-safe threading layer: tbb or omp, not workqueue)
+    nogil=True,
     cache=False,  # https://github.com/numba/numba/issues/2956
 )
 
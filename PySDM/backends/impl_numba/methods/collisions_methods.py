@@ -221,6 +221,8 @@ def break_up_while(  # pylint: disable=too-many-arguments,unused-argument
 
 
 class CollisionsMethods(BackendMethods):
+    INCREMENTAL_SORT_MAX_MOVERS_FRACTION = 0.25
+
     @staticmethod
     @numba.njit(**{**conf.JIT_FLAGS, **{"parallel": False}})
     def __adaptive_sdm_end_body(dt_left, n_cell, cell_start):
@@ -485,6 +487,80 @@ class CollisionsMethods(BackendMethods):
             handle_all_breakups=handle_all_breakups,
         )
 
+    @staticmethod
+    @numba.njit(**{**conf.JIT_FLAGS, **{"parallel": False}})
+    # pylint: disable=too-many-arguments
+    def __gather_colliding_pairs_body(
+        gamma, idx, length, is_first_in_pair, colliding_pairs, colliding_pairs_idx
+    ):
+        n_colliding = 0
+        for i in range(length // 2):
+            if gamma[i] == 0:
+                continue
+            j, k = pair_indices(i, idx, is_first_in_pair)
+            colliding_pairs[n_colliding] = i
+            colliding_pairs_idx[2 * n_colliding] = j
+            colliding_pairs_idx[2 * n_colliding + 1] = k
+            n_colliding += 1
+        return n_colliding
+
+    def gather_colliding_pairs(
+        self, *, gamma, idx, is_first_in_pair, colliding_pairs, colliding_pairs_idx
+    ):
+        """stores indices of pairs with non-zero gamma in `colliding_pairs` and
+        a compacted permutation array (with `j` preceding `k` within each pair)
+        in `colliding_pairs_idx`, returns the number of colliding pairs"""
+        return self.__gather_colliding_pairs_body(
+            gamma.data,
+            idx.data,
+            len(idx),
+            is_first_in_pair.indicator.data,
+            colliding_pairs.data,
+            colliding_pairs_idx.data,
+        )
+
+    @staticmethod
+    @numba.njit(**conf.JIT_FLAGS)
+    # pylint: disable=too-many-arguments
+    def __scatter_colliding_pairs_body(
+        colliding_pairs,
+        n_colliding,
+        Ec,
+        Eb,
+        n_fragment,
+        Ec_colliding,
+        Eb_colliding,
+        n_fragment_colliding,
+    ):
+        for c in numba.prange(n_colliding):  # pylint: disable=not-an-iterable
+            i = colliding_pairs[c]
+            Ec[i] = Ec_colliding[c]
+            Eb[i] = Eb_colliding[c]
+            n_fragment[i] = n_fragment_colliding[c]
+
+    def scatter_colliding_pairs(
+        self,
+        *,
+        colliding_pairs,
+        n_colliding,
+        Ec,
+        Eb,
+        n_fragment,
+        Ec_colliding,
+        Eb_colliding,
+        n_fragment_colliding,
+    ):
+        self.__scatter_colliding_pairs_body(
+            colliding_pairs.data,
+            n_colliding,
+            Ec.data,
+            Eb.data,
+            n_fragment.data,
+            Ec_colliding.data,
+            Eb_colliding.data,
+            n_fragment_colliding.data,
+        )
+
     @staticmethod
     @numba.njit(**{**conf.JIT_FLAGS})
     # pylint: disable=too-many-arguments
@@ -529,17 +605,18 @@ class CollisionsMethods(BackendMethods):
 
     @staticmethod
     @numba.njit(**{**conf.JIT_FLAGS})
-    def __exp_fragmentation_body(*, scale, frag_size, rand):
+    def __exp_fragmentation_body(*, n_fragment, scale, frag_size, rand):
         """
         Exponential PDF
         """
-        for i in numba.prange(len(frag_size)):  # pylint: disable=not-an-iterable
+        for i in numba.prange(len(n_fragment)):  # pylint: disable=not-an-iterable
             frag_size[i] = -scale * np.log(1 - rand[i])
 
     def exp_fragmentation(
         self, *, n_fragment, scale, frag_size, v_max, x_plus_y, rand, vmin, nfmax
     ):
         self.__exp_fragmentation_body(
+            n_fragment=n_fragment.data,
             scale=scale,
             frag_size=frag_size.data,
             rand=rand.data,
@@ -654,14 +731,47 @@ class CollisionsMethods(BackendMethods):
         collision_rate_deficit,
         collision_rate,
         is_first_in_pair,
+        stats_pair_counts,
+        stats_gamma_histogram,
+        stats_prob_histogram,
+        stats_prob_bins_edges,
     ):
         """
         return in "gamma" array gamma (see: http://doi.org/10.1002/qj.441, section 5)
         formula:
         gamma = floor(prob) + 1 if rand <  prob - floor(prob)
               = floor(prob)     if rand >= prob - floor(prob)
+        optionally (if stats arrays are not None) accumulates per-cell counts of candidate
+        and colliding pairs as well as histograms of the collision probability
+        and of the resultant (not limited by multiplicity ratio) gamma values
         """
         for i in numba.prange(length // 2):  # pylint: disable=not-an-iterable
+            if (
+                stats_pair_counts is not None
+                or stats_gamma_histogram is not None
+                or stats_prob_histogram is not None
+            ):
+                is_pair = is_first_in_pair[2 * i] or (
+                    2 * i + 1 < length and is_first_in_pair[2 * i + 1]
+                )
+                if is_pair:
+                    j, _ = pair_indices(i, idx, is_first_in_pair)
+                    cid = cell_id[j]
+                    if stats_pair_counts is not None:
+                        atomic_add(stats_pair_counts, (0, cid), 1)
+                        if gamma[i] > rand[i]:
+                            atomic_add(stats_pair_counts, (1, cid), 1)
+                    if stats_prob_histogram is not None:
+                        b = np.searchsorted(stats_prob_bins_edges, gamma[i], "right")
+                        if 0 < b < stats_prob_bins_edges.shape[0]:
+                            atomic_add(stats_prob_histogram, (b - 1, cid), 1)
+                    if stats_gamma_histogram is not None:
+                        b = min(
+                            int(np.ceil(gamma[i] - rand[i])),
+                            stats_gamma_histogram.shape[0] - 1,
+                        )
+                        atomic_add(stats_gamma_histogram, (b, cid), 1)
+
             gamma[i] = np.ceil(gamma[i] - rand[i])
 
             no_collision = gamma[i] == 0
@@ -688,6 +798,10 @@ class CollisionsMethods(BackendMethods):
         collision_rate_deficit,
         collision_rate,
         is_first_in_pair,
+        stats_pair_counts=None,
+        stats_gamma_histogram=None,
+        stats_prob_histogram=None,
+        stats_prob_bins_edges=None,
     ):
         return self.__compute_gamma_body(
             gamma.data,
@@ -699,6 +813,10 @@ class CollisionsMethods(BackendMethods):
             collision_rate_deficit.data,
             collision_rate.data,
             is_first_in_pair.indicator.data,
+            None if stats_pair_counts is None else stats_pair_counts.data,
+            None if stats_gamma_histogram is None else stats_gamma_histogram.data,
+            None if stats_prob_histogram is None else stats_prob_histogram.data,
+            None if stats_prob_bins_edges is None else stats_prob_bins_edges.data,
         )
 
     @staticmethod
@@ -722,9 +840,26 @@ class CollisionsMethods(BackendMethods):
                         dtype=int,
                     )
 
-            def __call__(self, cell_id, cell_idx, cell_start, idx):
+                self.cell_idx_at_sort = None
+
+            def __call__(self, cell_id, cell_idx, cell_start, idx, movers=None):
+                """`movers` (if given) is a tuple of storages with positions in `idx`
+                of super-droplets which might have changed cell since `idx` was last
+                sorted (and was not otherwise modified) and with their count"""
                 length = len(idx)
-                if self.scheme == "counting_sort":
+                if self.__incremental_sort_applicable(
+                    cell_idx, cell_start, length, movers
+                ):
+                    mover_positions, n_movers = movers
+                    CollisionsMethods._incremental_sort_by_cell_id_and_update_cell_start(
+                        self.tmp_idx.data,
+                        idx.data,
+                        cell_id.data,
+                        cell_idx.data,
+                        cell_start.data,
+                        np.sort(mover_positions.data[: n_movers.data[0]]),
+                    )
+                elif self.scheme == "counting_sort":
                     CollisionsMethods._counting_sort_by_cell_id_and_update_cell_start(
                         self.tmp_idx.data,
                         idx.data,
@@ -744,6 +879,20 @@ class CollisionsMethods(BackendMethods):
                         self.cell_starts.data,
                     )
                 idx.data, self.tmp_idx.data = self.tmp_idx.data, idx.data
+                self.cell_idx_at_sort = cell_idx.data.copy()
+
+            def __incremental_sort_applicable(
+                self, cell_idx, cell_start, length, movers
+            ):
+                return (
+                    movers is not None
+                    and self.scheme in ("counting_sort", "counting_sort_parallel")
+                    and movers[1].data[0]
+                    <= CollisionsMethods.INCREMENTAL_SORT_MAX_MOVERS_FRACTION * length
+                    and cell_start.data[-1] == length
+                    and self.cell_idx_at_sort is not None
+                    and np.array_equal(cell_idx.data, self.cell_idx_at_sort)
+                )
 
         return CellCaretaker(idx, cell_start, scheme)
 
@@ -792,6 +941,62 @@ class CollisionsMethods(BackendMethods):
                 i += 1
         return new_length
 
+    @staticmethod
+    @numba.njit(**{**conf.JIT_FLAGS, **{"parallel": False}})
+    # pylint: disable=too-many-arguments,too-many-locals
+    def _incremental_sort_by_cell_id_and_update_cell_start(
+        new_idx, idx, cell_id, cell_idx, cell_start, mover_positions
+    ):
+        """same result as (stable) counting sort provided `idx` was sorted by cell
+        (as given by `cell_start`) and only super-droplets at (sorted)
+        `mover_positions` might have changed cell since; stayers are block-copied
+        and the movers are merged into their new cells"""
+        n_cell = len(cell_start) - 1
+        n_movers = len(mover_positions)
+        old_cell = np.empty(n_movers, dtype=np.int64)
+        new_cell = np.empty(n_movers, dtype=np.int64)
+        in_start = np.zeros(n_cell + 1, dtype=np.int64)
+        for k in range(n_movers):
+            old_cell[k] = np.searchsorted(cell_start, mover_positions[k], "right") - 1
+            new_cell[k] = cell_idx[cell_id[idx[mover_positions[k]]]]
+            if new_cell[k] != old_cell[k]:
+                in_start[new_cell[k] + 1] += 1
+        for i in range(1, n_cell + 1):
+            in_start[i] += in_start[i - 1]
+
+        in_movers = np.empty(in_start[-1], dtype=np.int64)
+        in_end = in_start[:-1].copy()
+        for k in range(n_movers):
+            if new_cell[k] != old_cell[k]:
+                in_movers[in_end[new_cell[k]]] = mover_positions[k]
+                in_end[new_cell[k]] += 1
+
+        k = 0
+        write = 0
+        for cell in range(n_cell):
+            start, end = cell_start[cell], cell_start[cell + 1]
+            cell_start[cell] = write
+            mover = in_start[cell]
+            while mover < in_start[cell + 1] and in_movers[mover] < start:
+                new_idx[write] = idx[in_movers[mover]]
+                write += 1
+                mover += 1
+            read = start
+            while k < n_movers and mover_positions[k] < end:
+                if new_cell[k] != old_cell[k]:
+                    n_stayers = mover_positions[k] - read
+                    new_idx[write : write + n_stayers] = idx[read : mover_positions[k]]
+                    write += n_stayers
+                    read = mover_positions[k] + 1
+                k += 1
+            new_idx[write : write + end - read] = idx[read:end]
+            write += end - read
+            while mover < in_start[cell + 1]:
+                new_idx[write] = idx[in_movers[mover]]
+                write += 1
+                mover += 1
+        cell_start[n_cell] = write
+
     @staticmethod
     @numba.njit(**conf.JIT_FLAGS)
     # pylint: disable=too-many-arguments
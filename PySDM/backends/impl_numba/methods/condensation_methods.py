@@ -2,18 +2,50 @@
 CPU implementation of backend methods for water condensation/evaporation
 """
 import math
-from functools import lru_cache
 
 import numba
 import numpy as np
 
 from PySDM.backends.impl_common.backend_methods import BackendMethods
+from PySDM.backends.impl_common.formulae_cache import cached_per_formulae
 from PySDM.backends.impl_numba import conf
+from PySDM.backends.impl_numba.atomic_operations import atomic_add
 from PySDM.backends.impl_numba.toms748 import toms748_solve
 from PySDM.backends.impl_numba.warnings import warn
 
+# slots of the per-cell solver statistics array filled by the solver
+(
+    STATS_N_ROOT_FINDING_ITERATIONS,
+    STATS_N_BRACKET_EXPANSIONS,
+    STATS_N_NEAR_EQUILIBRIUM,
+    STATS_N_FAILED,
+    STATS_N_PROBES,
+) = range(5)
+N_STATS = 5
+
 
 class CondensationMethods(BackendMethods):
+    # minimal number of super-droplets in a cell for the solver to distribute
+    # per-droplet computations across threads (only in single-cell environments)
+    DROPLET_PARALLEL_MIN_N_SD = 256
+
+    # relative (to the guessed increment) half-width of the bracket tried first
+    # when warm-starting per-droplet root finding (if the root is not within,
+    # bracketing starts from scratch)
+    WARM_START_BRACKET_RTOL = 0.01
+
+    # in the quasi-equilibrium mode, haze droplets smaller than this fraction of
+    # their critical volume and with Koehler relaxation time shorter than this
+    # fraction of the substep are set directly to their equilibrium size
+    QUASI_EQUILIBRIUM_MAX_V_OVER_V_CR = 0.5
+    QUASI_EQUILIBRIUM_MAX_TAU_OVER_DT = 0.1
+
+    @staticmethod
+    def droplet_parallel(n_cell):
+        """in single-cell environments (e.g., `Parcel`, `Box`) parallelisation over
+        cells is futile, hence the solver parallelises over droplets instead"""
+        return n_cell == 1 and conf.JIT_FLAGS["parallel"]
+
     # pylint: disable=unused-argument
     @staticmethod
     def condensation(
@@ -43,9 +75,17 @@ class CondensationMethods(BackendMethods):
         RH_max,
         success,
         cell_id,
+        n_iterations,
+        dx_guess,
+        ml,
     ):
         n_threads = min(numba.get_num_threads(), n_cell)
-        CondensationMethods._condensation(
+        func = CondensationMethods._condensation
+        if CondensationMethods.droplet_parallel(n_cell):
+            # avoiding nested parallel regions: looping over (one) cell in Python
+            if not numba.config.DISABLE_JIT:  # pylint: disable=no-member
+                func = func.py_func
+        func(
             solver=solver,
             n_threads=n_threads,
             n_cell=n_cell,
@@ -58,7 +98,7 @@ class CondensationMethods(BackendMethods):
             rhod=rhod.data,
             thd=thd.data,
             qv=qv.data,
-            dv_mean=dv,
+            dv_mean=np.atleast_1d(dv),
             prhod=prhod.data,
             pthd=pthd.data,
             pqv=pqv.data,
@@ -71,9 +111,19 @@ class CondensationMethods(BackendMethods):
             counter_n_activating=counters["n_activating"].data,
             counter_n_deactivating=counters["n_deactivating"].data,
             counter_n_ripening=counters["n_ripening"].data,
+            counter_n_root_finding_iterations=counters[
+                "n_root_finding_iterations"
+            ].data,
+            counter_n_bracket_expansions=counters["n_bracket_expansions"].data,
+            counter_n_near_equilibrium=counters["n_near_equilibrium"].data,
+            counter_n_failed=counters["n_failed"].data,
+            counter_n_probes=counters["n_probes"].data,
             cell_order=cell_order,
             RH_max=RH_max.data,
             success=success.data,
+            n_iterations=n_iterations.data,
+            dx_guess=dx_guess.data,
+            ml=ml.data,
         )
 
     @staticmethod
@@ -105,61 +155,96 @@ class CondensationMethods(BackendMethods):
         counter_n_activating,
         counter_n_deactivating,
         counter_n_ripening,
+        counter_n_root_finding_iterations,
+        counter_n_bracket_expansions,
+        counter_n_near_equilibrium,
+        counter_n_failed,
+        counter_n_probes,
         cell_order,
         RH_max,
         success,
+        n_iterations,
+        dx_guess,
+        ml,
     ):
-        for thread_id in numba.prange(n_threads):  # pylint: disable=not-an-iterable
-            for i in range(thread_id, n_cell, n_threads):
-                cell_id = cell_order[i]
-
-                cell_start = cell_start_arg[cell_id]
-                cell_end = cell_start_arg[cell_id + 1]
-                n_sd_in_cell = cell_end - cell_start
-                if n_sd_in_cell == 0:
-                    continue
+        queue = np.zeros(1, dtype=np.int64)
+        for _ in numba.prange(n_threads):  # pylint: disable=not-an-iterable
+            while True:
+                # guided self-scheduling: chunk sizes shrink as the queue empties
+                chunk = max(1, (n_cell - queue[0]) // (2 * n_threads))
+                first = atomic_add(queue, 0, chunk)
+                if first >= n_cell:
+                    break
+                for i in range(first, min(first + chunk, n_cell)):
+                    cell_id = cell_order[i]
 
-                dthd_dt = (pthd[cell_id] - thd[cell_id]) / timestep
-                dqv_dt = (pqv[cell_id] - qv[cell_id]) / timestep
-                rhod_mean = (prhod[cell_id] + rhod[cell_id]) / 2
-                md = rhod_mean * dv_mean
+                    cell_start = cell_start_arg[cell_id]
+                    cell_end = cell_start_arg[cell_id + 1]
+                    n_sd_in_cell = cell_end - cell_start
+                    if n_sd_in_cell == 0:
+                        continue
 
-                (
-                    success_in_cell,
-                    qv_new,
-                    thd_new,
-                    substeps_hint,
-                    n_activating,
-                    n_deactivating,
-                    n_ripening,
-                    RH_max_in_cell,
-                ) = solver(
-                    v,
-                    v_cr,
-                    n,
-                    vdry,
-                    idx[cell_start:cell_end],
-                    kappa,
-                    f_org,
-                    thd[cell_id],
-                    qv[cell_id],
-                    dthd_dt,
-                    dqv_dt,
-                    md,
-                    rhod_mean,
-                    rtol_x,
-                    rtol_thd,
-                    timestep,
-                    counter_n_substeps[cell_id],
-                )
-                counter_n_substeps[cell_id] = substeps_hint
-                counter_n_activating[cell_id] = n_activating
-                counter_n_deactivating[cell_id] = n_deactivating
-                counter_n_ripening[cell_id] = n_ripening
-                RH_max[cell_id] = RH_max_in_cell
-                success[cell_id] = success_in_cell
-                pqv[cell_id] = qv_new
-                pthd[cell_id] = thd_new
+                    dthd_dt = (pthd[cell_id] - thd[cell_id]) / timestep
+                    dqv_dt = (pqv[cell_id] - qv[cell_id]) / timestep
+                    rhod_mean = (prhod[cell_id] + rhod[cell_id]) / 2
+                    md = rhod_mean * (
+                        dv_mean[0] if len(dv_mean) == 1 else dv_mean[cell_id]
+                    )
+                    stats = np.zeros(N_STATS, dtype=np.int64)
+
+                    (
+                        success_in_cell,
+                        qv_new,
+                        thd_new,
+                        substeps_hint,
+                        n_activating,
+                        n_deactivating,
+                        n_ripening,
+                        RH_max_in_cell,
+                        ml_new,
+                    ) = solver(
+                        v,
+                        v_cr,
+                        n,
+                        vdry,
+                        idx[cell_start:cell_end],
+                        kappa,
+                        f_org,
+                        n_iterations,
+                        dx_guess,
+                        stats,
+                        thd[cell_id],
+                        qv[cell_id],
+                        dthd_dt,
+                        dqv_dt,
+                        md,
+                        rhod_mean,
+                        ml[cell_id],
+                        rtol_x,
+                        rtol_thd,
+                        timestep,
+                        counter_n_substeps[cell_id],
+                    )
+                    counter_n_substeps[cell_id] = substeps_hint
+                    counter_n_activating[cell_id] = n_activating
+                    counter_n_deactivating[cell_id] = n_deactivating
+                    counter_n_ripening[cell_id] = n_ripening
+                    counter_n_root_finding_iterations[cell_id] = stats[
+                        STATS_N_ROOT_FINDING_ITERATIONS
+                    ]
+                    counter_n_bracket_expansions[cell_id] = stats[
+                        STATS_N_BRACKET_EXPANSIONS
+                    ]
+                    counter_n_near_equilibrium[cell_id] = stats[
+                        STATS_N_NEAR_EQUILIBRIUM
+                    ]
+                    counter_n_failed[cell_id] = stats[STATS_N_FAILED]
+                    counter_n_probes[cell_id] = stats[STATS_N_PROBES]
+                    RH_max[cell_id] = RH_max_in_cell
+                    success[cell_id] = success_in_cell
+                    pqv[cell_id] = qv_new
+                    pthd[cell_id] = thd_new
+                    ml[cell_id] = ml_new
 
     @staticmethod
     def make_adapt_substeps(
@@ -175,7 +260,12 @@ class CondensationMethods(BackendMethods):
         n_substeps_min = math.ceil(timestep / dt_range[1])
 
         @numba.njit(**jit_flags)
-        def adapt_substeps(args, n_substeps, thd, rtol_thd):
+        def adapt_substeps(  # pylint: disable=too-many-arguments
+            args, n_substeps, thd, rtol_thd, v_probe_long, v_probe_short
+        ):
+            """returns the number of substeps, the success flag, a flag telling if
+            the probe with the returned substep count can be reused, and the buffer
+            with droplet volumes obtained in the first substep of that probe"""
             n_substeps = np.maximum(n_substeps_min, n_substeps // multiplier)
             success = False
             for burnout in range(fuse + 1):
@@ -187,20 +277,30 @@ class CondensationMethods(BackendMethods):
                             "thd",
                             thd,
                         ),
-                        return_value=(0, False),
+                        return_value=(0, False, False, v_probe_long),
                     )
-                thd_new_long, success = step_fake(args, timestep, n_substeps)
+                thd_new_long, success = step_fake(
+                    args, timestep, n_substeps, v_probe_long
+                )
                 if success:
                     break
                 n_substeps *= multiplier
             for burnout in range(fuse + 1):
                 if burnout == fuse:
-                    return warn("burnout (short)", __file__, return_value=(0, False))
+                    return warn(
+                        "burnout (short)",
+                        __file__,
+                        return_value=(0, False, False, v_probe_long),
+                    )
                 thd_new_short, success = step_fake(
-                    args, timestep, n_substeps * multiplier
+                    args, timestep, n_substeps * multiplier, v_probe_short
                 )
                 if not success:
-                    return warn("short failed", __file__, return_value=(0, False))
+                    return warn(
+                        "short failed",
+                        __file__,
+                        return_value=(0, False, False, v_probe_long),
+                    )
                 dthd_long = thd_new_long - thd
                 dthd_short = thd_new_short - thd
                 error_estimate = np.abs(dthd_long - multiplier * dthd_short)
@@ -208,18 +308,26 @@ class CondensationMethods(BackendMethods):
                 if within_tolerance(error_estimate, thd, rtol_thd):
                     break
                 n_substeps *= multiplier
+                v_probe_long, v_probe_short = v_probe_short, v_probe_long
                 if n_substeps > n_substeps_max:
                     break
-            return np.minimum(n_substeps_max, n_substeps), success
+            return (
+                np.minimum(n_substeps_max, n_substeps),
+                success,
+                n_substeps <= n_substeps_max,
+                v_probe_long,
+            )
 
         return adapt_substeps
 
     @staticmethod
     def make_step_fake(jit_flags, step_impl):
         @numba.njit(**jit_flags)
-        def step_fake(args, dt, n_substeps):
+        def step_fake(args, dt, n_substeps, v_probe):
             dt /= n_substeps
-            _, thd_new, _, _, _, _, success = step_impl(*args, dt, 1, True)
+            _, thd_new, _, _, _, _, _, success = step_impl(
+                *args, dt, 1, True, v_probe, False
+            )
             return thd_new, success
 
         return step_fake
@@ -227,8 +335,8 @@ class CondensationMethods(BackendMethods):
     @staticmethod
     def make_step(jit_flags, step_impl):
         @numba.njit(**jit_flags)
-        def step(args, dt, n_substeps):
-            return step_impl(*args, dt, n_substeps, False)
+        def step(args, dt, n_substeps, v_probe, reuse_probe):
+            return step_impl(*args, dt, n_substeps, False, v_probe, reuse_probe)
 
         return step
 
@@ -238,7 +346,6 @@ class CondensationMethods(BackendMethods):
         jit_flags,
         phys_pvs_C,
         phys_lv,
-        calculate_ml_old,
         calculate_ml_new,
         phys_T,
         phys_p,
@@ -257,23 +364,30 @@ class CondensationMethods(BackendMethods):
             cell_idx,
             kappa,
             f_org,
+            n_iterations,
+            dx_guess,
+            stats,
             thd,
             qv,
             dthd_dt_pred,
             dqv_dt_pred,
             m_d,
             rhod_mean,
+            ml_old,
             rtol_x,
             timestep,
             n_substeps,
             fake,
+            v_probe,
+            reuse_probe,
         ):
             timestep /= n_substeps
-            ml_old = calculate_ml_old(v, n, cell_idx)
+            if fake:
+                stats[STATS_N_PROBES] += 1
             count_activating, count_deactivating, count_ripening = 0, 0, 0
             RH_max = 0
             success = True
-            for _ in range(n_substeps):
+            for substep in range(n_substeps):
                 # note: no example yet showing that the trapezoidal scheme brings any improvement
                 thd += timestep * dthd_dt_pred / 2
                 qv += timestep * dqv_dt_pred / 2
@@ -295,6 +409,8 @@ class CondensationMethods(BackendMethods):
                 ) = calculate_ml_new(
                     timestep,
                     fake,
+                    v_probe,
+                    reuse_probe and substep == 0,
                     T,
                     p,
                     RH,
@@ -305,6 +421,9 @@ class CondensationMethods(BackendMethods):
                     cell_idx,
                     kappa,
                     f_org,
+                    n_iterations,
+                    dx_guess,
+                    stats,
                     lv,
                     pvs,
                     DTp,
@@ -332,6 +451,7 @@ class CondensationMethods(BackendMethods):
                 count_deactivating,
                 count_ripening,
                 RH_max,
+                ml_old,
                 success,
             )
 
@@ -368,6 +488,13 @@ class CondensationMethods(BackendMethods):
         max_iters,
         RH_rtol,
         const,
+        droplet_parallel,
+        droplet_parallel_min_n_sd,
+        warm_start,
+        warm_start_bracket_rtol,
+        quasi_equilibrium,
+        quasi_equilibrium_max_v_over_v_cr,
+        quasi_equilibrium_max_tau_over_dt,
     ):
         @numba.njit(**jit_flags)
         def minfun(  # pylint: disable=too-many-arguments
@@ -385,7 +512,79 @@ class CondensationMethods(BackendMethods):
             return x_old - x_new + timestep * dx_dt(x_new, r_dr_dt)
 
         @numba.njit(**jit_flags)
-        def calculate_ml_new(  # pylint: disable=too-many-arguments
+        def minfun_equilibrium(x_new, kappa, f_org, rd3, temperature, RH):
+            volume = volume_of_x(x_new)
+            return (
+                phys_RH_eq(
+                    radius(volume),
+                    temperature,
+                    kappa,
+                    rd3,
+                    phys_sigma(temperature, volume, const.PI_4_3 * rd3, f_org),
+                )
+                - RH
+            )
+
+        @numba.njit(**jit_flags)
+        def solve_equilibrium(  # pylint: disable=too-many-arguments,too-many-locals
+            drop,
+            timestep,
+            T,
+            RH,
+            RH_eq,
+            r_dr_dt_old,
+            v,
+            v_cr,
+            vdry,
+            kappa,
+            f_org,
+            lv,
+            pvs,
+            Dr,
+            Kr,
+            rtol_x,
+        ):
+            """returns success flag, Koehler-equilibrium value of the condensation
+            coordinate and the number of Newton iterations for haze droplets which
+            relax to equilibrium within a fraction of the timestep; iterations
+            start from the current size which is the equilibrium one from the
+            previous substep unless ambient conditions changed abruptly"""
+            if not v[drop] < quasi_equilibrium_max_v_over_v_cr * v_cr[drop]:
+                return False, 0.0, 0
+            rd3 = vdry[drop] / const.PI_4_3
+            args = (kappa[drop], f_org[drop], rd3, T, RH)
+
+            x_eq = x(v[drop])
+            f_eq = RH_eq - RH
+            x_eps = x(v[drop] * (1 + 1e-6))
+            f_eps = minfun_equilibrium(x_eps, *args)
+            tau = -(x_eps - x_eq) / (
+                dx_dt(x_eps, phys_r_dr_dt(f_eps + RH, T, RH, lv, pvs, Dr, Kr))
+                - dx_dt(x_eq, r_dr_dt_old)
+            )
+            if not 0 < tau < quasi_equilibrium_max_tau_over_dt * timestep:
+                return False, 0.0, 0
+
+            x_min, x_max = x(vdry[drop]), x(v_cr[drop])
+            for n_iters in range(1, max_iters + 1):
+                df_dx = (f_eps - f_eq) / (x_eps - x_eq)
+                if not df_dx > 0:
+                    break
+                x_next = x_eq - f_eq / df_dx
+                if not x_min < x_next < x_max:
+                    break
+                converged = within_tolerance(np.abs(x_next - x_eq), x_next, rtol_x)
+                x_eq = x_next
+                if converged:
+                    return True, x_eq, n_iters
+                f_eq = minfun_equilibrium(x_eq, *args)
+                x_eps = x(volume_of_x(x_eq) * (1 + 1e-6))
+                f_eps = minfun_equilibrium(x_eps, *args)
+            return False, 0.0, n_iters
+
+        @numba.njit(**jit_flags)
+        def solve_drop(  # pylint: disable=too-many-arguments,too-many-locals
+            drop,
             timestep,
             fake,
             T,
@@ -393,56 +592,84 @@ class CondensationMethods(BackendMethods):
             RH,
             v,
             v_cr,
-            n,
             vdry,
-            cell_idx,
             kappa,
             f_org,
+            dx_guess,
             lv,
             pvs,
             DTp,
             KTp,
+            lambdaK,
+            lambdaD,
             rtol_x,
-        ):  # pylint: disable=too-many-branches
-            result = 0
-            n_activating = 0
-            n_deactivating = 0
-            n_activated_and_growing = 0
-            success = True
-            lambdaK = phys_lambdaK(T, p)
-            lambdaD = phys_lambdaD(DTp, T)
-            for drop in cell_idx:
-                if v[drop] < 0:
-                    continue
-                x_old = x(v[drop])
-                r_old = radius(v[drop])
-                x_insane = x(vdry[drop] / 100)
-                rd3 = vdry[drop] / const.PI_4_3
-                sgm = phys_sigma(T, v[drop], vdry[drop], f_org[drop])
-                RH_eq = phys_RH_eq(r_old, T, kappa[drop], rd3, sgm)
-                if not within_tolerance(np.abs(RH - RH_eq), RH, RH_rtol):
-                    Dr = phys_dk_D(DTp, r_old, lambdaD)
-                    Kr = phys_dk_K(KTp, r_old, lambdaK)
-                    args = (
-                        x_old,
+        ):
+            """returns new volume, success flag, the number of root-finding
+            iterations, the number of bracket expansions and a flag telling if
+            the droplet was skipped as being in equilibrium with ambient air"""
+            in_equilibrium, x_eq, n_iters = False, 0.0, 0
+            n_expansions = 0
+            x_old = x(v[drop])
+            r_old = radius(v[drop])
+            x_insane = x(vdry[drop] / 100)
+            rd3 = vdry[drop] / const.PI_4_3
+            sgm = phys_sigma(T, v[drop], vdry[drop], f_org[drop])
+            RH_eq = phys_RH_eq(r_old, T, kappa[drop], rd3, sgm)
+            if not within_tolerance(np.abs(RH - RH_eq), RH, RH_rtol):
+                Dr = phys_dk_D(DTp, r_old, lambdaD)
+                Kr = phys_dk_K(KTp, r_old, lambdaK)
+                args = (
+                    x_old,
+                    timestep,
+                    kappa[drop],
+                    f_org[drop],
+                    rd3,
+                    T,
+                    RH,
+                    lv,
+                    pvs,
+                    Dr,
+                    Kr,
+                )
+                r_dr_dt_old = phys_r_dr_dt(RH_eq, T, RH, lv, pvs, Dr, Kr)
+                dx_old = timestep * dx_dt(x_old, r_dr_dt_old)
+                if quasi_equilibrium and dx_old != 0:
+                    in_equilibrium, x_eq, n_iters = solve_equilibrium(
+                        drop,
                         timestep,
-                        kappa[drop],
-                        f_org[drop],
-                        rd3,
                         T,
                         RH,
+                        RH_eq,
+                        r_dr_dt_old,
+                        v,
+                        v_cr,
+                        vdry,
+                        kappa,
+                        f_org,
                         lv,
                         pvs,
                         Dr,
                         Kr,
+                        rtol_x,
                     )
-                    r_dr_dt_old = phys_r_dr_dt(RH_eq, T, RH, lv, pvs, Dr, Kr)
-                    dx_old = timestep * dx_dt(x_old, r_dr_dt_old)
-                else:
-                    dx_old = 0.0
-                if dx_old == 0:
-                    x_new = x_old
-                else:
+            else:
+                dx_old = 0.0
+            if in_equilibrium:
+                x_new = x_eq
+            elif dx_old == 0:
+                x_new = x_old
+            else:
+                bracketed = False
+                if warm_start and dx_guess[drop] * dx_old > 0:
+                    half_width = warm_start_bracket_rtol * np.abs(dx_guess[drop])
+                    a = max(x_insane, x_old + dx_guess[drop] - half_width)
+                    b = max(x_insane, x_old + dx_guess[drop] + half_width)
+                    fa = minfun(a, *args)
+                    fb = minfun(b, *args)
+                    bracketed = fa * fb < 0
+                    if not bracketed:
+                        n_expansions += 1
+                if not bracketed:
                     a = x_old
                     b = max(x_insane, a + dx_old)
                     fa = minfun(a, *args)
@@ -473,40 +700,246 @@ class CondensationMethods(BackendMethods):
                                         fb,
                                     ),
                                 )
-                            success = False
-                            break
+                            return x_old, False, n_iters, n_expansions + counter, False
                         b = max(x_insane, a + math.ldexp(dx_old, counter))
                         fb = minfun(b, *args)
+                    n_expansions += counter
+
+                if a != b:
+                    if a > b:
+                        a, b = b, a
+                        fa, fb = fb, fa
+
+                    x_new, iters_taken = toms748_solve(
+                        minfun,
+                        args,
+                        a,
+                        b,
+                        fa,
+                        fb,
+                        rtol_x,
+                        max_iters,
+                        within_tolerance,
+                    )
+                    n_iters += max(iters_taken, 0)
+                    if iters_taken in (-1, max_iters):
+                        if not fake:
+                            warn("TOMS failed", __file__)
+                        return x_old, False, n_iters, n_expansions, False
+                else:
+                    x_new = x_old
+            if warm_start and not fake:
+                dx_guess[drop] = x_new - x_old
+            return volume_of_x(x_new), True, n_iters, n_expansions, dx_old == 0
 
-                    if not success:
+        @numba.njit(**jit_flags)
+        def calculate_ml_new(  # pylint: disable=too-many-arguments
+            timestep,
+            fake,
+            v_probe,
+            reuse_probe,
+            T,
+            p,
+            RH,
+            v,
+            v_cr,
+            n,
+            vdry,
+            cell_idx,
+            kappa,
+            f_org,
+            n_iterations,
+            dx_guess,
+            stats,
+            lv,
+            pvs,
+            DTp,
+            KTp,
+            rtol_x,
+        ):
+            result = 0
+            n_activating = 0
+            n_deactivating = 0
+            n_activated_and_growing = 0
+            n_failed = 0
+            v_new_buffer = v_probe if fake else np.empty(len(cell_idx))
+            lambdaK = phys_lambdaK(T, p)
+            lambdaD = phys_lambdaD(DTp, T)
+            for i, drop in enumerate(cell_idx):
+                if v[drop] < 0:
+                    continue
+                if reuse_probe:
+                    v_new = v_probe[i]
+                    if warm_start:
+                        dx_guess[drop] = x(v_new) - x(v[drop])
+                else:
+                    (
+                        v_new,
+                        success_drop,
+                        n_iters,
+                        n_expansions,
+                        near_equilibrium,
+                    ) = solve_drop(
+                        drop,
+                        timestep,
+                        fake,
+                        T,
+                        p,
+                        RH,
+                        v,
+                        v_cr,
+                        vdry,
+                        kappa,
+                        f_org,
+                        dx_guess,
+                        lv,
+                        pvs,
+                        DTp,
+                        KTp,
+                        lambdaK,
+                        lambdaD,
+                        rtol_x,
+                    )
+                    n_iterations[drop] += n_iters
+                    stats[STATS_N_ROOT_FINDING_ITERATIONS] += n_iters
+                    stats[STATS_N_BRACKET_EXPANSIONS] += n_expansions
+                    stats[STATS_N_NEAR_EQUILIBRIUM] += near_equilibrium
+                    if not success_drop:
+                        stats[STATS_N_FAILED] += 1
+                        n_failed += 1
                         break
-                    if a != b:
-                        if a > b:
-                            a, b = b, a
-                            fa, fb = fb, fa
-
-                        x_new, iters_taken = toms748_solve(
-                            minfun,
-                            args,
-                            a,
-                            b,
-                            fa,
-                            fb,
-                            rtol_x,
-                            max_iters,
-                            within_tolerance,
-                        )
-                        if iters_taken in (-1, max_iters):
-                            if not fake:
-                                warn("TOMS failed", __file__)
-                            success = False
-                            break
-                    else:
-                        x_new = x_old
+                v_new_buffer[i] = v_new
+                result += n[drop] * v_new * const.rho_w
+            if not fake and n_failed == 0:
+                for i, drop in enumerate(cell_idx):
+                    if v[drop] < 0:
+                        continue
+                    v_new = v_new_buffer[i]
+                    if v_new > v_cr[drop] and v_new > v[drop]:
+                        n_activated_and_growing += n[drop]
+                    if v_new > v_cr[drop] > v[drop]:
+                        n_activating += n[drop]
+                    if v_new < v_cr[drop] < v[drop]:
+                        n_deactivating += n[drop]
+                    v[drop] = v_new
+            n_ripening = n_activated_and_growing if n_deactivating > 0 else 0
+            return result, n_failed == 0, n_activating, n_deactivating, n_ripening
 
-                v_new = volume_of_x(x_new)
+        if not droplet_parallel:
+            return calculate_ml_new
+
+        @numba.njit(**{**jit_flags, "parallel": True})
+        def calculate_ml_new_droplet_parallel(  # pylint: disable=too-many-arguments
+            timestep,
+            fake,
+            v_probe,
+            reuse_probe,
+            T,
+            p,
+            RH,
+            v,
+            v_cr,
+            n,
+            vdry,
+            cell_idx,
+            kappa,
+            f_org,
+            n_iterations,
+            dx_guess,
+            stats,
+            lv,
+            pvs,
+            DTp,
+            KTp,
+            rtol_x,
+        ):
+            if len(cell_idx) < droplet_parallel_min_n_sd:
+                return calculate_ml_new(
+                    timestep,
+                    fake,
+                    v_probe,
+                    reuse_probe,
+                    T,
+                    p,
+                    RH,
+                    v,
+                    v_cr,
+                    n,
+                    vdry,
+                    cell_idx,
+                    kappa,
+                    f_org,
+                    n_iterations,
+                    dx_guess,
+                    stats,
+                    lv,
+                    pvs,
+                    DTp,
+                    KTp,
+                    rtol_x,
+                )
+            result = 0.0
+            n_activating = 0
+            n_deactivating = 0
+            n_activated_and_growing = 0
+            n_failed = 0
+            n_root_finding_iterations = 0
+            n_bracket_expansions = 0
+            n_near_equilibrium = 0
+            v_new_buffer = v_probe if fake else np.empty(len(cell_idx))
+            lambdaK = phys_lambdaK(T, p)
+            lambdaD = phys_lambdaD(DTp, T)
+            for i in numba.prange(len(cell_idx)):  # pylint: disable=not-an-iterable
+                drop = cell_idx[i]
+                if v[drop] < 0:
+                    continue
+                if reuse_probe:
+                    v_new = v_probe[i]
+                    if warm_start:
+                        dx_guess[drop] = x(v_new) - x(v[drop])
+                else:
+                    (
+                        v_new,
+                        success_drop,
+                        n_iters,
+                        n_expansions,
+                        near_equilibrium,
+                    ) = solve_drop(
+                        drop,
+                        timestep,
+                        fake,
+                        T,
+                        p,
+                        RH,
+                        v,
+                        v_cr,
+                        vdry,
+                        kappa,
+                        f_org,
+                        dx_guess,
+                        lv,
+                        pvs,
+                        DTp,
+                        KTp,
+                        lambdaK,
+                        lambdaD,
+                        rtol_x,
+                    )
+                    n_iterations[drop] += n_iters
+                    n_root_finding_iterations += n_iters
+                    n_bracket_expansions += n_expansions
+                    n_near_equilibrium += near_equilibrium
+                    if not success_drop:
+                        n_failed += 1
+                        continue
+                v_new_buffer[i] = v_new
                 result += n[drop] * v_new * const.rho_w
-                if not fake:
+            if not fake and n_failed == 0:
+                for i in numba.prange(len(cell_idx)):  # pylint: disable=not-an-iterable
+                    drop = cell_idx[i]
+                    if v[drop] < 0:
+                        continue
+                    v_new = v_new_buffer[i]
                     if v_new > v_cr[drop] and v_new > v[drop]:
                         n_activated_and_growing += n[drop]
                     if v_new > v_cr[drop] > v[drop]:
@@ -515,9 +948,13 @@ class CondensationMethods(BackendMethods):
                         n_deactivating += n[drop]
                     v[drop] = v_new
             n_ripening = n_activated_and_growing if n_deactivating > 0 else 0
-            return result, success, n_activating, n_deactivating, n_ripening
+            stats[STATS_N_ROOT_FINDING_ITERATIONS] += n_root_finding_iterations
+            stats[STATS_N_BRACKET_EXPANSIONS] += n_bracket_expansions
+            stats[STATS_N_NEAR_EQUILIBRIUM] += n_near_equilibrium
+            stats[STATS_N_FAILED] += n_failed
+            return result, n_failed == 0, n_activating, n_deactivating, n_ripening
 
-        return calculate_ml_new
+        return calculate_ml_new_droplet_parallel
 
     # pylint disable=unused-argument
     def make_condensation_solver(
@@ -531,29 +968,11 @@ class CondensationMethods(BackendMethods):
         multiplier,
         RH_rtol,
         max_iters,
+        warm_start=False,
+        quasi_equilibrium=False,
     ):
         return CondensationMethods.make_condensation_solver_impl(
-            fastmath=self.formulae.fastmath,
-            phys_pvs_C=self.formulae.saturation_vapour_pressure.pvs_Celsius,
-            phys_lv=self.formulae.latent_heat.lv,
-            phys_r_dr_dt=self.formulae.drop_growth.r_dr_dt,
-            phys_RH_eq=self.formulae.hygroscopicity.RH_eq,
-            phys_sigma=self.formulae.surface_tension.sigma,
-            radius=self.formulae.trivia.radius,
-            phys_T=self.formulae.state_variable_triplet.T,
-            phys_p=self.formulae.state_variable_triplet.p,
-            phys_pv=self.formulae.state_variable_triplet.pv,
-            phys_dthd_dt=self.formulae.state_variable_triplet.dthd_dt,
-            phys_lambdaK=self.formulae.diffusion_kinetics.lambdaK,
-            phys_lambdaD=self.formulae.diffusion_kinetics.lambdaD,
-            phys_dk_D=self.formulae.diffusion_kinetics.D,
-            phys_dk_K=self.formulae.diffusion_kinetics.K,
-            phys_diff_D=self.formulae.diffusion_thermics.D,
-            phys_diff_K=self.formulae.diffusion_thermics.K,
-            within_tolerance=self.formulae.trivia.within_tolerance,
-            dx_dt=self.formulae.condensation_coordinate.dx_dt,
-            volume=self.formulae.condensation_coordinate.volume,
-            x=self.formulae.condensation_coordinate.x,
+            self.formulae,
             timestep=timestep,
             dt_range=dt_range,
             adaptive=adaptive,
@@ -561,34 +980,20 @@ class CondensationMethods(BackendMethods):
             multiplier=multiplier,
             RH_rtol=RH_rtol,
             max_iters=max_iters,
-            const=self.formulae.constants,
+            droplet_parallel=self.droplet_parallel(n_cell),
+            droplet_parallel_min_n_sd=self.DROPLET_PARALLEL_MIN_N_SD,
+            warm_start=warm_start,
+            warm_start_bracket_rtol=self.WARM_START_BRACKET_RTOL,
+            quasi_equilibrium=quasi_equilibrium,
+            quasi_equilibrium_max_v_over_v_cr=self.QUASI_EQUILIBRIUM_MAX_V_OVER_V_CR,
+            quasi_equilibrium_max_tau_over_dt=self.QUASI_EQUILIBRIUM_MAX_TAU_OVER_DT,
         )
 
     @staticmethod
-    @lru_cache()
+    @cached_per_formulae
     def make_condensation_solver_impl(
+        formulae,
         *,
-        fastmath,
-        phys_pvs_C,
-        phys_lv,
-        phys_r_dr_dt,
-        phys_RH_eq,
-        phys_sigma,
-        radius,
-        phys_T,
-        phys_p,
-        phys_pv,
-        phys_dthd_dt,
-        phys_lambdaK,
-        phys_lambdaD,
-        phys_dk_D,
-        phys_dk_K,
-        phys_diff_D,
-        phys_diff_K,
-        within_tolerance,
-        dx_dt,
-        volume,
-        x,
         timestep,
         dt_range,
         adaptive,
@@ -596,11 +1001,38 @@ class CondensationMethods(BackendMethods):
         multiplier,
         RH_rtol,
         max_iters,
-        const,
+        droplet_parallel,
+        droplet_parallel_min_n_sd,
+        warm_start,
+        warm_start_bracket_rtol,
+        quasi_equilibrium,
+        quasi_equilibrium_max_v_over_v_cr,
+        quasi_equilibrium_max_tau_over_dt,
     ):
+        phys_pvs_C = formulae.saturation_vapour_pressure.pvs_Celsius
+        phys_lv = formulae.latent_heat.lv
+        phys_r_dr_dt = formulae.drop_growth.r_dr_dt
+        phys_RH_eq = formulae.hygroscopicity.RH_eq
+        phys_sigma = formulae.surface_tension.sigma
+        radius = formulae.trivia.radius
+        phys_T = formulae.state_variable_triplet.T
+        phys_p = formulae.state_variable_triplet.p
+        phys_pv = formulae.state_variable_triplet.pv
+        phys_dthd_dt = formulae.state_variable_triplet.dthd_dt
+        phys_lambdaK = formulae.diffusion_kinetics.lambdaK
+        phys_lambdaD = formulae.diffusion_kinetics.lambdaD
+        phys_dk_D = formulae.diffusion_kinetics.D
+        phys_dk_K = formulae.diffusion_kinetics.K
+        phys_diff_D = formulae.diffusion_thermics.D
+        phys_diff_K = formulae.diffusion_thermics.K
+        within_tolerance = formulae.trivia.within_tolerance
+        dx_dt = formulae.condensation_coordinate.dx_dt
+        volume = formulae.condensation_coordinate.volume
+        x = formulae.condensation_coordinate.x
+        const = formulae.constants
         jit_flags = {
             **conf.JIT_FLAGS,
-            **{"parallel": False, "cache": False, "fastmath": fastmath},
+            **{"parallel": False, "cache": False, "fastmath": formulae.fastmath},
         }
 
         calculate_ml_old = CondensationMethods.make_calculate_ml_old(jit_flags, const)
@@ -621,12 +1053,18 @@ class CondensationMethods(BackendMethods):
             max_iters=max_iters,
             RH_rtol=RH_rtol,
             const=const,
+            droplet_parallel=droplet_parallel,
+            droplet_parallel_min_n_sd=droplet_parallel_min_n_sd,
+            warm_start=warm_start,
+            warm_start_bracket_rtol=warm_start_bracket_rtol,
+            quasi_equilibrium=quasi_equilibrium,
+            quasi_equilibrium_max_v_over_v_cr=quasi_equilibrium_max_v_over_v_cr,
+            quasi_equilibrium_max_tau_over_dt=quasi_equilibrium_max_tau_over_dt,
         )
         step_impl = CondensationMethods.make_step_impl(
             jit_flags=jit_flags,
             phys_pvs_C=phys_pvs_C,
             phys_lv=phys_lv,
-            calculate_ml_old=calculate_ml_old,
             calculate_ml_new=calculate_ml_new,
             phys_T=phys_T,
             phys_p=phys_p,
@@ -657,17 +1095,26 @@ class CondensationMethods(BackendMethods):
             cell_idx,
             kappa,
             f_org,
+            n_iterations,
+            dx_guess,
+            stats,
             thd,
             qv,
             dthd_dt,
             dqv_dt,
             m_d,
             rhod_mean,
+            ml_old,
             rtol_x,
             rtol_thd,
             timestep,
             n_substeps,
         ):
+            """`ml_old` is the liquid water mass in the cell, if negative it is
+            computed from droplet volumes and multiplicities; the updated value is
+            returned along with other outcomes"""
+            if ml_old < 0:
+                ml_old = calculate_ml_old(v, n, cell_idx)
             args = (
                 v,
                 v_cr,
@@ -676,17 +1123,30 @@ class CondensationMethods(BackendMethods):
                 cell_idx,
                 kappa,
                 f_org,
+                n_iterations,
+                dx_guess,
+                stats,
                 thd,
                 qv,
                 dthd_dt,
                 dqv_dt,
                 m_d,
                 rhod_mean,
+                ml_old,
                 rtol_x,
             )
             success = True
+            reuse_probe = False
+            v_probe = np.empty(len(cell_idx) if adaptive else 0)
             if adaptive:
-                n_substeps, success = adapt_substeps(args, n_substeps, thd, rtol_thd)
+                n_substeps, success, reuse_probe, v_probe = adapt_substeps(
+                    args,
+                    n_substeps,
+                    thd,
+                    rtol_thd,
+                    v_probe,
+                    np.empty(len(cell_idx)),
+                )
             if success:
                 (
                     qv,
@@ -695,10 +1155,13 @@ class CondensationMethods(BackendMethods):
                     n_deactivating,
                     n_ripening,
                     RH_max,
+                    ml_old,
                     success,
-                ) = step(args, timestep, n_substeps)
+                ) = step(args, timestep, n_substeps, v_probe, reuse_probe)
             else:
                 n_activating, n_deactivating, n_ripening, RH_max = -1, -1, -1, -1
+            if not success:
+                ml_old = -1.0
             return (
                 success,
                 qv,
@@ -708,6 +1171,7 @@ class CondensationMethods(BackendMethods):
                 n_deactivating,
                 n_ripening,
                 RH_max,
+                ml_old,
             )
 
         return solve
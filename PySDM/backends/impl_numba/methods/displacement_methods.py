@@ -2,6 +2,7 @@
 CPU implementation of backend methods for particle displacement (advection and sedimentation)
 """
 import numba
+import numpy as np
 
 from PySDM.backends.impl_numba import conf
 
@@ -11,20 +12,107 @@ from ...impl_common.backend_methods import BackendMethods
 @numba.njit(**{**conf.JIT_FLAGS, **{"parallel": False}})
 # pylint: disable=too-many-arguments
 def calculate_displacement_body_common(
-    dim, droplet, scheme, _l, _r, displacement, courant, position_in_cell, n_substeps
+    dim,
+    droplet,
+    scheme,
+    _l,
+    _r,
+    displacement,
+    courant,
+    position_in_cell,
+    n_substeps,
+    substep,
 ):
+    n_substeps_of_droplet = n_substeps[droplet if len(n_substeps) > 1 else 0]
+    if substep >= n_substeps_of_droplet:
+        displacement[dim, droplet] = 0
+        return
     omega = position_in_cell[dim, droplet]
     displacement[dim, droplet] = scheme(
-        omega, courant[_l] / n_substeps, courant[_r] / n_substeps
+        omega,
+        courant[_l] / n_substeps_of_droplet,
+        courant[_r] / n_substeps_of_droplet,
     )
 
 
+@numba.njit(**{**conf.JIT_FLAGS, **{"parallel": False}})
+# pylint: disable=too-many-arguments
+def displacement_substep_body_common(
+    droplet,
+    i,
+    displacement,
+    cell_origin,
+    position_in_cell,
+    cell_id,
+    strides,
+    grid,
+    idx,
+    healthy,
+    volume,
+    multiplicity,
+    terminal_velocity,
+    dt_over_dz,
+    enable_sedimentation,
+    precipitation_counting_level_index,
+    domain_top_level_index,
+    cell_changes,
+):
+    """sedimentation, position update, precipitation and out-of-column flagging,
+    cell-origin update, periodic boundary condition and cell id for one droplet
+    (`droplet` being its position in `idx`), returns precipitated volume;
+    droplets changing cell are recorded in `cell_changes` (if not empty)"""
+    n_dims = len(grid)
+    if enable_sedimentation:
+        displacement[-1, i] *= 1 / dt_over_dz
+        displacement[-1, i] -= terminal_velocity[i]
+        displacement[-1, i] *= dt_over_dz
+    for dim in range(n_dims):
+        position_in_cell[dim, i] += displacement[dim, i]
+
+    position_within_column = cell_origin[-1, i] + position_in_cell[-1, i]
+    if (
+        enable_sedimentation
+        and displacement[-1, i] < 0
+        and position_within_column < precipitation_counting_level_index
+    ):
+        idx[droplet] = len(idx)
+        healthy[0] = 0
+        return volume[i] * multiplicity[i]  # TODO #599
+    if position_within_column < 0 or position_within_column > domain_top_level_index:
+        idx[droplet] = len(idx)
+        healthy[0] = 0
+        return 0.0
+
+    old_cell_id = cell_id[i]
+    cell_id[i] = 0
+    for dim in range(n_dims):
+        floor_of_position = int(np.floor(position_in_cell[dim, i]))
+        cell_origin[dim, i] += floor_of_position
+        position_in_cell[dim, i] -= floor_of_position
+        cell_origin[dim, i] %= grid[dim]
+        cell_id[i] += strides[0, dim] * cell_origin[dim, i]
+
+    epoch_markers, epoch, positions, count = cell_changes
+    if len(positions) > 0 and cell_id[i] != old_cell_id and epoch_markers[i] != epoch:
+        epoch_markers[i] = epoch
+        positions[count[0]] = droplet
+        count[0] += 1
+    return 0.0
+
+
 class DisplacementMethods(BackendMethods):
     @staticmethod
     @numba.njit(**{**conf.JIT_FLAGS, **{"parallel": False, "cache": False}})
     # pylint: disable=too-many-arguments
     def calculate_displacement_body_1d(
-        dim, scheme, displacement, courant, cell_origin, position_in_cell, n_substeps
+        dim,
+        scheme,
+        displacement,
+        courant,
+        cell_origin,
+        position_in_cell,
+        n_substeps,
+        substep,
     ):
         length = displacement.shape[1]
         for droplet in numba.prange(length):  # pylint: disable=not-an-iterable
@@ -41,13 +129,21 @@ class DisplacementMethods(BackendMethods):
                 courant,
                 position_in_cell,
                 n_substeps,
+                substep,
             )
 
     @staticmethod
     @numba.njit(**{**conf.JIT_FLAGS, **{"parallel": False, "cache": False}})
     # pylint: disable=too-many-arguments
     def calculate_displacement_body_2d(
-        dim, scheme, displacement, courant, cell_origin, position_in_cell, n_substeps
+        dim,
+        scheme,
+        displacement,
+        courant,
+        cell_origin,
+        position_in_cell,
+        n_substeps,
+        substep,
     ):
         length = displacement.shape[1]
         for droplet in numba.prange(length):  # pylint: disable=not-an-iterable
@@ -67,12 +163,27 @@ class DisplacementMethods(BackendMethods):
                 courant,
                 position_in_cell,
                 n_substeps,
+                substep,
             )
 
     def calculate_displacement(
-        self, *, dim, displacement, courant, cell_origin, position_in_cell, n_substeps
+        self,
+        *,
+        dim,
+        displacement,
+        courant,
+        cell_origin,
+        position_in_cell,
+        n_substeps,
+        substep=0,
     ):
+        """`n_substeps` is either a single number or a per-particle storage,
+        particles for which `substep >= n_substeps` are not displaced"""
         n_dims = len(courant.shape)
+        if hasattr(n_substeps, "data"):
+            n_substeps = n_substeps.data
+        else:
+            n_substeps = np.full(1, n_substeps)
         scheme = self.formulae.particle_advection.displacement
         if n_dims == 1:
             DisplacementMethods.calculate_displacement_body_1d(
@@ -83,6 +194,7 @@ class DisplacementMethods(BackendMethods):
                 cell_origin.data,
                 position_in_cell.data,
                 n_substeps,
+                substep,
             )
         elif n_dims == 2:
             DisplacementMethods.calculate_displacement_body_2d(
@@ -93,10 +205,223 @@ class DisplacementMethods(BackendMethods):
                 cell_origin.data,
                 position_in_cell.data,
                 n_substeps,
+                substep,
             )
         else:
             raise NotImplementedError()
 
+    @staticmethod
+    @numba.njit(**{**conf.JIT_FLAGS, **{"parallel": False, "cache": False}})
+    # pylint: disable=too-many-arguments,too-many-locals
+    def displacement_substep_body_1d(
+        scheme,
+        courant,
+        displacement,
+        cell_origin,
+        position_in_cell,
+        cell_id,
+        strides,
+        grid,
+        idx,
+        length,
+        healthy,
+        volume,
+        multiplicity,
+        terminal_velocity,
+        n_substeps,
+        substep,
+        dt,
+        dz,
+        enable_sedimentation,
+        precipitation_counting_level_index,
+        domain_top_level_index,
+        cell_changes,
+    ):
+        rainfall = 0.0
+        for droplet in range(length):
+            i = idx[droplet]
+            n_substeps_of_droplet = n_substeps[i if len(n_substeps) > 1 else 0]
+            if substep >= n_substeps_of_droplet:
+                continue
+            # Arakawa-C grid
+            _l = cell_origin[0, i]
+            displacement[0, i] = scheme(
+                position_in_cell[0, i],
+                courant[_l] / n_substeps_of_droplet,
+                courant[_l + 1] / n_substeps_of_droplet,
+            )
+            rainfall += displacement_substep_body_common(
+                droplet,
+                i,
+                displacement,
+                cell_origin,
+                position_in_cell,
+                cell_id,
+                strides,
+                grid,
+                idx,
+                healthy,
+                volume,
+                multiplicity,
+                terminal_velocity,
+                dt / n_substeps_of_droplet / dz,
+                enable_sedimentation,
+                precipitation_counting_level_index,
+                domain_top_level_index,
+                cell_changes,
+            )
+        return rainfall
+
+    @staticmethod
+    @numba.njit(**{**conf.JIT_FLAGS, **{"parallel": False, "cache": False}})
+    # pylint: disable=too-many-arguments,too-many-locals
+    def displacement_substep_body_2d(
+        scheme,
+        courant_x,
+        courant_z,
+        displacement,
+        cell_origin,
+        position_in_cell,
+        cell_id,
+        strides,
+        grid,
+        idx,
+        length,
+        healthy,
+        volume,
+        multiplicity,
+        terminal_velocity,
+        n_substeps,
+        substep,
+        dt,
+        dz,
+        enable_sedimentation,
+        precipitation_counting_level_index,
+        domain_top_level_index,
+        cell_changes,
+    ):
+        rainfall = 0.0
+        for droplet in range(length):
+            i = idx[droplet]
+            n_substeps_of_droplet = n_substeps[i if len(n_substeps) > 1 else 0]
+            if substep >= n_substeps_of_droplet:
+                continue
+            # Arakawa-C grid
+            _l_x, _l_z = cell_origin[0, i], cell_origin[1, i]
+            displacement[0, i] = scheme(
+                position_in_cell[0, i],
+                courant_x[_l_x, _l_z] / n_substeps_of_droplet,
+                courant_x[_l_x + 1, _l_z] / n_substeps_of_droplet,
+            )
+            displacement[1, i] = scheme(
+                position_in_cell[1, i],
+                courant_z[_l_x, _l_z] / n_substeps_of_droplet,
+                courant_z[_l_x, _l_z + 1] / n_substeps_of_droplet,
+            )
+            rainfall += displacement_substep_body_common(
+                droplet,
+                i,
+                displacement,
+                cell_origin,
+                position_in_cell,
+                cell_id,
+                strides,
+                grid,
+                idx,
+                healthy,
+                volume,
+                multiplicity,
+                terminal_velocity,
+                dt / n_substeps_of_droplet / dz,
+                enable_sedimentation,
+                precipitation_counting_level_index,
+                domain_top_level_index,
+                cell_changes,
+            )
+        return rainfall
+
+    # pylint: disable=too-many-arguments,too-many-locals
+    def displacement_substep(
+        self,
+        *,
+        courant,
+        displacement,
+        cell_origin,
+        position_in_cell,
+        cell_id,
+        strides,
+        grid,
+        idx,
+        length,
+        healthy,
+        volume,
+        multiplicity,
+        terminal_velocity,
+        n_substeps,
+        substep,
+        dt,
+        dz,
+        enable_sedimentation,
+        precipitation_counting_level_index,
+        domain_top_level_index,
+        cell_changes=None,
+    ) -> float:
+        """whole displacement substep (advection, sedimentation, precipitation
+        and out-of-column flagging, cell-origin and cell-id update) in a single
+        pass over the super-droplets in `idx[:length]`, returns precipitated volume;
+        `cell_changes` are as returned by `ParticleAttributes.track_cell_changes()`
+        """
+        if hasattr(n_substeps, "data"):
+            n_substeps = n_substeps.data
+        else:
+            n_substeps = np.full(1, n_substeps)
+        if terminal_velocity is None:
+            terminal_velocity = np.empty(0)
+        else:
+            terminal_velocity = terminal_velocity.data
+        if cell_changes is None:
+            cell_changes = (
+                np.empty(0, dtype=np.int64),
+                0,
+                np.empty(0, dtype=np.int64),
+                np.zeros(1, dtype=np.int64),
+            )
+        else:
+            epoch_markers, epoch, positions, count = cell_changes
+            cell_changes = (epoch_markers.data, epoch, positions.data, count.data)
+        args = (
+            displacement.data,
+            cell_origin.data,
+            position_in_cell.data,
+            cell_id.data,
+            strides,
+            grid,
+            idx.data,
+            length,
+            healthy.data,
+            volume.data,
+            multiplicity.data,
+            terminal_velocity,
+            n_substeps,
+            substep,
+            dt,
+            dz,
+            enable_sedimentation,
+            precipitation_counting_level_index,
+            domain_top_level_index,
+            cell_changes,
+        )
+        scheme = self.formulae.particle_advection.displacement
+        if len(courant) == 1:
+            return DisplacementMethods.displacement_substep_body_1d(
+                scheme, courant[0].data, *args
+            )
+        if len(courant) == 2:
+            return DisplacementMethods.displacement_substep_body_2d(
+                scheme, courant[0].data, courant[1].data, *args
+            )
+        raise NotImplementedError()
+
     @staticmethod
     @numba.njit(**{**conf.JIT_FLAGS, **{"parallel": False}})
     # pylint: disable=too-many-arguments
@@ -5,6 +5,7 @@ import numba
 import numpy as np
 
 from PySDM.backends.impl_common.backend_methods import BackendMethods
+from PySDM.backends.impl_common.formulae_cache import cached_per_formulae
 
 from ...impl_common.freezing_attributes import (
     SingularAttributes,
@@ -16,23 +17,30 @@ from ...impl_numba import conf
 class FreezingMethods(BackendMethods):
     def __init__(self):
         super().__init__()
-        const = self.formulae.constants
+        kernels = FreezingMethods.make_kernels(self.formulae)
+        self.freeze_singular_body = kernels["freeze_singular_body"]
+        self.freeze_time_dependent_body = kernels["freeze_time_dependent_body"]
+
+    @staticmethod
+    @cached_per_formulae
+    def make_kernels(formulae):
+        const = formulae.constants
 
         @numba.njit(
-            **{**conf.JIT_FLAGS, "fastmath": self.formulae.fastmath, "parallel": False}
+            **{**conf.JIT_FLAGS, "fastmath": formulae.fastmath, "parallel": False}
         )
         def _unfrozen(volume, i):
             return volume[i] > 0
 
         @numba.njit(
-            **{**conf.JIT_FLAGS, "fastmath": self.formulae.fastmath, "parallel": False}
+            **{**conf.JIT_FLAGS, "fastmath": formulae.fastmath, "parallel": False}
         )
         def _freeze(volume, i):
             volume[i] = -1 * volume[i] * const.rho_w / const.rho_i
             # TODO #599: change thd (latent heat)!
             # TODO #599: handle the negative volume in tests, attributes, products, dynamics, ...
 
-        @numba.njit(**{**conf.JIT_FLAGS, "fastmath": self.formulae.fastmath})
+        @numba.njit(**{**conf.JIT_FLAGS, "fastmath": formulae.fastmath})
         def freeze_singular_body(attributes, temperature, relative_humidity, cell):
             n_sd = len(attributes.freezing_temperature)
             for i in numba.prange(n_sd):  # pylint: disable=not-an-iterable
@@ -46,11 +54,9 @@ class FreezingMethods(BackendMethods):
                 ):
                     _freeze(attributes.wet_volume, i)
 
-        self.freeze_singular_body = freeze_singular_body
-
-        j_het = self.formulae.heterogeneous_ice_nucleation_rate.j_het
+        j_het = formulae.heterogeneous_ice_nucleation_rate.j_het
 
-        @numba.njit(**{**conf.JIT_FLAGS, "fastmath": self.formulae.fastmath})
+        @numba.njit(**{**conf.JIT_FLAGS, "fastmath": formulae.fastmath})
         def freeze_time_dependent_body(rand, attributes, timestep, cell, a_w_ice):
             n_sd = len(attributes.wet_volume)
             for i in numba.prange(n_sd):  # pylint: disable=not-an-iterable
@@ -65,7 +71,10 @@ class FreezingMethods(BackendMethods):
                     if rand[i] < prob:
                         _freeze(attributes.wet_volume, i)
 
-        self.freeze_time_dependent_body = freeze_time_dependent_body
+        return {
+            "freeze_singular_body": freeze_singular_body,
+            "freeze_time_dependent_body": freeze_time_dependent_body,
+        }
 
     def freeze_singular(self, *, attributes, temperature, relative_humidity, cell):
         self.freeze_singular_body(
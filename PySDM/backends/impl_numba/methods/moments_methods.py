@@ -2,12 +2,45 @@
 CPU implementation of moment calculation backend methods
 """
 import numba
+import numpy as np
 
 from PySDM.backends.impl_common.backend_methods import BackendMethods
+from PySDM.backends.impl_common.bin_spacing import ARBITRARY, LINEAR, LOGARITHMIC
 from PySDM.backends.impl_numba import conf
 from PySDM.backends.impl_numba.atomic_operations import atomic_add
 
 
+@numba.njit(**{**conf.JIT_FLAGS, **{"parallel": False}})
+def bin_index(x, x_bins, x_bins_spacing):
+    """index k of the bin for which x_bins[k] <= x < x_bins[k+1] (-1 if none):
+    computed directly for uniformly spaced edges, by binary search otherwise,
+    and in both cases corrected by comparisons against the edges"""
+    n_bins = x_bins.shape[0] - 1
+    if not x_bins[0] <= x < x_bins[n_bins]:
+        return -1
+    if x_bins_spacing == LINEAR:
+        k = np.int64((x - x_bins[0]) / (x_bins[n_bins] - x_bins[0]) * n_bins)
+    elif x_bins_spacing == LOGARITHMIC:
+        k = np.int64(
+            np.log(x / x_bins[0]) / np.log(x_bins[n_bins] / x_bins[0]) * n_bins
+        )
+    else:
+        k = 0
+        upper = n_bins
+        while upper - k > 1:
+            middle = (k + upper) // 2
+            if x_bins[middle] <= x:
+                k = middle
+            else:
+                upper = middle
+    k = min(max(k, 0), n_bins - 1)
+    while k > 0 and x < x_bins[k]:
+        k -= 1
+    while k < n_bins - 1 and x >= x_bins[k + 1]:
+        k += 1
+    return k
+
+
 class MomentsMethods(BackendMethods):
     @staticmethod
     @numba.njit(**conf.JIT_FLAGS)
@@ -101,40 +134,42 @@ class MomentsMethods(BackendMethods):
         cell_id,
         idx,
         length,
-        rank,
+        ranks,
         x_bins,
+        x_bins_spacing,
         x_attr,
         weighting_attribute,
         weighting_rank,
     ):
         moment_0[:, :] = 0
-        moments[:, :] = 0
+        moments[:, :, :] = 0
         for idx_i in numba.prange(length):  # pylint: disable=not-an-iterable
             i = idx[idx_i]
-            for k in range(x_bins.shape[0] - 1):
-                if x_bins[k] <= x_attr[i] < x_bins[k + 1]:
-                    atomic_add(
-                        moment_0,
-                        (k, cell_id[i]),
-                        multiplicity[i] * weighting_attribute[i] ** weighting_rank,
-                    )
+            k = bin_index(x_attr[i], x_bins, x_bins_spacing)
+            if k != -1:
+                atomic_add(
+                    moment_0,
+                    (k, cell_id[i]),
+                    multiplicity[i] * weighting_attribute[i] ** weighting_rank,
+                )
+                for r in range(ranks.shape[0]):
                     atomic_add(
                         moments,
-                        (k, cell_id[i]),
+                        (r, k, cell_id[i]),
                         (
                             multiplicity[i]
                             * weighting_attribute[i] ** weighting_rank
-                            * attr_data[i] ** rank
+                            * attr_data[i] ** ranks[r]
                         ),
                     )
-                    break
         for c_id in range(moment_0.shape[1]):
             for k in range(x_bins.shape[0] - 1):
-                moments[k, c_id] = (
-                    moments[k, c_id] / moment_0[k, c_id]
-                    if moment_0[k, c_id] != 0
-                    else 0
-                )
+                for r in range(ranks.shape[0]):
+                    moments[r, k, c_id] = (
+                        moments[r, k, c_id] / moment_0[k, c_id]
+                        if moment_0[k, c_id] != 0
+                        else 0
+                    )
 
     @staticmethod
     def spectrum_moments(
@@ -146,24 +181,29 @@ class MomentsMethods(BackendMethods):
         cell_id,
         idx,
         length,
-        rank,
+        ranks,
         x_bins,
         x_attr,
         weighting_attribute,
         weighting_rank,
+        x_bins_spacing=ARBITRARY,
     ):
-        assert moments.shape[0] == x_bins.shape[0] - 1
-        assert moment_0.shape == moments.shape
+        """`moments` are shaped (n_ranks, n_bins, n_cell), or (n_bins, n_cell) if
+        only one rank is requested, `moment_0` is shaped (n_bins, n_cell)"""
+        assert moment_0.shape[0] == x_bins.shape[0] - 1
+        assert moments.shape[-2:] == moment_0.shape
+        assert len(moments.shape) == 2 or moments.shape[0] == ranks.shape[0]
         return MomentsMethods.spectrum_moments_body(
             moment_0=moment_0.data,
-            moments=moments.data,
+            moments=moments.data.reshape((ranks.shape[0], *moment_0.shape)),
             multiplicity=multiplicity.data,
             attr_data=attr_data.data,
             cell_id=cell_id.data,
             idx=idx.data,
             length=length,
-            rank=rank,
+            ranks=ranks.data,
             x_bins=x_bins.data,
+            x_bins_spacing=x_bins_spacing,
             x_attr=x_attr.data,
             weighting_attribute=weighting_attribute.data,
             weighting_rank=weighting_rank,
@@ -2,33 +2,47 @@
 CPU implementation of backend methods wrapping basic physics formulae
 """
 import numba
+import numpy as np
 from numba import prange
 
 from PySDM.backends.impl_common.backend_methods import BackendMethods
+from PySDM.backends.impl_common.formulae_cache import cached_per_formulae
 from PySDM.backends.impl_numba import conf
 
 
 class PhysicsMethods(BackendMethods):
     def __init__(self):
         super().__init__()
-        pvs_C = self.formulae.saturation_vapour_pressure.pvs_Celsius
-        pvi_C = self.formulae.saturation_vapour_pressure.ice_Celsius
-        phys_T = self.formulae.state_variable_triplet.T
-        phys_p = self.formulae.state_variable_triplet.p
-        phys_pv = self.formulae.state_variable_triplet.pv
-        explicit_euler = self.formulae.trivia.explicit_euler
-        phys_sigma = self.formulae.surface_tension.sigma
-        phys_volume = self.formulae.trivia.volume
-        phys_r_cr = self.formulae.hygroscopicity.r_cr
-        const = self.formulae.constants
-
-        @numba.njit(**{**conf.JIT_FLAGS, "fastmath": self.formulae.fastmath})
+        kernels = PhysicsMethods.make_kernels(self.formulae)
+        self.explicit_euler_body = kernels["explicit_euler_body"]
+        self.critical_volume_body = kernels["critical_volume_body"]
+        self.temperature_pressure_RH_body = kernels["temperature_pressure_RH_body"]
+        self.terminal_velocity_body = kernels["terminal_velocity_body"]
+        self.a_w_ice_body = kernels["a_w_ice_body"]
+        self.parcel_advance_body = kernels["parcel_advance_body"]
+
+    @staticmethod
+    @cached_per_formulae
+    def make_kernels(formulae):
+        pvs_C = formulae.saturation_vapour_pressure.pvs_Celsius
+        pvi_C = formulae.saturation_vapour_pressure.ice_Celsius
+        phys_T = formulae.state_variable_triplet.T
+        phys_p = formulae.state_variable_triplet.p
+        phys_pv = formulae.state_variable_triplet.pv
+        explicit_euler = formulae.trivia.explicit_euler
+        phys_sigma = formulae.surface_tension.sigma
+        phys_volume = formulae.trivia.volume
+        phys_r_cr = formulae.hygroscopicity.r_cr
+        const = formulae.constants
+        phys_lv = formulae.latent_heat.lv
+        phys_drho_dz = formulae.hydrostatics.drho_dz
+        volume_of_density_mass = formulae.trivia.volume_of_density_mass
+
+        @numba.njit(**{**conf.JIT_FLAGS, "fastmath": formulae.fastmath})
         def explicit_euler_body(y, dt, dy_dt):
             y[:] = explicit_euler(y, dt, dy_dt)
 
-        self.explicit_euler_body = explicit_euler_body
-
-        @numba.njit(**{**conf.JIT_FLAGS, "fastmath": self.formulae.fastmath})
+        @numba.njit(**{**conf.JIT_FLAGS, "fastmath": formulae.fastmath})
         def critical_volume(*, v_cr, kappa, f_org, v_dry, v_wet, T, cell):
             for i in prange(len(v_cr)):  # pylint: disable=not-an-iterable
                 sigma = phys_sigma(T[cell[i]], v_wet[i], v_dry[i], f_org[i])
@@ -41,18 +55,14 @@ class PhysicsMethods(BackendMethods):
                     )
                 )
 
-        self.critical_volume_body = critical_volume
-
-        @numba.njit(**{**conf.JIT_FLAGS, "fastmath": self.formulae.fastmath})
+        @numba.njit(**{**conf.JIT_FLAGS, "fastmath": formulae.fastmath})
         def temperature_pressure_RH_body(*, rhod, thd, qv, T, p, RH):
             for i in prange(T.shape[0]):  # pylint: disable=not-an-iterable
                 T[i] = phys_T(rhod[i], thd[i])
                 p[i] = phys_p(rhod[i], T[i], qv[i])
                 RH[i] = phys_pv(p[i], qv[i]) / pvs_C(T[i] - const.T0)
 
-        self.temperature_pressure_RH_body = temperature_pressure_RH_body
-
-        @numba.njit(**{**conf.JIT_FLAGS, "fastmath": self.formulae.fastmath})
+        @numba.njit(**{**conf.JIT_FLAGS, "fastmath": formulae.fastmath})
         def terminal_velocity_body(*, values, radius, k1, k2, k3, r1, r2):
             for i in prange(len(values)):  # pylint: disable=not-an-iterable
                 if radius[i] < r1:
@@ -62,9 +72,7 @@ class PhysicsMethods(BackendMethods):
                 else:
                     values[i] = k3 * radius[i] ** (1 / 2)
 
-        self.terminal_velocity_body = terminal_velocity_body
-
-        @numba.njit(**{**conf.JIT_FLAGS, "fastmath": self.formulae.fastmath})
+        @numba.njit(**{**conf.JIT_FLAGS, "fastmath": formulae.fastmath})
         def a_w_ice_body(*, T_in, p_in, RH_in, qv_in, a_w_ice_out):
             for i in prange(T_in.shape[0]):  # pylint: disable=not-an-iterable
                 pvi = pvi_C(T_in[i] - const.T0)
@@ -72,7 +80,36 @@ class PhysicsMethods(BackendMethods):
                 pvs = pv / RH_in[i]
                 a_w_ice_out[i] = pvi / pvs
 
-        self.a_w_ice_body = a_w_ice_body
+        @numba.njit(
+            **{**conf.JIT_FLAGS, "parallel": False, "fastmath": formulae.fastmath}
+        )
+        def parcel_advance_body(
+            *, t, z, rhod, T, p, qv, rhod_new, dql, dt, dz_dt, w_times, w_values, m_d
+        ):
+            if len(w_times) != 0:
+                dz_dt = np.interp(t[0] + dt / 2, w_times, w_values)  # "mid-point"
+            dql_dz = dql / dz_dt / dt
+            drhod_dz = phys_drho_dz(
+                const.g_std,
+                p[0],
+                T[0],
+                qv[0] - dql / 2,
+                phys_lv(T[0]),
+                dql_dz=dql_dz,
+            )
+            t[0] = explicit_euler(t[0], dt, 1)
+            z[0] = explicit_euler(z[0], dt, dz_dt)
+            rhod_new[0] = explicit_euler(rhod_new[0], dt, dz_dt * drhod_dz)
+            return volume_of_density_mass((rhod_new[0] + rhod[0]) / 2, m_d)
+
+        return {
+            "explicit_euler_body": explicit_euler_body,
+            "critical_volume_body": critical_volume,
+            "temperature_pressure_RH_body": temperature_pressure_RH_body,
+            "terminal_velocity_body": terminal_velocity_body,
+            "a_w_ice_body": a_w_ice_body,
+            "parcel_advance_body": parcel_advance_body,
+        }
 
     def temperature_pressure_RH(self, *, rhod, thd, qv, T, p, RH):
         self.temperature_pressure_RH_body(
@@ -87,6 +124,25 @@ class PhysicsMethods(BackendMethods):
     def explicit_euler(self, y, dt, dy_dt):
         self.explicit_euler_body(y.data, dt, dy_dt)
 
+    def parcel_advance(
+        self, *, t, z, rhod, T, p, qv, rhod_new, dql, dt, dz_dt, w_table, m_d
+    ):
+        return self.parcel_advance_body(
+            t=t.data,
+            z=z.data,
+            rhod=rhod.data,
+            T=T.data,
+            p=p.data,
+            qv=qv.data,
+            rhod_new=rhod_new.data,
+            dql=dql,
+            dt=dt,
+            dz_dt=dz_dt,
+            w_times=w_table[0],
+            w_values=w_table[1],
+            m_d=m_d,
+        )
+
     def critical_volume(self, *, v_cr, kappa, f_org, v_dry, v_wet, T, cell):
         self.critical_volume_body(
             v_cr=v_cr.data,
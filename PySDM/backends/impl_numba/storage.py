@@ -148,6 +148,15 @@ class Storage(StorageBase):
         result = Storage(Storage._get_data_from_ndarray(array))
         return result
 
+    @staticmethod
+    def view_of_ndarray(array):
+        """flat storage sharing memory with `array` (no copy), or None if the data type
+        or memory layout of `array` do not allow it"""
+        if array.dtype != Storage.FLOAT or not array.flags.c_contiguous:
+            return None
+        data = array.reshape(-1)
+        return Storage(StorageSignature(data, data.shape, Storage.FLOAT))
+
     def floor(self, other=None):
         if other is None:
             impl.floor(self.data)
@@ -170,6 +179,16 @@ class Storage(StorageBase):
         impl.sum_out_of_place(self.data, arg_a.data, arg_b.data)
         return self
 
+    def maximum(self, other):
+        """element-wise (in-place) maximum of `self` and `other`"""
+        np.maximum(self.data, other.data, out=self.data)
+        return self
+
+    def minimum(self, other):
+        """element-wise (in-place) minimum of `self` and `other`"""
+        np.minimum(self.data, other.data, out=self.data)
+        return self
+
     def ravel(self, other):
         if isinstance(other, Storage):
             self.data[:] = other.data.ravel()
@@ -25,7 +25,17 @@ def patch_particulator(particulator):
 
 
 def _bdf_condensation(
-    particulator, *, rtol_x, rtol_thd, counters, RH_max, success, cell_order
+    particulator,
+    *,
+    rtol_x,
+    rtol_thd,
+    counters,
+    RH_max,
+    success,
+    cell_order,
+    n_iterations,
+    dx_guess,
+    ml,
 ):
     func = Numba._condensation
     if not numba.config.DISABLE_JIT:  # pylint: disable=no-member
@@ -43,7 +53,7 @@ def _bdf_condensation(
         rhod=particulator.environment["rhod"].data,
         thd=particulator.environment["thd"].data,
         qv=particulator.environment["qv"].data,
-        dv_mean=particulator.environment.dv,
+        dv_mean=np.atleast_1d(particulator.environment.dv),
         prhod=particulator.environment.get_predicted("rhod").data,
         pthd=particulator.environment.get_predicted("thd").data,
         pqv=particulator.environment.get_predicted("qv").data,
@@ -56,9 +66,17 @@ def _bdf_condensation(
         counter_n_activating=counters["n_activating"],
         counter_n_deactivating=counters["n_deactivating"],
         counter_n_ripening=counters["n_ripening"],
+        counter_n_root_finding_iterations=counters["n_root_finding_iterations"],
+        counter_n_bracket_expansions=counters["n_bracket_expansions"],
+        counter_n_near_equilibrium=counters["n_near_equilibrium"],
+        counter_n_failed=counters["n_failed"],
+        counter_n_probes=counters["n_probes"],
         cell_order=cell_order,
         RH_max=RH_max.data,
         success=success.data,
+        n_iterations=n_iterations.data,
+        dx_guess=dx_guess.data,
+        ml=ml.data,
     )
 
 
@@ -175,12 +193,16 @@ def _make_solve(formulae):
         cell_idx,
         kappa,
         f_org,
+        _n_iterations,
+        _dx_guess,
+        _stats,
         thd,
         qv,
         dthd_dt,
         dqv_dt,
         m_d_mean,
         rhod_mean,
+        _ml_old,
         __,
         ___,
         dt,
@@ -226,6 +248,16 @@ def _make_solve(formulae):
             m_new += n[cell_idx[i]] * v_new * rho_w
             v[cell_idx[i]] = v_new
 
-        return integ.success, qt - m_new / m_d_mean, y1[idx_thd], 1, 1, 1, 1, np.nan
+        return (
+            integ.success,
+            qt - m_new / m_d_mean,
+            y1[idx_thd],
+            1,
+            1,
+            1,
+            1,
+            np.nan,
+            m_new,
+        )
 
     return solve
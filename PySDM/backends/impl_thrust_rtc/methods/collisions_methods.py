@@ -299,7 +299,17 @@ class CollisionsMethods(ThrustRTCBackendMethods):
         collision_rate_deficit,
         collision_rate,
         is_first_in_pair,
+        stats_pair_counts=None,
+        stats_gamma_histogram=None,
+        stats_prob_histogram=None,
+        stats_prob_bins_edges=None,
     ):
+        if (
+            stats_pair_counts is not None
+            or stats_gamma_histogram is not None
+            or stats_prob_histogram is not None
+        ):
+            raise NotImplementedError()
         if len(multiplicity) < 2:
             return
         self.__compute_gamma_body.launch_n(
@@ -348,7 +358,7 @@ class CollisionsMethods(ThrustRTCBackendMethods):
     # pylint: disable=unused-argument
     @nice_thrust(**NICE_THRUST_FLAGS)
     def _sort_by_cell_id_and_update_cell_start(
-        self, cell_id, cell_idx, cell_start, idx
+        self, cell_id, cell_idx, cell_start, idx, movers=None
     ):
         # TODO #330
         #   was here before (but did not work):
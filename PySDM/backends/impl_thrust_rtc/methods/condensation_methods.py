@@ -3,6 +3,8 @@ GPU implementation of backend methods for water condensation/evaporation
 """
 from typing import Dict, Optional
 
+import numpy as np
+
 from PySDM.backends.impl_common.storage_utils import StorageBase
 from PySDM.backends.impl_thrust_rtc.bisection import BISECTION
 from PySDM.backends.impl_thrust_rtc.conf import NICE_THRUST_FLAGS
@@ -332,12 +334,17 @@ class CondensationMethods(ThrustRTCBackendMethods):
         RH_max,
         success,
         cell_id,
+        n_iterations,
+        dx_guess,
+        ml,
     ):
         assert solver is None
 
         if self.adaptive:
             counters["n_substeps"][:] = 1  # TODO #527
 
+        if np.ndim(dv) != 0:
+            raise NotImplementedError()
         n_substeps = counters["n_substeps"][0]
         dv_mean = dv
 
@@ -425,7 +432,11 @@ class CondensationMethods(ThrustRTCBackendMethods):
         multiplier,
         RH_rtol,
         max_iters,
+        warm_start=False,
+        quasi_equilibrium=False,
     ):
+        if warm_start or quasi_equilibrium:
+            raise NotImplementedError()
         self.adaptive = adaptive
         self.RH_rtol = RH_rtol
         self.max_iters = max_iters
@@ -72,8 +72,18 @@ class DisplacementMethods(ThrustRTCBackendMethods):
 
     @nice_thrust(**NICE_THRUST_FLAGS)
     def calculate_displacement(
-        self, *, dim, displacement, courant, cell_origin, position_in_cell, n_substeps
+        self,
+        *,
+        dim,
+        displacement,
+        courant,
+        cell_origin,
+        position_in_cell,
+        n_substeps,
+        substep=0,  # pylint: disable=unused-argument
     ):
+        if hasattr(n_substeps, "data"):
+            raise NotImplementedError()
         dim = trtc.DVInt64(dim)
         n_sd = trtc.DVInt64(position_in_cell.shape[1])
         courant_length = trtc.DVInt64(courant.shape[0])
@@ -132,3 +142,7 @@ class DisplacementMethods(ThrustRTCBackendMethods):
         *, cell_origin, position_in_cell, idx, length, healthy, domain_top_level_index
     ):
         pass
+
+    @staticmethod
+    def displacement_substep(**_):
+        raise NotImplementedError()
@@ -1,6 +1,7 @@
 """
 GPU implementation of moment calculation backend methods
 """
+from PySDM.backends.impl_common.bin_spacing import ARBITRARY, LINEAR, LOGARITHMIC
 from PySDM.backends.impl_thrust_rtc.conf import NICE_THRUST_FLAGS
 from PySDM.backends.impl_thrust_rtc.nice_thrust import nice_thrust
 
@@ -66,38 +67,73 @@ class MomentsMethods(ThrustRTCBackendMethods):
                 "cell_id",
                 "n",
                 "x_bins",
+                "x_bins_spacing",
                 "n_bins",
                 "moments",
-                "rank",
-                "n_sd",
+                "n_ranks",
+                "ranks",
                 "n_cell",
             ),
             "fake_i",
-            """
+            f"""
             auto i = idx[fake_i];
-            for (auto k = 0; k < n_bins; k+=1) {
-                if (x_bins[k] <= x_attr[i] and x_attr[i] < x_bins[k + 1]) {
-                    atomicAdd((real_type*)&moment_0[n_cell * k + cell_id[i]], (real_type)(n[i]));
-                    auto value = n[i] * pow((real_type)(attr_data[i]), (real_type)(rank));
-                    atomicAdd((real_type*) &moments[n_cell * k + cell_id[i]], value);
-                    break;
-                }
-            }
+            auto x = x_attr[i];
+            if (x_bins[0] <= x && x < x_bins[n_bins]) {{
+                auto k = (int64_t)(0);
+                if (x_bins_spacing == {LINEAR}) {{
+                    k = (int64_t)((x - x_bins[0]) / (x_bins[n_bins] - x_bins[0]) * n_bins);
+                }}
+                else if (x_bins_spacing == {LOGARITHMIC}) {{
+                    k = (int64_t)(log(x / x_bins[0]) / log(x_bins[n_bins] / x_bins[0]) * n_bins);
+                }}
+                else {{
+                    auto upper = n_bins;
+                    while (upper - k > 1) {{
+                        auto middle = (k + upper) >> 1;
+                        if (x_bins[middle] <= x) {{
+                            k = middle;
+                        }}
+                        else {{
+                            upper = middle;
+                        }}
+                    }}
+                }}
+                if (k < 0) {{
+                    k = 0;
+                }}
+                if (k > n_bins - 1) {{
+                    k = n_bins - 1;
+                }}
+                while (k > 0 && x < x_bins[k]) {{
+                    k -= 1;
+                }}
+                while (k < n_bins - 1 && x >= x_bins[k + 1]) {{
+                    k += 1;
+                }}
+                atomicAdd((real_type*)&moment_0[n_cell * k + cell_id[i]], (real_type)(n[i]));
+                for (auto r = 0; r < n_ranks; r+=1) {{
+                    auto value = n[i] * pow((real_type)(attr_data[i]), (real_type)(ranks[r]));
+                    atomicAdd((real_type*) &moments[n_cell * (n_bins * r + k) + cell_id[i]], value);
+                }}
+            }}
         """.replace(
                 "real_type", self._get_c_type()
             ),
         )
 
         self.__spectrum_moments_body_1 = trtc.For(
-            ("n_bins", "moments", "moment_0", "n_cell"),
+            ("n_bins", "n_ranks", "moments", "moment_0", "n_cell"),
             "i",
             """
             for (auto k = 0; k < n_bins; k+=1) {
-                if (moment_0[n_cell * k + i] == 0) {
-                    moments[n_cell * k  + i] = 0;
-                }
-                else {
-                    moments[n_cell * k + i] = moments[n_cell * k + i] / moment_0[n_cell * k + i];
+                for (auto r = 0; r < n_ranks; r+=1) {
+                    auto j = n_cell * (n_bins * r + k) + i;
+                    if (moment_0[n_cell * k + i] == 0) {
+                        moments[j] = 0;
+                    }
+                    else {
+                        moments[j] = moments[j] / moment_0[n_cell * k + i];
+                    }
                 }
             }
         """,
@@ -180,23 +216,24 @@ class MomentsMethods(ThrustRTCBackendMethods):
         cell_id,
         idx,
         length,
-        rank,
+        ranks,
         x_bins,
         x_attr,
         weighting_attribute,
         weighting_rank,
+        x_bins_spacing=ARBITRARY,
     ):
-        assert moments.shape[0] == x_bins.shape[0] - 1
-        assert moment_0.shape == moments.shape
+        assert moment_0.shape[0] == x_bins.shape[0] - 1
+        assert moments.shape[-2:] == moment_0.shape
+        assert len(moments.shape) == 2 or moments.shape[0] == ranks.shape[0]
         if weighting_rank != 0:
             raise NotImplementedError()
 
         self.ensure_floating_point(moment_0)
         self.ensure_floating_point(moments)
 
-        n_cell = trtc.DVInt64(moments.shape[1])
-        n_sd = trtc.DVInt64(moments.shape[0])
-        d_rank = trtc.DVInt64(rank)
+        n_cell = trtc.DVInt64(moment_0.shape[1])
+        n_ranks = trtc.DVInt64(ranks.shape[0])
         n_bins = trtc.DVInt64(len(x_bins) - 1)
 
         moments[:] = 0
@@ -212,14 +249,15 @@ class MomentsMethods(ThrustRTCBackendMethods):
                 cell_id.data,
                 multiplicity.data,
                 x_bins.data,
+                trtc.DVInt64(x_bins_spacing),
                 n_bins,
                 moments.data,
-                d_rank,
-                n_sd,
+                n_ranks,
+                ranks.data,
                 n_cell,
             ),
         )
 
         self.__spectrum_moments_body_1.launch_n(
-            moment_0.shape[1], (n_bins, moments.data, moment_0.data, n_cell)
+            moment_0.shape[1], (n_bins, n_ranks, moments.data, moment_0.data, n_cell)
         )
@@ -1,6 +1,8 @@
 """
 GPU implementation of backend methods wrapping basic physics formulae
 """
+import numpy as np
+
 from PySDM.backends.impl_thrust_rtc.conf import NICE_THRUST_FLAGS
 from PySDM.backends.impl_thrust_rtc.nice_thrust import nice_thrust
 
@@ -117,3 +119,24 @@ class PhysicsMethods(ThrustRTCBackendMethods):
         dt = self._get_floating_point(dt)
         dy_dt = self._get_floating_point(dy_dt)
         self.__explicit_euler_body.launch_n(y.shape[0], (y.data, dt, dy_dt))
+
+    def parcel_advance(
+        self, *, t, z, rhod, T, p, qv, rhod_new, dql, dt, dz_dt, w_table, m_d
+    ):
+        if len(w_table[0]) != 0:
+            dz_dt = np.interp(t[0] + dt / 2, *w_table)  # "mid-point"
+        dql_dz = dql / dz_dt / dt
+        drhod_dz = self.formulae.hydrostatics.drho_dz(
+            self.formulae.constants.g_std,
+            p[0],
+            T[0],
+            qv[0] - dql / 2,
+            self.formulae.latent_heat.lv(T[0]),
+            dql_dz=dql_dz,
+        )
+        self.explicit_euler(t, dt, 1)
+        self.explicit_euler(z, dt, dz_dt)
+        self.explicit_euler(rhod_new, dt, dz_dt * drhod_dz)
+        return self.formulae.trivia.volume_of_density_mass(
+            (rhod_new[0] + rhod[0]) / 2, m_d
+        )
@@ -39,6 +39,26 @@ def make_storage_class(BACKEND):
                 trtc.Plus(),
             )
 
+        @staticmethod
+        @nice_thrust(**NICE_THRUST_FLAGS)
+        def maximum(output, other):
+            trtc.Transform_Binary(
+                Impl.thrust(other),
+                Impl.thrust(output),
+                Impl.thrust(output),
+                trtc.Maximum(),
+            )
+
+        @staticmethod
+        @nice_thrust(**NICE_THRUST_FLAGS)
+        def minimum(output, other):
+            trtc.Transform_Binary(
+                Impl.thrust(other),
+                Impl.thrust(output),
+                Impl.thrust(output),
+                trtc.Minimum(),
+            )
+
         @staticmethod
         @nice_thrust(**NICE_THRUST_FLAGS)
         def amin(data):
@@ -128,7 +148,7 @@ def make_storage_class(BACKEND):
                 loop = Impl.__multiply_elementwise_body
             else:
                 loop = Impl.__multiply_body
-            loop.launch_n(output.shape[0], Impl.thrust((output, multiplier)))
+            loop.launch_n(output.data.size(), Impl.thrust((output, multiplier)))
 
         __truediv_elementwise_body = trtc.For(
             ("output", "multiplier"),
@@ -422,6 +442,12 @@ def make_storage_class(BACKEND):
             result = Storage(Storage._get_data_from_ndarray(array))
             return result
 
+        @staticmethod
+        # pylint: disable=unused-argument
+        def view_of_ndarray(array):
+            """device storages cannot share memory with host arrays"""
+            return None
+
         def floor(self, other=None):
             if other is None:
                 Impl.floor(self.data)
@@ -441,6 +467,16 @@ def make_storage_class(BACKEND):
             Impl.sum_out_of_place(self, arg_a, arg_b)
             return self
 
+        def maximum(self, other):
+            """element-wise (in-place) maximum of `self` and `other`"""
+            Impl.maximum(self, other)
+            return self
+
+        def minimum(self, other):
+            """element-wise (in-place) minimum of `self` and `other`"""
+            Impl.minimum(self, other)
+            return self
+
         def ravel(self, other):
             if isinstance(other, Storage):
                 trtc.Copy(other.data, self.data)
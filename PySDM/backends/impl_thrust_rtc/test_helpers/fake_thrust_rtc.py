@@ -203,6 +203,10 @@ class FakeThrustRTC:  # pylint: disable=too-many-public-methods
             vec_out.ndarray[:] = vec_in1.ndarray + vec_in2.ndarray
         elif op == "-":
             vec_out.ndarray[:] = vec_in1.ndarray - vec_in2.ndarray
+        elif op == "max":
+            vec_out.ndarray[:] = np.maximum(vec_in1.ndarray, vec_in2.ndarray)
+        elif op == "min":
+            vec_out.ndarray[:] = np.minimum(vec_in1.ndarray, vec_in2.ndarray)
         else:
             raise NotImplementedError()
 
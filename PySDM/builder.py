@@ -29,6 +29,7 @@ class Builder:
         }
         self.aerosol_radius_threshold = 0
         self.condensation_params = None
+        self.memoise_products = False
 
     def _set_condensation_parameters(self, **kwargs):
         self.condensation_params = kwargs
@@ -69,8 +70,15 @@ class Builder:
         attributes: dict,
         products: tuple = (),
         int_caster=discretise_multiplicities,
+        memoise_products=False,
     ):
+        """with `memoise_products`, values of products flagged as `memoisable`
+        are cached and returned (as copies) from subsequent `get()` calls
+        with the same arguments, as long as the timestep count, the super-droplet
+        count, the timestamps of attributes and the values of environment fields
+        read by the product are unchanged"""
         assert self.particulator.environment is not None
+        self.memoise_products = memoise_products
 
         for dynamic in self.particulator.dynamics.values():
             dynamic.register(self)
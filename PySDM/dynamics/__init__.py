@@ -10,3 +10,4 @@ from PySDM.dynamics.condensation import Condensation
 from PySDM.dynamics.displacement import Displacement
 from PySDM.dynamics.eulerian_advection import EulerianAdvection
 from PySDM.dynamics.freezing import Freezing
+from PySDM.dynamics.strip_exchange import StripFieldExchange, StripParticleMigration
@@ -24,25 +24,24 @@ class Schlottke2010:
             )
 
     def __call__(self, output, is_first_in_pair):
-        self.arrays["tmp"].sum(self.particulator.attributes["volume"], is_first_in_pair)
-        self.arrays["tmp"] /= self.const.pi / 6
+        arrays = {key: array[: len(output)] for key, array in self.arrays.items()}
+        arrays["tmp"].sum(self.particulator.attributes["volume"], is_first_in_pair)
+        arrays["tmp"] /= self.const.PI / 6
 
-        self.arrays["tmp2"].distance(
+        arrays["tmp2"].distance(
             self.particulator.attributes["terminal velocity"], is_first_in_pair
         )
-        self.arrays["tmp2"] **= 2
-        self.arrays["We"].multiply(
-            self.particulator.attributes["volume"], is_first_in_pair
-        )
-        self.arrays["We"] /= self.arrays["tmp"]
-        self.arrays["We"] *= self.arrays["tmp2"]
-        self.arrays["We"] *= self.const.pi / 12 * self.const.rho_w
+        arrays["tmp2"] **= 2
+        arrays["We"].multiply(self.particulator.attributes["volume"], is_first_in_pair)
+        arrays["We"] /= arrays["tmp"]
+        arrays["We"] *= arrays["tmp2"]
+        arrays["We"] *= self.const.PI / 12 * self.const.rho_w
 
-        self.arrays["Sc"][:] = self.arrays["tmp"][:]
-        self.arrays["Sc"] **= 2 / 3
-        self.arrays["Sc"] *= self.const.pi * self.const.sgm_w
+        arrays["Sc"][:] = arrays["tmp"][:]
+        arrays["Sc"] **= 2 / 3
+        arrays["Sc"] *= self.const.PI * self.const.sgm_w
 
-        self.arrays["We"] /= self.arrays["Sc"]
-        self.arrays["We"] *= -1.15
+        arrays["We"] /= arrays["Sc"]
+        arrays["We"] *= -1.15
 
-        output[:] = np.exp(self.arrays["We"])
+        output[:] = np.exp(arrays["We"])
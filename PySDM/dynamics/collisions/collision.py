@@ -75,12 +75,23 @@ class Collision:
         self.adaptive = adaptive
         self.stats_n_substep = None
         self.stats_dt_min = None
+        self.stats_pair_counts = None
+        self.stats_gamma_histogram = None
+        self.stats_prob_histogram = None
+        self.stats_prob_bins_edges = None
+        self.stats_substep_histogram = None
         self.dt_coal_range = tuple(dt_coal_range)
 
         self.kernel_temp = None
         self.n_fragment = None
         self.Ec_temp = None
         self.Eb_temp = None
+        self.n_fragment_colliding = None
+        self.Ec_colliding = None
+        self.Eb_colliding = None
+        self.colliding_pairs = None
+        self.colliding_pairs_idx = None
+        self.colliding_pairs_indicator = None
         self.norm_factor_temp = None
         self.prob = None
         self.is_first_in_pair = None
@@ -106,6 +117,11 @@ class Collision:
 
         if self.particulator.n_sd < 2:
             raise ValueError("No one to collide with!")
+        if np.ndim(self.particulator.mesh.dv) != 0:
+            raise NotImplementedError(
+                "collisions not supported in environments with per-cell volumes"
+                " (e.g., MultiParcel)"
+            )
         if self.dt_coal_range[1] > self.particulator.dt:
             self.dt_coal_range = (self.dt_coal_range[0], self.particulator.dt)
         assert self.dt_coal_range[0] <= self.dt_coal_range[1]
@@ -150,6 +166,29 @@ class Collision:
             self.Eb_temp = self.particulator.PairwiseStorage.empty(
                 **empty_args_pairwise
             )
+            self.n_fragment_colliding = self.particulator.PairwiseStorage.empty(
+                **empty_args_pairwise
+            )
+            self.Ec_colliding = self.particulator.PairwiseStorage.empty(
+                **empty_args_pairwise
+            )
+            self.Eb_colliding = self.particulator.PairwiseStorage.empty(
+                **empty_args_pairwise
+            )
+            self.colliding_pairs = self.particulator.Storage.empty(
+                self.particulator.n_sd // 2, dtype=int
+            )
+            self.colliding_pairs_idx = self.particulator.Storage.empty(
+                self.particulator.n_sd, dtype=int
+            )
+            self.colliding_pairs_indicator = self.particulator.PairIndicator(
+                self.particulator.n_sd
+            )
+            self.colliding_pairs_indicator.indicator = (
+                self.particulator.Storage.from_ndarray(
+                    np.arange(self.particulator.n_sd) % 2 == 0
+                )
+            )
             self.rnd_opt_proc.register(builder)
             self.rnd_opt_frag.register(builder)
             self.compute_coalescence_efficiency.register(builder)
@@ -160,13 +199,64 @@ class Collision:
                 *counter_args
             )
 
+    def request_pair_counts(self):
+        """enables in-kernel counting of candidate (first row)
+        and colliding (second row) pairs in each cell"""
+        if self.stats_pair_counts is not None:
+            raise ValueError("pair counts already requested")
+        self.stats_pair_counts = self.particulator.Storage.from_ndarray(
+            np.zeros((2, self.particulator.mesh.n_cell), dtype=int)
+        )
+
+    def request_gamma_histogram(self, n_bins):
+        """enables in-kernel accumulation of per-cell histograms of gamma values
+        (bin `k` counts candidate pairs with gamma equal to `k`, last bin collects
+        all pairs with gamma greater or equal to `n_bins - 1`)"""
+        if self.stats_gamma_histogram is not None:
+            raise ValueError("gamma histogram already requested")
+        self.stats_gamma_histogram = self.particulator.Storage.from_ndarray(
+            np.zeros((n_bins, self.particulator.mesh.n_cell), dtype=int)
+        )
+
+    def request_prob_histogram(self, prob_bins_edges):
+        """enables in-kernel accumulation of per-cell histograms of collision
+        probabilities (i.e. the expected number of collisions in a candidate pair)"""
+        if self.stats_prob_histogram is not None:
+            raise ValueError("probability histogram already requested")
+        prob_bins_edges = np.asarray(prob_bins_edges, dtype=float)
+        self.stats_prob_bins_edges = self.particulator.Storage.from_ndarray(
+            prob_bins_edges
+        )
+        self.stats_prob_histogram = self.particulator.Storage.from_ndarray(
+            np.zeros(
+                (len(prob_bins_edges) - 1, self.particulator.mesh.n_cell), dtype=int
+            )
+        )
+
+    def request_substep_histogram(self, n_bins):
+        """enables accumulation of per-cell histograms of the number of substeps
+        taken within a timestep (last bin collects all counts greater or equal
+        to `n_bins - 1`)"""
+        if self.stats_substep_histogram is not None:
+            raise ValueError("substep histogram already requested")
+        self.stats_substep_histogram = np.zeros(
+            (n_bins, self.particulator.mesh.n_cell), dtype=int
+        )
+
     def __call__(self):
         if self.enable:
             if not self.adaptive:
                 for _ in range(self.__substeps):
                     self.step()
+                if self.stats_substep_histogram is not None:
+                    self.stats_substep_histogram[
+                        min(self.__substeps, self.stats_substep_histogram.shape[0] - 1),
+                        :,
+                    ] += 1
             else:
                 self.dt_left[:] = self.particulator.dt
+                if self.stats_substep_histogram is not None:
+                    n_substep_before = self.stats_n_substep.to_ndarray()
 
                 while self.particulator.attributes.get_working_length() != 0:
                     self.particulator.attributes.cell_idx.sort_by_key(self.dt_left)
@@ -174,6 +264,19 @@ class Collision:
 
                 self.particulator.attributes.reset_working_length()
                 self.particulator.attributes.reset_cell_idx()
+
+                if self.stats_substep_histogram is not None:
+                    n_substep = self.stats_n_substep.to_ndarray() - n_substep_before
+                    np.add.at(
+                        self.stats_substep_histogram,
+                        (
+                            np.minimum(
+                                n_substep, self.stats_substep_histogram.shape[0] - 1
+                            ),
+                            np.arange(self.particulator.mesh.n_cell),
+                        ),
+                        1,
+                    )
             self.rnd_opt_coll.reset()
             if self.enable_breakup:
                 self.rnd_opt_proc.reset()
@@ -187,19 +290,17 @@ class Collision:
         )
 
         self.compute_probabilities_of_collision(self.prob, self.is_first_in_pair)
+        self.compute_gamma(self.prob, rand, self.is_first_in_pair)
+
         if self.enable_breakup:
             proc_rand = self.rnd_opt_proc.get_random_arrays()
             rand_frag = self.rnd_opt_frag.get_random_arrays()
-            self.compute_coalescence_efficiency(self.Ec_temp, self.is_first_in_pair)
-            self.compute_breakup_efficiency(self.Eb_temp, self.is_first_in_pair)
-            self.compute_number_of_fragments(
-                self.n_fragment, rand_frag, self.is_first_in_pair
+            self.compute_efficiencies_and_fragments_of_colliding_pairs(
+                self.prob, rand_frag, self.is_first_in_pair
             )
         else:
             proc_rand = None
 
-        self.compute_gamma(self.prob, rand, self.is_first_in_pair)
-
         self.particulator.collision_coalescence_breakup(
             enable_breakup=self.enable_breakup,
             gamma=self.prob,
@@ -239,6 +340,53 @@ class Collision:
         prob *= self.kernel_temp
         self.particulator.normalize(prob, self.norm_factor_temp)
 
+    def compute_efficiencies_and_fragments_of_colliding_pairs(
+        self, gamma, rand_frag, is_first_in_pair
+    ):
+        """evaluates coalescence and breakup efficiencies and numbers of fragments
+        only for pairs with non-zero gamma: colliding pairs are gathered into
+        a compacted permutation (with the pair indicator reduced to a regular
+        every-other-one pattern), the efficiency and fragmentation functions are
+        evaluated over the compacted pairs, and the results are scattered back;
+        values stored for non-colliding pairs are left stale as they are not read"""
+        n_colliding = self.particulator.backend.gather_colliding_pairs(
+            gamma=gamma,
+            idx=self.particulator.attributes["n"].idx,
+            is_first_in_pair=is_first_in_pair,
+            colliding_pairs=self.colliding_pairs,
+            colliding_pairs_idx=self.colliding_pairs_idx,
+        )
+        if n_colliding == 0:
+            return
+
+        self.colliding_pairs_indicator.length = 2 * n_colliding
+        Ec_colliding = self.Ec_colliding[:n_colliding]
+        Eb_colliding = self.Eb_colliding[:n_colliding]
+        n_fragment_colliding = self.n_fragment_colliding[:n_colliding]
+        with self.particulator.attributes.permuted(
+            self.colliding_pairs_idx, 2 * n_colliding
+        ):
+            self.compute_coalescence_efficiency(
+                Ec_colliding, self.colliding_pairs_indicator
+            )
+            self.compute_breakup_efficiency(
+                Eb_colliding, self.colliding_pairs_indicator
+            )
+            self.compute_number_of_fragments(
+                n_fragment_colliding, rand_frag, self.colliding_pairs_indicator
+            )
+
+        self.particulator.backend.scatter_colliding_pairs(
+            colliding_pairs=self.colliding_pairs,
+            n_colliding=n_colliding,
+            Ec=self.Ec_temp,
+            Eb=self.Eb_temp,
+            n_fragment=self.n_fragment,
+            Ec_colliding=Ec_colliding,
+            Eb_colliding=Eb_colliding,
+            n_fragment_colliding=n_fragment_colliding,
+        )
+
     def compute_n_fragment(self, n_fragment, u01, is_first_in_pair):
         self.compute_number_of_fragments(n_fragment, u01, is_first_in_pair)
 
@@ -272,6 +420,10 @@ class Collision:
             collision_rate_deficit=self.collision_rate_deficit,
             collision_rate=self.collision_rate,
             is_first_in_pair=is_first_in_pair,
+            stats_pair_counts=self.stats_pair_counts,
+            stats_gamma_histogram=self.stats_gamma_histogram,
+            stats_prob_histogram=self.stats_prob_histogram,
+            stats_prob_bins_edges=self.stats_prob_bins_edges,
         )
 
 
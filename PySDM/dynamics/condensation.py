@@ -28,6 +28,8 @@ class Condensation:
         schedule: str = DEFAULTS.schedule,
         max_iters: int = 16,
         update_thd: bool = True,
+        warm_start: bool = False,
+        quasi_equilibrium: bool = False,
     ):
 
         self.particulator = None
@@ -50,6 +52,13 @@ class Condensation:
 
         self.update_thd = update_thd
 
+        self.warm_start = warm_start
+        self.quasi_equilibrium = quasi_equilibrium
+        self.n_iterations = None
+        self.dx_guess = None
+        self.ml = None
+        self.ml_timestamps = None
+
     def register(self, builder):
         self.particulator = builder.particulator
 
@@ -60,6 +69,8 @@ class Condensation:
             multiplier=2,
             RH_rtol=1e-7,
             max_iters=self.max_iters,
+            warm_start=self.warm_start,
+            quasi_equilibrium=self.quasi_equilibrium,
         )
         builder.request_attribute("critical volume")
         builder.request_attribute("kappa")
@@ -73,6 +84,17 @@ class Condensation:
                 self.counters[counter][:] = self.__substeps if not self.adaptive else -1
             else:
                 self.counters[counter][:] = -1
+        # solver diagnostics for the last timestep (including adaptive-substep probes)
+        for counter in (
+            "n_root_finding_iterations",
+            "n_bracket_expansions",
+            "n_near_equilibrium",
+            "n_failed",
+            "n_probes",
+        ):
+            self.counters[counter] = self.particulator.Storage.from_ndarray(
+                np.zeros(self.particulator.mesh.n_cell, dtype=int)
+            )
 
         self.rh_max = self.particulator.Storage.empty(
             self.particulator.mesh.n_cell, dtype=float
@@ -84,15 +106,44 @@ class Condensation:
         self.success[:] = False
         self.cell_order = np.arange(self.particulator.mesh.n_cell)
 
+        # per-droplet number of root-finding iterations in the last timestep
+        # (including those spent in adaptive-substep probes)
+        self.n_iterations = self.particulator.Storage.from_ndarray(
+            np.zeros(self.particulator.n_sd, dtype=int)
+        )
+        # per-droplet increment of the condensation coordinate in the last
+        # substep used to seed the root-finding bracket (if `warm_start` is set)
+        self.dx_guess = self.particulator.Storage.from_ndarray(
+            np.zeros(self.particulator.n_sd)
+        )
+        # per-cell liquid water mass as of the end of the last call, valid as long
+        # as none of the attributes it depends on was updated by other dynamics
+        # (negative values trigger recalculation within the backend solver)
+        self.ml = self.particulator.Storage.from_ndarray(
+            np.full(self.particulator.mesh.n_cell, -1.0)
+        )
+
     def __call__(self):
         if self.enable:
             if self.schedule == "dynamic":
-                self.cell_order = np.argsort(self.counters["n_substeps"])
+                # most expensive cells first (as estimated from previous step substeps
+                # times super-droplet count) to keep threads balanced when picking
+                # cells from the backend work queue
+                n_sd_in_cell = np.diff(
+                    self.particulator.attributes.cell_start.to_ndarray()
+                )
+                self.cell_order = np.argsort(
+                    -self.counters["n_substeps"].to_ndarray() * n_sd_in_cell,
+                    kind="stable",
+                )
             elif self.schedule == "static":
                 pass
             else:
                 raise NotImplementedError()
 
+            if self.ml_timestamps != self.__get_ml_timestamps():
+                self.ml[:] = -1
+            self.n_iterations[:] = 0
             self.particulator.condensation(
                 rtol_x=self.rtol_x,
                 rtol_thd=self.rtol_thd,
@@ -100,6 +151,9 @@ class Condensation:
                 RH_max=self.rh_max,
                 success=self.success,
                 cell_order=self.cell_order,
+                n_iterations=self.n_iterations,
+                dx_guess=self.dx_guess,
+                ml=self.ml,
             )
             if not self.success.all():
                 raise RuntimeError("Condensation failed")
@@ -122,3 +176,10 @@ class Condensation:
                         int(self.particulator.dt / self.dt_cond_range[0]),
                     )
             self.particulator.attributes.mark_updated("volume")
+            self.ml_timestamps = self.__get_ml_timestamps()
+
+    def __get_ml_timestamps(self):
+        return tuple(
+            self.particulator.attributes.get_timestamp(key)
+            for key in ("volume", "n", "cell id")
+        )
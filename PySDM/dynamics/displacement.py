@@ -4,7 +4,13 @@ particle displacement due to advection by the flow & sedimentation
 adaptive time-stepping controlled by comparing implicit-Euler (I)
 and explicit-Euler (E) maximal displacements with:
 rtol < |(I - E) / E|
-(see eqs 13-16 in [Arabas et al. 2015](https://doi.org/10.5194/gmd-8-1677-2015))
+(see eqs 13-16 in [Arabas et al. 2015](https://doi.org/10.5194/gmd-8-1677-2015));
+with `spatially_variable_substeps`, the number of substeps is evaluated per cell
+(taking into account neighbouring cells) and each particle is displaced only as
+many times as the cell it starts the timestep in requires;
+with `fused`, each substep is carried out by a single backend call making one pass
+over the super-droplets (advection, sedimentation, precipitation and out-of-column
+flagging, cell-origin and cell-id update)
 """
 from collections import namedtuple
 
@@ -20,6 +26,8 @@ class Displacement:
         precipitation_counting_level_index: int = 0,
         adaptive=DEFAULTS.adaptive,
         rtol=DEFAULTS.rtol,
+        spatially_variable_substeps=False,
+        fused=False,
     ):
         self.particulator = None
         self.enable_sedimentation = enable_sedimentation
@@ -35,6 +43,13 @@ class Displacement:
         self.rtol = rtol
         self._n_substeps = 1
 
+        self.spatially_variable_substeps = spatially_variable_substeps
+        self._n_substeps_in_cell = None
+        self._n_substeps_of_particle = None
+        self._sedimentation_factor = None
+        self._sedimentation_displacement = None
+        self.fused = fused
+
     def register(self, builder):
         builder.request_attribute("terminal velocity")
         self.particulator = builder.particulator
@@ -61,13 +76,32 @@ class Displacement:
         self.temp = self.particulator.Storage.from_ndarray(
             np.zeros((self.dimension, self.particulator.n_sd), dtype=np.int64)
         )
+        if self.spatially_variable_substeps:
+            if not self.adaptive:
+                raise ValueError(
+                    "spatially variable substeps require adaptive time-stepping"
+                )
+            self._n_substeps_of_particle = self.particulator.Storage.from_ndarray(
+                np.ones(self.particulator.n_sd, dtype=np.int64)
+            )
+            if self.enable_sedimentation and not self.fused:
+                self._sedimentation_factor = self.particulator.Storage.from_ndarray(
+                    np.zeros(self.particulator.n_sd)
+                )
+                self._sedimentation_displacement = (
+                    self.particulator.Storage.from_ndarray(
+                        np.zeros(self.particulator.n_sd)
+                    )
+                )
 
     def upload_courant_field(self, courant_field):
         for i, component in enumerate(courant_field):
             self.courant[i].upload(component)
 
-        # note: to be improved, should make n_substeps variable in space as in cond/coal
-        if self.adaptive:
+        if self.spatially_variable_substeps:
+            self._n_substeps_in_cell = self.__n_substeps_in_cell(courant_field)
+            self._n_substeps = int(np.amax(self._n_substeps_in_cell))
+        elif self.adaptive:
             error_estimate = self.rtol
             self._n_substeps = 0.5
             while error_estimate >= self.rtol:
@@ -85,33 +119,113 @@ class Displacement:
                         else 1 / (1 / max_abs_delta_courant - 1),
                     )
 
+    def __n_substeps_in_cell(self, courant_field):
+        """powers of two per cell meeting the same error criterion as above,
+        dilated over neighbouring cells as particles may enter them within
+        a timestep"""
+        max_abs_delta_courant = np.zeros(tuple(self.grid.to_ndarray()))
+        for i, courant_component in enumerate(courant_field):
+            max_abs_delta_courant = np.maximum(
+                max_abs_delta_courant, np.abs(np.diff(courant_component, axis=i))
+            )
+        n_substeps = np.ones(max_abs_delta_courant.shape, dtype=np.int64)
+        while True:
+            delta = max_abs_delta_courant / n_substeps
+            with np.errstate(divide="ignore"):
+                error_estimate = np.where(delta == 0, 0, 1 / (1 / delta - 1))
+            too_coarse = error_estimate >= self.rtol
+            if not too_coarse.any():
+                break
+            n_substeps[too_coarse] *= 2
+        for i in range(self.dimension):
+            n_substeps = np.maximum(
+                n_substeps,
+                np.maximum(
+                    np.roll(n_substeps, 1, axis=i), np.roll(n_substeps, -1, axis=i)
+                ),
+            )
+        return n_substeps.ravel()
+
     def __call__(self):
         # TIP: not need all array only [idx[:sd_num]]
         cell_origin = self.particulator.attributes["cell origin"]
         position_in_cell = self.particulator.attributes["position in cell"]
 
+        if self.spatially_variable_substeps:
+            n_substeps_of_particle = self._n_substeps_in_cell[
+                self.particulator.attributes["cell id"].to_ndarray(raw=True)
+            ]
+            self._n_substeps_of_particle.upload(n_substeps_of_particle)
+
         self.precipitation_in_last_step = 0.0
-        for _ in range(self._n_substeps):
-            self.calculate_displacement(
-                self.displacement, self.courant, cell_origin, position_in_cell
-            )
-            self.update_position(position_in_cell, self.displacement)
-            if self.enable_sedimentation:
-                self.precipitation_in_last_step += self.particulator.remove_precipitated(
+        if self.fused:
+            for substep in range(self._n_substeps):
+                self.precipitation_in_last_step += self.particulator.displacement_substep(
                     displacement=self.displacement,
+                    courant=self.courant,
+                    n_substeps=self._n_substeps_of_particle
+                    if self.spatially_variable_substeps
+                    else self._n_substeps,
+                    substep=substep,
+                    enable_sedimentation=self.enable_sedimentation,
                     precipitation_counting_level_index=self.precipitation_counting_level_index,
                 )
-            self.particulator.flag_out_of_column()
-            self.update_cell_origin(cell_origin, position_in_cell)
-            self.boundary_condition(cell_origin)
-            self.particulator.recalculate_cell_id()
+        else:
+            for substep in range(self._n_substeps):
+                if (
+                    self.spatially_variable_substeps
+                    and self.enable_sedimentation
+                    and (substep == 0 or substep in self._n_substeps_in_cell)
+                ):
+                    self._sedimentation_factor.upload(
+                        np.where(
+                            substep < n_substeps_of_particle,
+                            self.particulator.dt
+                            / n_substeps_of_particle
+                            / self.particulator.mesh.dz,
+                            0,
+                        )
+                    )
+                self.calculate_displacement(
+                    self.displacement,
+                    self.courant,
+                    cell_origin,
+                    position_in_cell,
+                    substep=substep,
+                )
+                self.update_position(position_in_cell, self.displacement)
+                if self.enable_sedimentation:
+                    self.precipitation_in_last_step += self.particulator.remove_precipitated(
+                        displacement=self.displacement,
+                        precipitation_counting_level_index=self.precipitation_counting_level_index,
+                    )
+                self.particulator.flag_out_of_column()
+                self.update_cell_origin(cell_origin, position_in_cell)
+                self.boundary_condition(cell_origin)
+                self.particulator.recalculate_cell_id()
 
         for key in ("position in cell", "cell origin", "cell id"):
             self.particulator.attributes.mark_updated(key)
 
     def calculate_displacement(
-        self, displacement, courant, cell_origin, position_in_cell
+        self, displacement, courant, cell_origin, position_in_cell, substep=0
     ):
+        if self.spatially_variable_substeps:
+            self.particulator.calculate_displacement(
+                displacement=displacement,
+                courant=courant,
+                cell_origin=cell_origin,
+                position_in_cell=position_in_cell,
+                n_substeps=self._n_substeps_of_particle,
+                substep=substep,
+            )
+            if self.enable_sedimentation:
+                self._sedimentation_displacement.product(
+                    self.particulator.attributes["terminal velocity"],
+                    self._sedimentation_factor,
+                )
+                displacement[self.dimension - 1, :] -= self._sedimentation_displacement
+            return
         self.particulator.calculate_displacement(
             displacement=displacement,
             courant=courant,
@@ -1,21 +1,90 @@
 """
-wrapper class for triggering integration in the Eulerian advection solver
+wrapper class for triggering integration in the Eulerian advection solver;
+with `pipelined=True` the solver is run in a background thread overlapping with
+the particle dynamics that follow within the timestep (which do not touch
+the Eulerian fields) - the environment synchronises through `wait()` before
+the fields are used; as the (Numba-parallel) solvers then run concurrently
+with the Numba-parallel particle kernels, a thread-safe Numba threading layer
+is required (`tbb` or `omp`, i.e., the `tbb` or an OpenMP runtime package
+needs to be installed) - if no parallel kernel was run yet, Numba is set to
+choose one of these, otherwise an error is raised if the `workqueue` layer
+is in use
 """
+from threading import Thread
+
+import numba
+import numpy as np
+
+THREADSAFE_THREADING_LAYERS = ("tbb", "omp")
+
+
+@numba.njit(parallel=True)
+def _parallel_noop(array):
+    for i in numba.prange(array.shape[0]):  # pylint: disable=not-an-iterable
+        array[i] = i
+
+
+def _ensure_threadsafe_threading_layer():
+    if numba.config.DISABLE_JIT:
+        return
+    try:
+        layer = numba.threading_layer()
+    except ValueError:  # not initialised yet
+        if numba.config.THREADING_LAYER == "default":
+            numba.config.THREADING_LAYER = "threadsafe"
+        _parallel_noop(np.empty(1))
+        layer = numba.threading_layer()
+    if layer not in THREADSAFE_THREADING_LAYERS:
+        raise ValueError(
+            f"pipelined Eulerian advection requires a thread-safe Numba threading"
+            f" layer (one of {THREADSAFE_THREADING_LAYERS}), '{layer}' in use"
+            " (installing the tbb package and setting NUMBA_THREADING_LAYER=tbb"
+            " should help)"
+        )
 
 
 class EulerianAdvection:
-    def __init__(self, solvers):
+    def __init__(self, solvers, *, pipelined=False):
         self.solvers = solvers
         self.particulator = None
+        self.pipelined = pipelined
+        self.thread = None
+        self.exception = None
 
     def register(self, builder):
         self.particulator = builder.particulator
+        if self.pipelined:
+            _ensure_threadsafe_threading_layer()
 
     def __call__(self):
-        self.particulator.environment.get_predicted("qv").download(
-            self.particulator.environment.get_qv(), reshape=True
-        )
-        self.particulator.environment.get_predicted("thd").download(
-            self.particulator.environment.get_thd(), reshape=True
-        )
-        self.solvers()
+        environment = self.particulator.environment
+        for var, target in (
+            ("qv", environment.get_qv()),
+            ("thd", environment.get_thd()),
+        ):
+            if hasattr(environment, "download_predicted"):
+                environment.download_predicted(var, target)
+            else:
+                environment.get_predicted(var).download(target, reshape=True)
+        if self.pipelined:
+            self.wait()
+            self.thread = Thread(target=self.__run_solvers, daemon=True)
+            self.thread.start()
+        else:
+            self.solvers()
+
+    def __run_solvers(self):
+        try:
+            self.solvers()
+        except Exception as exception:  # pylint: disable=broad-except
+            self.exception = exception
+
+    def wait(self):
+        """blocks until the solvers launched in the background (if any)
+        are done, re-raising exceptions they might have thrown"""
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+        if self.exception is not None:
+            exception, self.exception = self.exception, None
+            raise exception
@@ -0,0 +1,186 @@
+"""
+inter-process exchange for runs decomposed into vertical strips with
+`PySDM.impl.strip_decomposition.StripDecomposition`, each worker process running
+its own particulator (with the whole-domain mesh and flow field):
+`StripParticleMigration` (to be added after `PySDM.dynamics.displacement.Displacement`)
+hands over super-droplets which left the strip to their new owners, and
+`StripFieldExchange` (to be added before
+`PySDM.dynamics.eulerian_advection.EulerianAdvection`) gathers the predicted
+water vapour mixing ratio and potential temperature fields from the workers
+owning the respective strips
+"""
+import numpy as np
+
+from PySDM.attributes.impl.maximum_attribute import MaximumAttribute
+
+
+class StripParticleMigration:
+    def __init__(self, decomposition, rank: int):
+        self.decomposition = decomposition
+        self.rank = rank
+        self.particulator = None
+        self.__req_attr = None
+        self.__maximum_keys = None
+
+    def register(self, builder):
+        self.particulator = builder.particulator
+        self.__req_attr = builder.req_attr
+        builder.request_attribute("cell origin")
+        builder.request_attribute("position in cell")
+
+    def __call__(self):
+        try:
+            if self.__maximum_keys is None:
+                self.__check_attributes()
+            self.__send()
+            self.decomposition.synchronise()
+            self.__receive()
+        except Exception:
+            self.decomposition.barrier.abort()
+            raise
+        self.decomposition.synchronise()
+
+    def __check_attributes(self):
+        """base (non-derived) attributes are: extensive ones, maximum ones (e.g.,
+        freezing temperature), multiplicity and the cellular ones - all but
+        "cell id" (recalculated upon receipt) are migrated"""
+        attributes = self.particulator.attributes
+        maximum_keys = tuple(
+            key
+            for key, attribute in self.__req_attr.items()
+            if isinstance(attribute, MaximumAttribute)
+        )
+        for kind, actual, expected in (
+            (
+                "extensive",
+                len(attributes.get_extensive_attribute_keys()),
+                self.decomposition.n_extensive_attributes,
+            ),
+            ("maximum", len(maximum_keys), self.decomposition.n_maximum_attributes),
+        ):
+            if actual != expected:
+                raise ValueError(
+                    f"{actual} {kind} attribute(s) present while the decomposition"
+                    f" was set up for {expected}"
+                )
+        self.__maximum_keys = maximum_keys
+
+    def __base_attributes(self):
+        attributes = self.particulator.attributes
+        return (
+            attributes.get_extensive_attribute_storage(),
+            *(attributes[key] for key in self.__maximum_keys),
+            attributes["position in cell"],
+            attributes["n"],
+            attributes["cell origin"],
+        )
+
+    def __float_attributes(self, data):
+        """extensive, maximum and cellular float attributes stacked in mailbox order"""
+        return np.concatenate(
+            (data[0], *(values[np.newaxis, :] for values in data[1:-3]), data[-3])
+        )
+
+    def __send(self):
+        data = tuple(
+            storage.to_ndarray(raw=True) for storage in self.__base_attributes()
+        )
+        floats_data = self.__float_attributes(data)
+        multiplicity, cell_origin = data[-2:]
+        idx = self.particulator.attributes._ParticleAttributes__idx
+        idx = idx.to_ndarray()[: self.particulator.attributes.super_droplet_count]
+        owner = self.decomposition.owner_of(cell_origin[0, idx])
+        counts = self.decomposition["counts"][self.rank]
+        counts[:] = 0
+        for target in range(self.decomposition.n_strips):
+            if target == self.rank:
+                continue
+            emigrants = idx[owner == target]
+            if len(emigrants) > self.decomposition.capacity:
+                raise ValueError(
+                    f"{len(emigrants)} super-droplets migrating from strip {self.rank}"
+                    f" to strip {target} (capacity: {self.decomposition.capacity})"
+                )
+            floats = self.decomposition["float mailbox"][self.rank, target]
+            ints = self.decomposition["int mailbox"][self.rank, target]
+            floats[: len(emigrants)] = floats_data[:, emigrants].T
+            ints[: len(emigrants), 0] = multiplicity[emigrants]
+            ints[: len(emigrants), 1:] = cell_origin[:, emigrants].T
+            counts[target] = len(emigrants)
+            multiplicity[emigrants] = 0
+
+        self.particulator.attributes["n"].upload(multiplicity)
+        self.particulator.attributes.healthy = False
+        self.particulator.attributes.sanitize()
+
+    def __receive(self):
+        counts = self.decomposition["counts"][:, self.rank]
+        slots = self.particulator.attributes.free_slots()
+        if np.sum(counts) > len(slots):
+            raise ValueError(
+                f"{np.sum(counts)} super-droplets migrating to strip {self.rank}"
+                f" exceeding the number of free slots ({len(slots)})"
+            )
+        slots = slots[: np.sum(counts)]
+        if len(slots) == 0:
+            return
+
+        storages = self.__base_attributes()
+        data = tuple(storage.to_ndarray(raw=True) for storage in storages)
+        floats_data = self.__float_attributes(data)
+        multiplicity, cell_origin = data[-2:]
+        offset = 0
+        for source in range(self.decomposition.n_strips):
+            immigrants = slots[offset : offset + counts[source]]
+            floats = self.decomposition["float mailbox"][source, self.rank]
+            ints = self.decomposition["int mailbox"][source, self.rank]
+            floats_data[:, immigrants] = floats[: counts[source]].T
+            multiplicity[immigrants] = ints[: counts[source], 0]
+            cell_origin[:, immigrants] = ints[: counts[source], 1:].T
+            offset += counts[source]
+
+        n_ext = data[0].shape[0]
+        n_max = len(self.__maximum_keys)
+        floats_data = (
+            floats_data[:n_ext],
+            *floats_data[n_ext : n_ext + n_max],
+            floats_data[n_ext + n_max :],
+        )
+        for storage, values in zip(storages, floats_data + (multiplicity, cell_origin)):
+            storage.upload(values)
+        self.particulator.attributes.adopt(slots)
+        self.particulator.recalculate_cell_id()
+        for key in (
+            *self.particulator.attributes.get_extensive_attribute_keys(),
+            *self.__maximum_keys,
+            "n",
+            "cell origin",
+            "position in cell",
+            "cell id",
+        ):
+            self.particulator.attributes.mark_updated(key)
+
+
+class StripFieldExchange:
+    def __init__(self, decomposition, rank: int):
+        self.decomposition = decomposition
+        self.rank = rank
+        self.particulator = None
+
+    def register(self, builder):
+        self.particulator = builder.particulator
+
+    def __call__(self):
+        environment = self.particulator.environment
+        fields = self.decomposition["fields"]
+        cells = slice(*self.decomposition.cell_range(self.rank))
+        try:
+            for i, var in enumerate(("thd", "qv")):
+                fields[i, cells] = environment.get_predicted(var).to_ndarray()[cells]
+            self.decomposition.synchronise()
+            for i, var in enumerate(("thd", "qv")):
+                environment.get_predicted(var).upload(fields[i])
+        except Exception:
+            self.decomposition.barrier.abort()
+            raise
+        self.decomposition.synchronise()
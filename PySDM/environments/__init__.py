@@ -4,5 +4,8 @@ Classes representing particle environment:
 `PySDM.environments.parcel.Parcel`, ...
 """
 from .box import Box
+from .host_coupled import HostCoupled
 from .kinematic_2d import Kinematic2D
+from .multi_parcel import MultiParcel
 from .parcel import Parcel
+from .prescribed_flow_2d import PrescribedFlow2D
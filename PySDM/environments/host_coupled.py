@@ -0,0 +1,86 @@
+"""
+Framework for embedding PySDM as the microphysics component of an external
+(host) dynamical core: the water vapour mixing ratio, potential temperature and
+dry-air density fields are NumPy arrays owned by the host (and, where the backend
+allows it, shared with the environment storages with no copies - in which case
+the host fields are modified in place by the particle-based microphysics),
+the Courant field (if any) is read from host arrays each timestep;
+`step()` advances the particulator by one timestep returning the
+microphysical tendencies of the host fields
+"""
+import numpy as np
+
+from PySDM.environments.impl.moist import Moist
+from PySDM.impl.mesh import Mesh
+
+
+class HostCoupled(Moist):
+    def __init__(
+        self,
+        *,
+        dt,
+        grid,
+        size,
+        qv: np.ndarray,
+        thd: np.ndarray,
+        rhod: np.ndarray,
+        courant_field: tuple = None,
+        mixed_phase=False,
+    ):
+        super().__init__(dt, Mesh(grid, size), ["rhod"], mixed_phase=mixed_phase)
+        self.host_fields = {"qv": qv, "thd": thd, "rhod": rhod}
+        for var, field in self.host_fields.items():
+            if field.shape != tuple(grid):
+                raise ValueError(f"shape of '{var}' inconsistent with grid")
+        self.courant_field = courant_field
+        self.formulae = None
+        self.__tendencies = {var: np.empty(grid) for var in ("qv", "thd")}
+
+    def register(self, builder):
+        super().register(builder)
+        self.formulae = builder.particulator.formulae
+
+        Moist.sync(self)
+        self.notify()
+
+    @property
+    def dv(self):
+        return self.mesh.dv
+
+    def get_qv(self) -> np.ndarray:
+        return self.host_fields["qv"]
+
+    def get_thd(self) -> np.ndarray:
+        return self.host_fields["thd"]
+
+    def _fields(self) -> dict:
+        return {**super()._fields(), "rhod": self.host_fields["rhod"]}
+
+    def sync(self):
+        if (
+            self.courant_field is not None
+            and "Displacement" in self.particulator.dynamics
+        ):
+            self.particulator.dynamics["Displacement"].upload_courant_field(
+                self.courant_field
+            )
+        super().sync()
+
+    def step(self, dt=None) -> dict:
+        """advances the particulator by one timestep (`dt`, if given, has to match
+        the one set at construction) updating the host "qv" and "thd" fields,
+        returns their microphysical tendencies (in arrays overwritten
+        in subsequent calls)"""
+        if dt is not None and dt != self.dt:
+            raise ValueError(f"timestep ({dt}) differs from the one set ({self.dt})")
+        for var, tendency in self.__tendencies.items():
+            tendency[:] = self.host_fields[var]
+
+        self.particulator.run(1)
+
+        for var, tendency in self.__tendencies.items():
+            if not self._shares_memory(var):
+                self[var].download(self.host_fields[var], reshape=True)
+            np.subtract(self.host_fields[var], tendency, out=tendency)
+            tendency /= self.dt
+        return self.__tendencies
@@ -1,5 +1,12 @@
 """
-common logic for environments featuring moist-air thermodynamics
+common logic for environments featuring moist-air thermodynamics;
+where the backend and memory layout allow it, the predicted water vapour mixing ratio
+and potential temperature storages share memory with the fields returned by
+`get_qv()` and `get_thd()` (e.g., advectees of the Eulerian solver) - sparing
+the copies back and forth each timestep (only a snapshot of the fields prior
+to advection is retained, as the predicted state for the remainder of the timestep
+and the current state for the next one; the snapshots are double-buffered so that
+the current state is not overwritten before the end of the timestep)
 """
 from abc import abstractmethod
 
@@ -17,6 +24,8 @@ class Moist:
         self.variables = variables
         self._values = None
         self._tmp = None
+        self.__views = {}
+        self.__snapshots = {}
 
     def register(self, builder):
         self.particulator = builder.particulator
@@ -41,10 +50,33 @@ class Moist:
             )
         return self._values["predicted"][index]
 
+    def __view(self, var, field):
+        view = self.__views.get(var)
+        if not isinstance(field, np.ndarray):
+            return None
+        if view is None or not np.may_share_memory(view.data, field):
+            view = self.particulator.Storage.view_of_ndarray(field)
+            if view is not None and var not in self.__snapshots:
+                self.__snapshots[var] = tuple(
+                    self.particulator.Storage.empty((self.mesh.n_cell,), float)
+                    for _ in range(2)
+                )
+            self.__views[var] = view
+        return view
+
+    def _shares_memory(self, var):
+        """whether the predicted values of `var` share memory with the field
+        returned for it by `_fields()`"""
+        return self.__views.get(var) is not None
+
     def sync(self):
         target = self._tmp
-        target["qv"].ravel(self.get_qv())
-        target["thd"].ravel(self.get_thd())
+        for var, field in self._fields().items():
+            view = self.__view(var, field)
+            if view is None:
+                target[var].ravel(field)
+            else:
+                target[var] = view
 
         self.particulator.backend.temperature_pressure_RH(
             rhod=target["rhod"],
@@ -72,10 +104,38 @@ class Moist:
     def get_thd(self) -> np.ndarray:
         raise NotImplementedError()
 
+    def _fields(self) -> dict:
+        """fields from which the predicted state is taken in `sync()` (sharing
+        memory with the predicted storages where possible)"""
+        return {"qv": self.get_qv(), "thd": self.get_thd()}
+
+    def __take_snapshot(self, var):
+        """copies the predicted values of `var` from the shared-memory view into
+        the one of the two snapshot storages not holding the current values"""
+        first, second = self.__snapshots[var]
+        snapshot = second if self._values["current"][var] is first else first
+        snapshot.ravel(self.__views[var])
+        self._values["predicted"][var] = snapshot
+
+    def download_predicted(self, var, target):
+        """copies predicted values of `var` into `target` (e.g., advectee of
+        the Eulerian solver), or, if the two share memory, retains a snapshot
+        of them to be returned by `get_predicted()` for the remainder of
+        the timestep (and to become the current state)"""
+        predicted = self.get_predicted(var)
+        if predicted is self.__views.get(var):
+            self.__take_snapshot(var)
+        else:
+            predicted.download(target, reshape=True)
+
     def notify(self):
         if self._values["predicted"] is None:
             return
 
+        for var, view in self.__views.items():
+            if self._values["predicted"][var] is view:
+                self.__take_snapshot(var)
+
         self._tmp = self._values["current"]
         self._values["current"] = self._values["predicted"]
         self._values["predicted"] = None
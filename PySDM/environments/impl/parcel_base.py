@@ -0,0 +1,82 @@
+"""
+common logic of `PySDM.environments.parcel.Parcel` and
+ `PySDM.environments.multi_parcel.MultiParcel`: adiabatic parcels of constant mass
+ of dry air (one per cell) with volumes following from the dry-air density
+"""
+import numpy as np
+
+from PySDM.environments.impl.moist import Moist
+
+
+class ParcelBase(Moist):
+    def __init__(
+        self, dt, mesh, *, mass_of_dry_air, p0, q0, T0, z0, mixed_phase
+    ):  # pylint: disable=too-many-arguments
+        super().__init__(dt, mesh, ["rhod", "z", "t"], mixed_phase=mixed_phase)
+
+        self.p0 = p0
+        self.q0 = q0
+        self.T0 = T0
+        self.z0 = z0
+        self.mass_of_dry_air = mass_of_dry_air
+
+        self.formulae = None
+        self.dql = None
+
+    def _parcel_values(self, storage):
+        """returns parcel-state values in the form used for advancing the parcel(s)"""
+        raise NotImplementedError()
+
+    def advance_parcel_vars(self):
+        raise NotImplementedError()
+
+    @property
+    def dv(self):
+        rhod_mean = (
+            self._parcel_values(self.get_predicted("rhod"))
+            + self._parcel_values(self["rhod"])
+        ) / 2
+        return self.formulae.trivia.volume_of_density_mass(
+            rhod_mean, self.mass_of_dry_air
+        )
+
+    def register(self, builder):
+        self.formulae = builder.particulator.formulae
+        pd0 = self.formulae.trivia.p_d(self.p0, self.q0)
+        rhod0 = self.formulae.state_variable_triplet.rhod_of_pd_T(pd0, self.T0)
+        self.mesh.dv = self.formulae.trivia.volume_of_density_mass(
+            rhod0, self.mass_of_dry_air
+        )
+
+        Moist.register(self, builder)
+
+        for var, value in (
+            ("qv", self.q0),
+            ("thd", self.formulae.trivia.th_std(pd0, self.T0)),
+            ("rhod", rhod0),
+            ("z", self.z0),
+            ("t", 0),
+        ):
+            self[var].upload(np.broadcast_to(value, (self.mesh.n_cell,)).astype(float))
+
+        self.sync_parcel_vars()
+        Moist.sync(self)
+        self.notify()
+
+    def get_thd(self):
+        return self["thd"]
+
+    def get_qv(self):
+        return self["qv"]
+
+    def sync_parcel_vars(self):
+        self.dql = self._parcel_values(self._tmp["qv"]) - self._parcel_values(
+            self["qv"]
+        )
+        for var in self.variables:
+            self._tmp[var][:] = self[var][:]
+
+    def sync(self):
+        self.sync_parcel_vars()
+        self.advance_parcel_vars()
+        super().sync()
@@ -26,7 +26,9 @@ class Kinematic1D(Moist):
         self._tmp["rhod"] = rhod
 
     def get_qv(self) -> np.ndarray:
-        return self.particulator.dynamics["EulerianAdvection"].solvers.advectee.get()
+        eulerian_advection = self.particulator.dynamics["EulerianAdvection"]
+        eulerian_advection.wait()
+        return eulerian_advection.solvers.advectee.get()
 
     def get_thd(self) -> np.ndarray:
         return self.thd0
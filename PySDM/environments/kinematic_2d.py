@@ -89,15 +89,16 @@ class Kinematic2D(Moist):
         return attributes
 
     def get_thd(self):
-        return (
-            self.particulator.dynamics["EulerianAdvection"].solvers["th"].advectee.get()
-        )
+        return self.__advection_solvers()["th"].advectee.get()
 
     def get_qv(self):
-        return (
-            self.particulator.dynamics["EulerianAdvection"].solvers["qv"].advectee.get()
-        )
+        return self.__advection_solvers()["qv"].advectee.get()
+
+    def __advection_solvers(self):
+        eulerian_advection = self.particulator.dynamics["EulerianAdvection"]
+        eulerian_advection.wait()
+        return eulerian_advection.solvers
 
     def sync(self):
-        self.particulator.dynamics["EulerianAdvection"].solvers.wait()
+        self.__advection_solvers().wait()
         super().sync()
@@ -0,0 +1,123 @@
+"""
+Set of independent zero-dimensional adiabatic parcels (e.g., differing in updraft
+velocity, aerosol loading or initial thermodynamic state) represented as cells of
+a single particulator - parcel state is integrated with array arithmetic across
+parcels and the condensation solver parallelises over parcels (cells);
+as in `PySDM.environments.parcel.Parcel`, the volume of each parcel follows from its
+(constant) mass of dry air and varying dry-air density (the volume is thus
+an array, and products normalising by it yield per-parcel values)
+"""
+import numpy as np
+
+from PySDM.environments.impl.parcel_base import ParcelBase
+from PySDM.impl.mesh import Mesh
+from PySDM.initialisation.equilibrate_wet_radii import (
+    default_rtol,
+    equilibrate_wet_radii,
+)
+
+
+class MultiParcel(ParcelBase):
+    def __init__(
+        self,
+        *,
+        dt,
+        mass_of_dry_air: [float, np.ndarray],
+        p0: [float, np.ndarray],
+        q0: [float, np.ndarray],
+        T0: [float, np.ndarray],
+        w: [float, np.ndarray, callable],
+        z0: [float, np.ndarray] = 0,
+        n_parcels: int = None,
+        mixed_phase=False,
+    ):
+        """all initial-state parameters can be given either as scalars or as arrays
+        of per-parcel values, `w` can also be a function of time returning
+        either; `n_parcels` needs to be given only if it cannot be inferred
+        from the shapes of the arguments"""
+        shape = np.broadcast(
+            mass_of_dry_air, p0, q0, T0, z0, 0 if callable(w) else w
+        ).shape
+        n_parcels = n_parcels or int(np.prod(shape))
+        if shape not in ((), (n_parcels,)):
+            raise ValueError(f"parameter shapes inconsistent with {n_parcels} parcels")
+
+        self.n_parcels = n_parcels
+        super().__init__(
+            dt,
+            Mesh.mesh_0d(n_cell=n_parcels),
+            mass_of_dry_air=self.__per_parcel(mass_of_dry_air),
+            p0=self.__per_parcel(p0),
+            q0=self.__per_parcel(q0),
+            T0=self.__per_parcel(T0),
+            z0=self.__per_parcel(z0),
+            mixed_phase=mixed_phase,
+        )
+
+        self.w = w if callable(w) else lambda _: w
+
+    def __per_parcel(self, value):
+        return np.broadcast_to(np.asarray(value, dtype=float), (self.n_parcels,)).copy()
+
+    def _parcel_values(self, storage):
+        return storage.to_ndarray()
+
+    def init_attributes(
+        self,
+        *,
+        n_in_dv: np.ndarray,
+        kappa: [float, np.ndarray],
+        r_dry: np.ndarray,
+        rtol=default_rtol,
+    ):
+        """`n_in_dv` and `r_dry` are either 1D arrays (same spectrum in each parcel)
+        or 2D arrays with per-parcel spectra in rows, `kappa` is either a scalar
+        or an array of per-parcel values"""
+        n_sd_per_parcel = np.shape(n_in_dv)[-1]
+        cell_id = np.repeat(np.arange(self.n_parcels), n_sd_per_parcel)
+        shape = (self.n_parcels, n_sd_per_parcel)
+        r_dry = np.broadcast_to(r_dry, shape).ravel()
+        kappa = np.broadcast_to(
+            np.asarray(kappa, dtype=float).reshape(-1, 1), shape
+        ).ravel()
+
+        attributes = {}
+        attributes["dry volume"] = self.formulae.trivia.volume(radius=r_dry)
+        attributes["kappa times dry volume"] = attributes["dry volume"] * kappa
+        attributes["n"] = np.broadcast_to(n_in_dv, shape).ravel()
+        attributes["cell id"] = cell_id
+        r_wet = equilibrate_wet_radii(
+            r_dry=r_dry,
+            environment=self,
+            kappa_times_dry_volume=attributes["kappa times dry volume"],
+            cell_id=cell_id,
+            rtol=rtol,
+        )
+        attributes["volume"] = self.formulae.trivia.volume(radius=r_wet)
+        return attributes
+
+    def advance_parcel_vars(self):
+        dt = self.particulator.dt
+        T = self["T"].to_ndarray()
+        p = self["p"].to_ndarray()
+        t = self["t"].to_ndarray()
+
+        dz_dt = self.w(t[0] + dt / 2)  # "mid-point"
+        qv = self["qv"].to_ndarray() - self.dql / 2
+
+        dql_dz = self.dql / dz_dt / dt
+        lv = self.formulae.latent_heat.lv(T)
+        drho_dz = self.formulae.hydrostatics.drho_dz(
+            self.formulae.constants.g_std, p, T, qv, lv, dql_dz=dql_dz
+        )
+        drhod_dz = drho_dz
+
+        for var, tendency in (("t", 1), ("z", dz_dt), ("rhod", dz_dt * drhod_dz)):
+            self._tmp[var].upload(
+                self.__per_parcel(self._tmp[var].to_ndarray() + dt * tendency)
+            )
+
+        self.mesh.dv = self.formulae.trivia.volume_of_density_mass(
+            (self._tmp["rhod"].to_ndarray() + self["rhod"].to_ndarray()) / 2,
+            self.mass_of_dry_air,
+        )
@@ -1,9 +1,12 @@
 """
-Zero-dimensional adiabatic parcel framework
+Zero-dimensional adiabatic parcel framework; the updraft velocity `w` can be given
+as a constant, as a tabulated profile (a tuple of arrays of times and velocities,
+linearly interpolated) or as a function of time - with the first two, the whole
+update of the parcel state is carried out by one compiled backend call
 """
 import numpy as np
 
-from PySDM.environments.impl.moist import Moist
+from PySDM.environments.impl.parcel_base import ParcelBase
 from PySDM.impl.mesh import Mesh
 from PySDM.initialisation.equilibrate_wet_radii import (
     default_rtol,
@@ -11,7 +14,7 @@ from PySDM.initialisation.equilibrate_wet_radii import (
 )
 
 
-class Parcel(Moist):
+class Parcel(ParcelBase):
     def __init__(
         self,
         *,
@@ -20,53 +23,36 @@ class Parcel(Moist):
         p0: float,
         q0: float,
         T0: float,
-        w: [float, callable],
+        w: [float, tuple, callable],
         z0: float = 0,
         mixed_phase=False,
     ):
         super().__init__(
-            dt, Mesh.mesh_0d(), ["rhod", "z", "t"], mixed_phase=mixed_phase
+            dt,
+            Mesh.mesh_0d(),
+            mass_of_dry_air=mass_of_dry_air,
+            p0=p0,
+            q0=q0,
+            T0=T0,
+            z0=z0,
+            mixed_phase=mixed_phase,
         )
 
-        self.p0 = p0
-        self.q0 = q0
-        self.T0 = T0
-        self.z0 = z0
-        self.mass_of_dry_air = mass_of_dry_air
+        if callable(w):
+            self.w = w
+            self.w_table = (np.empty(0), np.empty(0))
+        else:
+            self.w_table = (
+                tuple(np.asarray(column, dtype=float) for column in w)
+                if isinstance(w, tuple)
+                else (np.zeros(1), np.full(1, w, dtype=float))
+            )
+            self.w = lambda t: np.interp(t, *self.w_table)
 
-        self.w = w if callable(w) else lambda _: w
-
-        self.formulae = None
-        self.dql = None
         self.params = None
 
-    @property
-    def dv(self):
-        rhod_mean = (self.get_predicted("rhod")[0] + self["rhod"][0]) / 2
-        return self.formulae.trivia.volume_of_density_mass(
-            rhod_mean, self.mass_of_dry_air
-        )
-
-    def register(self, builder):
-        self.formulae = builder.particulator.formulae
-        pd0 = self.formulae.trivia.p_d(self.p0, self.q0)
-        rhod0 = self.formulae.state_variable_triplet.rhod_of_pd_T(pd0, self.T0)
-        self.mesh.dv = self.formulae.trivia.volume_of_density_mass(
-            rhod0, self.mass_of_dry_air
-        )
-
-        Moist.register(self, builder)
-
-        params = (self.q0, self.formulae.trivia.th_std(pd0, self.T0), rhod0, self.z0, 0)
-        self["qv"][:] = params[0]
-        self["thd"][:] = params[1]
-        self["rhod"][:] = params[2]
-        self["z"][:] = params[3]
-        self["t"][:] = params[4]
-
-        self.sync_parcel_vars()
-        Moist.sync(self)
-        self.notify()
+    def _parcel_values(self, storage):
+        return storage[0]
 
     def init_attributes(
         self,
@@ -95,42 +81,17 @@ class Parcel(Moist):
 
     def advance_parcel_vars(self):
         dt = self.particulator.dt
-        T = self["T"][0]
-        p = self["p"][0]
-        t = self["t"][0]
-
-        dz_dt = self.w(t + dt / 2)  # "mid-point"
-        qv = self["qv"][0] - self.dql / 2
-
-        dql_dz = self.dql / dz_dt / dt
-        lv = self.formulae.latent_heat.lv(T)
-        drho_dz = self.formulae.hydrostatics.drho_dz(
-            self.formulae.constants.g_std, p, T, qv, lv, dql_dz=dql_dz
+        self.mesh.dv = self.particulator.backend.parcel_advance(
+            t=self._tmp["t"],
+            z=self._tmp["z"],
+            rhod=self["rhod"],
+            T=self["T"],
+            p=self["p"],
+            qv=self["qv"],
+            rhod_new=self._tmp["rhod"],
+            dql=self.dql,
+            dt=dt,
+            dz_dt=np.nan if len(self.w_table[0]) else self.w(self["t"][0] + dt / 2),
+            w_table=self.w_table,
+            m_d=self.mass_of_dry_air,
         )
-        drhod_dz = drho_dz
-
-        self.particulator.backend.explicit_euler(self._tmp["t"], dt, 1)
-        self.particulator.backend.explicit_euler(self._tmp["z"], dt, dz_dt)
-        self.particulator.backend.explicit_euler(
-            self._tmp["rhod"], dt, dz_dt * drhod_dz
-        )
-
-        self.mesh.dv = self.formulae.trivia.volume_of_density_mass(
-            (self._tmp["rhod"][0] + self["rhod"][0]) / 2, self.mass_of_dry_air
-        )
-
-    def get_thd(self):
-        return self["thd"]
-
-    def get_qv(self):
-        return self["qv"]
-
-    def sync_parcel_vars(self):
-        self.dql = self._tmp["qv"][0] - self["qv"][0]
-        for var in self.variables:
-            self._tmp[var][:] = self[var][:]
-
-    def sync(self):
-        self.sync_parcel_vars()
-        self.advance_parcel_vars()
-        super().sync()
@@ -0,0 +1,109 @@
+"""
+Two-dimensional framework with time-varying flow, dry-air density and (optionally)
+water vapour and potential temperature tendencies prescribed from stored
+(e.g., LES or CRM) output; each field is given as a (time, x, z)-shaped array
+or a path to an `.npy` file (memory-mapped and streamed slice by slice, with
+the next slice read ahead in a background thread shared by all the streams
+and shut down with `close()`, see `PySDM.impl.time_slice_stream.TimeSliceStream`),
+values in between the stored times are linearly interpolated; moisture and heat
+advection is handled by [PyMPDATA](http://github.com/atmos-cloud-sim-uj/PyMPDATA/)
+as in `PySDM.environments.kinematic_2d.Kinematic2D`, with the Courant field for
+the current timestep written into the advectors of the solvers (as well as
+uploaded to the `PySDM.dynamics.displacement.Displacement` dynamic and available
+through `get_courant_field_data()`)
+"""
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from PySDM.environments.impl.moist import Moist
+from PySDM.environments.kinematic_2d import Kinematic2D
+from PySDM.impl.time_slice_stream import TimeSliceStream
+
+
+def _stream(field, times, executor):
+    if isinstance(field, (str, os.PathLike)):
+        field = np.load(field, mmap_mode="r")
+    return TimeSliceStream(field, times, executor)
+
+
+class PrescribedFlow2D(Kinematic2D):
+    def __init__(
+        self,
+        *,
+        dt,
+        grid,
+        size,
+        times,
+        courant_field: tuple,
+        rhod,
+        tendencies: dict = None,
+        mixed_phase=False,
+    ):
+        """`courant_field` components are expected to be of shapes
+        (time, nx+1, nz) and (time, nx, nz+1), `tendencies` (rates of change
+        per unit time) are keyed by "qv" and/or "thd" """
+        super().__init__(
+            dt=dt, grid=grid, size=size, rhod_of=None, mixed_phase=mixed_phase
+        )
+        self.__executor = ThreadPoolExecutor(max_workers=1)
+        self.courant_field = tuple(
+            _stream(component, times, self.__executor) for component in courant_field
+        )
+        self.rhod_stream = _stream(rhod, times, self.__executor)
+        self.tendencies = {
+            var: _stream(tendency, times, self.__executor)
+            for var, tendency in (tendencies or {}).items()
+        }
+        for var in self.tendencies:
+            if var not in ("qv", "thd"):
+                raise ValueError(f"tendencies of '{var}' not supported")
+        self.__courant_field_data = None
+
+    def register(self, builder):
+        Moist.register(self, builder)
+        self.formulae = builder.particulator.formulae
+        rhod = self.rhod_stream(0).ravel()
+        for values in (self._values["current"], self._tmp):
+            values["rhod"] = builder.particulator.Storage.from_ndarray(rhod)
+
+    def get_courant_field_data(self):
+        return self.__courant_field_data
+
+    def close(self):
+        """shuts down the thread reading ahead the stored fields"""
+        for stream in (
+            *self.courant_field,
+            self.rhod_stream,
+            *self.tendencies.values(),
+        ):
+            stream.close()
+        self.__executor.shutdown(wait=True)
+
+    def sync(self):
+        """fields for the timestep starting at the current time: dry-air density
+        at the current time, flow and tendencies at the mid-step"""
+        time = self.particulator.n_steps * self.dt
+        mid_step = time + self.dt / 2
+
+        self._tmp["rhod"].upload(self.rhod_stream(time).ravel())
+        self.__courant_field_data = tuple(
+            component(mid_step).copy() for component in self.courant_field
+        )
+        if "Displacement" in self.particulator.dynamics:
+            self.particulator.dynamics["Displacement"].upload_courant_field(
+                self.__courant_field_data
+            )
+        if "EulerianAdvection" in self.particulator.dynamics:
+            eulerian_advection = self.particulator.dynamics["EulerianAdvection"]
+            eulerian_advection.wait()
+            for key in ("th", "qv"):
+                advector = eulerian_advection.solvers[key].advector
+                for i, component in enumerate(self.__courant_field_data):
+                    advector.get_component(i)[:] = component
+        for var, field in (("qv", self.get_qv), ("thd", self.get_thd)):
+            if var in self.tendencies:
+                field()[:] += self.dt * self.tendencies[var](mid_step)
+
+        super().sync()
@@ -53,6 +53,7 @@ class Formulae:
         self.seed = seed
         self.fastmath = fastmath
         dimensional_analysis = physics.impl.flag.DIMENSIONAL_ANALYSIS
+        self._dimensional_analysis = dimensional_analysis
 
         self.trivia = _magick(
             "Trivia", physics.trivia, fastmath, constants, dimensional_analysis
@@ -145,9 +146,25 @@ class Formulae:
             dimensional_analysis,
         )
 
+    @property
+    def cache_key(self) -> tuple:
+        """canonical (hashable) description of what jit-compiled code depends on:
+        physics option names, constants and compilation flags (the random seed
+        is excluded) - equal keys mean interchangeable compiled code"""
+        return (
+            self.fastmath,
+            self._dimensional_analysis,
+            self.constants,
+            *(
+                (attr, value.__name__)
+                for attr, value in sorted(vars(self).items())
+                if isinstance(value, SimpleNamespace)
+            ),
+        )
+
     def __str__(self):
         description = []
-        for attr in dir(self):
+        for attr in sorted(vars(self)):
             if not attr.startswith("_"):
                 attr_value = getattr(self, attr)
                 if attr_value.__class__ in (bool, int, float):
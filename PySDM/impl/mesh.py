@@ -25,8 +25,9 @@ class Mesh:
         return self.dimension
 
     @staticmethod
-    def mesh_0d(dv=None):
-        mesh = Mesh((1,), ())
+    def mesh_0d(dv=None, n_cell=1):
+        """`n_cell > 1` denotes a set of independent zero-dimensional cells"""
+        mesh = Mesh((n_cell,), ())
         mesh.dv = dv
         return mesh
 
@@ -0,0 +1,206 @@
+"""
+fusion of the statistical-moment requests issued by products
+ (`PySDM.products.impl.moment_product.MomentProduct` and
+ `PySDM.products.impl.spectrum_moment_product.SpectrumMomentProduct`):
+ requests are grouped by the filter attribute & range (or bins) and the weighting,
+ each group is evaluated in a single pass over super-droplets covering all the
+ ranks requested so far within the group (by any product; for spectra, one pass
+ per attribute if the ranks requested concern several attributes), and the downloaded
+ results are kept for subsequent requests until the particle state changes
+ (i.e., until the next timestep, a change in the super-droplet count or in the
+ timestamps of the attributes involved)
+"""
+import numpy as np
+
+from PySDM.backends.impl_common.bin_spacing import ARBITRARY
+
+MAX_GROUPS = 64
+
+
+class _Group:  # pylint: disable=too-few-public-methods
+    def __init__(self, key, spectral):
+        self.key = key
+        self.spectral = spectral
+        self.requests = []
+        self.stamp = None
+        self.storages = None
+        self.results = None
+
+
+class MomentPlanner:
+    def __init__(self, particulator):
+        self.particulator = particulator
+        self.n_passes = 0
+        self.__moment_groups = {}
+        self.__spectrum_groups = {}
+
+    def invalidate(self):
+        """to be called if attribute values were altered in between timesteps
+        without marking them as updated (see `ParticleAttributes.mark_updated()`)"""
+        for groups in (self.__moment_groups, self.__spectrum_groups):
+            for group in groups.values():
+                group.stamp = None
+
+    def moment(
+        self,
+        *,
+        attr,
+        rank,
+        filter_attr="volume",
+        filter_range=(-np.inf, np.inf),
+        weighting_attribute="volume",
+        weighting_rank=0,
+        skip_division_by_m0=False,
+    ) -> np.ndarray:
+        """returns (a read-only view of) per-cell moment of given `rank` - the zeroth
+        moment if `rank` is zero (TODO #217), normalised by it otherwise
+        (unless `skip_division_by_m0`)"""
+        group = self.__group(
+            self.__moment_groups,
+            (
+                attr,
+                filter_attr,
+                tuple(float(bound) for bound in filter_range),
+                weighting_attribute,
+                weighting_rank,
+            ),
+            request=rank if rank != 0 else None,
+        )
+        if group.stamp != self.__stamp(group):
+            self.__evaluate_moments(group)
+        moment_0, moments = group.results
+        if rank == 0:
+            return moment_0
+        moments = moments[group.requests.index(rank)]
+        if skip_division_by_m0:
+            return moments
+        return np.divide(
+            moments, moment_0, out=np.zeros_like(moments), where=moment_0 != 0
+        )
+
+    def spectrum(
+        self,
+        *,
+        attr,
+        rank,
+        attr_bins,
+        attr_bins_spacing=ARBITRARY,
+        filter_attr="volume",
+        weighting_attribute="volume",
+        weighting_rank=0,
+    ) -> tuple:
+        """returns a tuple of (read-only views of) the binned zeroth moment and,
+        for non-zero `rank`, the binned moment of given rank normalised by it
+        (None otherwise), both shaped (n_bins, n_cell)"""
+        group = self.__group(
+            self.__spectrum_groups,
+            (
+                attr_bins.to_ndarray().tobytes(),
+                filter_attr,
+                weighting_attribute,
+                weighting_rank,
+            ),
+            request=(attr, rank) if rank != 0 else None,
+        )
+        if group.stamp != self.__stamp(group):
+            self.__evaluate_spectra(group, attr_bins, attr_bins_spacing)
+        moment_0, moments = group.results
+        if rank == 0:
+            return moment_0, None
+        return moment_0, moments[group.requests.index((attr, rank))]
+
+    def __group(self, groups, key, request):
+        if key not in groups:
+            if len(groups) == MAX_GROUPS:
+                del groups[next(iter(groups))]
+            groups[key] = _Group(key, spectral=groups is self.__spectrum_groups)
+        group = groups[key]
+        if request is not None and request not in group.requests:
+            group.requests.append(request)
+            group.stamp = None
+        return group
+
+    def __stamp(self, group):
+        if group.spectral:
+            _, filter_attr, weighting_attribute, _ = group.key
+            names = (filter_attr, weighting_attribute) + tuple(
+                attr for attr, _ in group.requests
+            )
+        else:
+            attr, filter_attr, _, weighting_attribute, _ = group.key
+            names = (attr, filter_attr, weighting_attribute)
+        attributes = self.particulator.attributes
+        stamp = [self.particulator.n_steps, attributes.super_droplet_count]
+        for name in ("n", "cell id") + names:
+            _ = attributes[name]  # updates derived attributes
+            stamp.append(attributes.get_timestamp(name))
+        return tuple(stamp)
+
+    def __evaluate_moments(self, group):
+        attr, filter_attr, filter_range, weighting_attribute, weighting_rank = group.key
+        ranks = tuple(group.requests) or (0,)
+        n_cell = self.particulator.mesh.n_cell
+        if group.storages is None or group.storages[1].shape[0] != len(ranks):
+            group.storages = (
+                self.particulator.Storage.empty(n_cell, dtype=float),
+                self.particulator.Storage.empty((len(ranks), n_cell), dtype=float),
+            )
+        self.particulator.moments(
+            moment_0=group.storages[0],
+            moments=group.storages[1],
+            specs={attr: ranks},
+            attr_name=filter_attr,
+            attr_range=filter_range,
+            weighting_attribute=weighting_attribute,
+            weighting_rank=weighting_rank,
+            skip_division_by_m0=True,
+        )
+        self.n_passes += 1
+        group.results = tuple(storage.to_ndarray() for storage in group.storages)
+        for result in group.results:
+            result.flags.writeable = False
+        group.stamp = self.__stamp(group)
+
+    def __evaluate_spectra(self, group, attr_bins, attr_bins_spacing):
+        """all ranks requested for a given attribute are evaluated in a single pass
+        (i.e., one pass per group unless the group spans several attributes)"""
+        _, filter_attr, weighting_attribute, weighting_rank = group.key
+        requests = group.requests or [(filter_attr, 0)]
+        ranks = {}
+        for attr, rank in requests:
+            ranks.setdefault(attr, []).append(rank)
+        shape = (attr_bins.shape[0] - 1, self.particulator.mesh.n_cell)
+        if group.storages is None or any(
+            group.storages[1].get(attr) is None
+            or group.storages[1][attr].shape[0] != len(attr_ranks)
+            for attr, attr_ranks in ranks.items()
+        ):
+            group.storages = (
+                self.particulator.Storage.empty(shape, dtype=float),
+                {
+                    attr: self.particulator.Storage.empty(
+                        (len(attr_ranks), *shape), dtype=float
+                    )
+                    for attr, attr_ranks in ranks.items()
+                },
+            )
+        moments = np.empty((len(requests), *shape))
+        for attr, attr_ranks in ranks.items():
+            self.particulator.spectrum_moments(
+                moment_0=group.storages[0],
+                moments=group.storages[1][attr],
+                attr=attr,
+                rank=tuple(attr_ranks),
+                attr_bins=attr_bins,
+                attr_bins_spacing=attr_bins_spacing,
+                attr_name=filter_attr,
+                weighting_attribute=weighting_attribute,
+                weighting_rank=weighting_rank,
+            )
+            self.n_passes += 1
+            for rank, values in zip(attr_ranks, group.storages[1][attr].to_ndarray()):
+                moments[requests.index((attr, rank))] = values
+        group.results = (group.storages[0].to_ndarray(), moments)
+        for result in group.results:
+            result.flags.writeable = False
+        group.stamp = self.__stamp(group)
@@ -2,6 +2,7 @@
 logic for handling particle attributes within
  `PySDM.particulator.Particulator`
 """
+from contextlib import contextmanager
 from typing import Dict
 
 import numpy as np
@@ -36,6 +37,12 @@ class ParticleAttributes:
         self.__sorted = False
         self.__attributes = attributes
 
+        self.__storage = particulator.Storage
+        self.__tracking_cell_changes = False
+        self.__cell_changes_epoch = 0
+        self.__cell_changes = None
+        self.__reads = None
+
     @property
     def cell_start(self):
         if not self.__sorted:
@@ -53,6 +60,9 @@ class ParticleAttributes:
     def mark_updated(self, key):
         self.__attributes[key].mark_updated()
 
+    def get_timestamp(self, key):
+        return self.__attributes[key].timestamp
+
     def sanitize(self):
         if not self.healthy:
             self.__idx.length = self.__valid_n_sd
@@ -61,6 +71,57 @@ class ParticleAttributes:
             self.healthy = True
             self.__healthy_memory[:] = 1
             self.__sorted = False
+            self.__tracking_cell_changes = False
+
+    def track_cell_changes(self):
+        """to be called before a backend kernel changes "cell id" of super-droplets
+        without reordering them; returns a tuple of: per-super-droplet epoch
+        markers (indexed by particle id), current epoch, storage for positions
+        (in the permutation array) of super-droplets that changed cell, and their
+        count (storages sized to the total number of slots, so as to remain valid
+        after removal or adoption of super-droplets) - to be filled by
+        the kernel and used for sorting by cell incrementally; returns None if
+        the super-droplets are not sorted by cell (full sort due anyway)"""
+        if self.__sorted:
+            if self.__cell_changes is None:
+                n_sd = self.__idx.shape[0]
+                self.__cell_changes = (
+                    self.__storage.from_ndarray(np.zeros(n_sd, dtype=np.int64)),
+                    self.__storage.from_ndarray(np.zeros(n_sd, dtype=np.int64)),
+                    self.__storage.from_ndarray(np.zeros(1, dtype=np.int64)),
+                )
+            self.__cell_changes_epoch += 1
+            self.__cell_changes[2][:] = 0
+            self.__tracking_cell_changes = True
+        if not self.__tracking_cell_changes:
+            return None
+        epoch_markers, positions, count = self.__cell_changes
+        return epoch_markers, self.__cell_changes_epoch, positions, count
+
+    def mark_cell_id_changed(self, tracked=False):
+        """to be called after "cell id" was changed, with `tracked=True` if
+        the changes were recorded in storages returned by `track_cell_changes()`"""
+        self.__sorted = False
+        if not tracked:
+            self.__tracking_cell_changes = False
+
+    def free_slots(self):
+        """indices of storage slots not occupied by any super-droplet (e.g., ones
+        removed due to precipitation or ones with zero initial multiplicity)"""
+        free = np.ones(self.__idx.shape[0], dtype=bool)
+        free[self.__idx.to_ndarray()[: self.__valid_n_sd]] = False
+        return np.flatnonzero(free)
+
+    def adopt(self, slots):
+        """appends super-droplets occupying (previously free) storage `slots`,
+        values of their attributes are expected to have been set beforehand"""
+        idx = self.__idx.to_ndarray()
+        idx[self.__valid_n_sd : self.__valid_n_sd + len(slots)] = slots
+        self.__idx.upload(idx)
+        self.__valid_n_sd += len(slots)
+        self.__idx.length = self.__valid_n_sd
+        self.__sorted = False
+        self.__tracking_cell_changes = False
 
     def cut_working_length(self, length):
         assert length <= len(self.__idx)
@@ -72,6 +133,17 @@ class ParticleAttributes:
     def reset_working_length(self):
         self.__idx.length = self.__valid_n_sd
 
+    @contextmanager
+    def permuted(self, idx, length):
+        """temporarily replaces the particle permutation array with `idx`
+        (of the same size) and the working length with `length`"""
+        data, working_length = self.__idx.data, self.__idx.length
+        self.__idx.data, self.__idx.length = idx.data, length
+        try:
+            yield
+        finally:
+            self.__idx.data, self.__idx.length = data, working_length
+
     def reset_cell_idx(self):
         self.cell_idx.reset_index()
         self.__sort_by_cell_id()
@@ -80,8 +152,21 @@ class ParticleAttributes:
         return self.__attributes.keys()
 
     def __getitem__(self, item):
+        if self.__reads is not None:
+            self.__reads.add(item)
         return self.__attributes[item].get()
 
+    @contextmanager
+    def recording_reads(self):
+        """yields a set collecting names of attributes accessed within the context"""
+        outer_reads, self.__reads = self.__reads, set()
+        try:
+            yield self.__reads
+        finally:
+            if outer_reads is not None:
+                outer_reads.update(self.__reads)
+            self.__reads = outer_reads
+
     def __contains__(self, key):
         return key in self.__attributes
 
@@ -93,12 +178,23 @@ class ParticleAttributes:
         else:
             self.__idx.shuffle(u01)
             self.__sorted = False
+            self.__tracking_cell_changes = False
 
     def __sort_by_cell_id(self):
-        self.__cell_caretaker(
-            self["cell id"], self.cell_idx, self.__cell_start, self.__idx
-        )
+        if self.__tracking_cell_changes:
+            self.__cell_caretaker(
+                self["cell id"],
+                self.cell_idx,
+                self.__cell_start,
+                self.__idx,
+                movers=self.__cell_changes[1:],
+            )
+        else:
+            self.__cell_caretaker(
+                self["cell id"], self.cell_idx, self.__cell_start, self.__idx
+            )
         self.__sorted = True
+        self.__tracking_cell_changes = False
 
     def get_extensive_attribute_storage(self):
         return self.__extensive_attribute_storage
@@ -0,0 +1,132 @@
+"""
+shared-memory decomposition of a 2D domain into vertical strips (contiguous ranges
+of columns), each owned by a separate worker process running its own
+`PySDM.particulator.Particulator` - the object holds the
+`multiprocessing.shared_memory` buffers through which workers exchange super-droplets
+crossing strip boundaries and the Eulerian fields predicted in their strips
+(see `PySDM.dynamics.strip_exchange`); it is meant to be created in the parent
+process and passed to the workers (pickling carries only the buffer names)
+"""
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from PySDM.initialisation.discretise_multiplicities import discretise_multiplicities
+
+
+class StripDecomposition:
+    def __init__(
+        self,
+        *,
+        grid: tuple,
+        n_strips: int,
+        n_extensive_attributes: int,
+        capacity: int,
+        barrier,
+        n_maximum_attributes: int = 0,
+    ):
+        """`capacity` is the maximal number of super-droplets migrating from one strip
+        to another within a timestep; `barrier` is a `multiprocessing.Barrier`
+        for `n_strips` parties; `n_extensive_attributes` and `n_maximum_attributes`
+        are the numbers of attributes of the respective kinds (see
+        `PySDM.attributes.impl`) migrating with the super-droplets"""
+        assert len(grid) == 2
+        assert 0 < n_strips <= grid[0]
+        self.grid = tuple(grid)
+        self.n_strips = n_strips
+        self.n_extensive_attributes = n_extensive_attributes
+        self.n_maximum_attributes = n_maximum_attributes
+        self.capacity = capacity
+        self.barrier = barrier
+        self.bounds = np.linspace(0, grid[0], n_strips + 1).astype(np.int64)
+        self.__shm = {
+            name: shared_memory.SharedMemory(
+                create=True,
+                size=max(1, int(np.prod(shape)) * np.dtype(dtype).itemsize),
+            )
+            for name, (shape, dtype) in self.__layout().items()
+        }
+        self.__arrays = self.__map()
+
+    def __layout(self):
+        n_cell = self.grid[0] * self.grid[1]
+        mailbox = (self.n_strips, self.n_strips, self.capacity)
+        return {
+            "counts": ((self.n_strips, self.n_strips), np.int64),
+            # extensive and maximum attributes followed by position in cell
+            "float mailbox": (
+                mailbox
+                + (self.n_extensive_attributes + self.n_maximum_attributes + 2,),
+                float,
+            ),
+            # multiplicity followed by cell origin
+            "int mailbox": (mailbox + (1 + 2,), np.int64),
+            "fields": ((2, n_cell), float),
+        }
+
+    def __map(self):
+        return {
+            name: np.ndarray(shape, dtype=dtype, buffer=self.__shm[name].buf)
+            for name, (shape, dtype) in self.__layout().items()
+        }
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_StripDecomposition__shm"] = {
+            name: shm.name for name, shm in self.__shm.items()
+        }
+        del state["_StripDecomposition__arrays"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.__shm = {
+            name: shared_memory.SharedMemory(name=shm_name)
+            for name, shm_name in self.__shm.items()
+        }
+        self.__arrays = self.__map()
+
+    def __getitem__(self, name):
+        return self.__arrays[name]
+
+    def owner_of(self, column):
+        """rank of the worker owning given column(s) of the grid"""
+        return np.searchsorted(self.bounds, column, side="right") - 1
+
+    def cell_range(self, rank):
+        """owned (contiguous in C-order) range of cell ids"""
+        return self.bounds[rank] * self.grid[1], self.bounds[rank + 1] * self.grid[1]
+
+    def select(self, rank, attributes: dict, n_sd: int) -> dict:
+        """subset of (domain-wide) initial `attributes` lying within the strip
+        of worker `rank`, padded with zero-multiplicity entries up to `n_sd`
+        (leaving room for immigrating super-droplets; the padding is removed
+        by `PySDM.impl.particle_attributes.ParticleAttributes.sanitize`)"""
+        mask = self.owner_of(attributes["cell origin"][0]) == rank
+        n_pad = n_sd - np.count_nonzero(mask)
+        if n_pad < 0:
+            raise ValueError(f"n_sd={n_sd} too small for strip {rank}")
+        result = {}
+        for key, value in attributes.items():
+            value = np.asarray(value)[..., mask]
+            if key == "n":
+                value = discretise_multiplicities(value)
+            padding = np.zeros(value.shape[:-1] + (n_pad,), dtype=value.dtype)
+            if key == "cell origin":
+                padding[0] = self.bounds[rank]
+            result[key] = np.concatenate((value, padding), axis=-1)
+        return result
+
+    def synchronise(self):
+        self.barrier.wait()
+
+    def close(self):
+        """to be called in each process once done with the buffers"""
+        self.__arrays = {}
+        for shm in self.__shm.values():
+            shm.close()
+
+    def unlink(self):
+        """to be called once, in the parent process, after the workers are done"""
+        for shm in self.__shm.values():
+            shm.unlink()
@@ -0,0 +1,86 @@
+"""
+linear-in-time interpolation of (time, ...)-shaped arrays (e.g., `numpy.memmap`
+instances mapping files larger than the available memory) with only the
+two time slices bracketing the requested time and the next one (read ahead in
+a background thread) loaded into memory; the thread pool can be shared between
+streams (e.g., all streams of an environment) and needs to be shut down with
+`close()` (or by using the stream as a context manager) if owned by the stream
+"""
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+
+class TimeSliceStream:
+    def __init__(self, data, times, executor: ThreadPoolExecutor = None):
+        self.data = data
+        self.times = np.asarray(times, dtype=float)
+        if self.times.shape != (data.shape[0],):
+            raise ValueError("times shape inconsistent with the leading dimension")
+        if (np.diff(self.times) <= 0).any():
+            raise ValueError("times not increasing")
+        self.__slices = {}
+        self.__prefetch = None
+        self.__owns_executor = executor is None
+        self.__executor = executor or ThreadPoolExecutor(max_workers=1)
+        self.__buffer = np.empty(data.shape[1:])
+
+    def __read(self, index):
+        return np.array(self.data[index], dtype=float)
+
+    def __slice(self, index):
+        if index not in self.__slices:
+            if self.__prefetch is not None and self.__prefetch[0] == index:
+                self.__slices[index] = self.__prefetch[1].result()
+                self.__prefetch = None
+            else:
+                self.__slices[index] = self.__read(index)
+        return self.__slices[index]
+
+    def __call__(self, time) -> np.ndarray:
+        """values at `time` (constant extrapolation outside of `times`) written into
+        a buffer overwritten in subsequent calls"""
+        n_slices = len(self.times)
+        if n_slices == 1:
+            self.__buffer[:] = self.__slice(0)
+            return self.__buffer
+
+        i = int(
+            np.clip(
+                np.searchsorted(self.times, time, side="right") - 1, 0, n_slices - 2
+            )
+        )
+        weight = np.clip(
+            (time - self.times[i]) / (self.times[i + 1] - self.times[i]), 0, 1
+        )
+        for index in tuple(self.__slices):
+            if index not in (i, i + 1):
+                del self.__slices[index]
+        left, right = self.__slice(i), self.__slice(i + 1)
+        np.multiply(left, 1 - weight, out=self.__buffer)
+        self.__buffer += weight * right
+
+        if self.__prefetch is not None and not i <= self.__prefetch[0] <= i + 2:
+            self.__prefetch[1].cancel()
+            self.__prefetch = None
+        if i + 2 < n_slices and self.__prefetch is None:
+            self.__prefetch = (i + 2, self.__executor.submit(self.__read, i + 2))
+        return self.__buffer
+
+    def close(self):
+        """cancels pending read-ahead and shuts down the thread pool if owned"""
+        if self.__prefetch is not None:
+            self.__prefetch[1].cancel()
+            self.__prefetch = None
+        if self.__owns_executor:
+            self.__executor.shutdown(wait=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+    @property
+    def n_slices_in_memory(self):
+        return len(self.__slices) + (self.__prefetch is not None)
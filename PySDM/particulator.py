@@ -4,10 +4,12 @@ The very class exposing `PySDM.particulator.Particulator.run()` method for launc
 import numpy as np
 
 from PySDM.backends.impl_common.backend_methods import BackendMethods
+from PySDM.backends.impl_common.bin_spacing import ARBITRARY
 from PySDM.backends.impl_common.index import make_Index
 from PySDM.backends.impl_common.indexed_storage import make_IndexedStorage
 from PySDM.backends.impl_common.pair_indicator import make_PairIndicator
 from PySDM.backends.impl_common.pairwise_storage import make_PairwiseStorage
+from PySDM.impl.moment_planner import MomentPlanner
 from PySDM.impl.particle_attributes import ParticleAttributes
 
 
@@ -39,6 +41,7 @@ class Particulator:  # pylint: disable=too-many-public-methods
         )
 
         self.timers = {}
+        self.moment_planner = MomentPlanner(self)
         self.null = self.Storage.empty(0, dtype=float)
 
     def run(self, steps):
@@ -101,7 +104,19 @@ class Particulator:  # pylint: disable=too-many-public-methods
             RH=self.environment.get_predicted("RH"),
         )
 
-    def condensation(self, *, rtol_x, rtol_thd, counters, RH_max, success, cell_order):
+    def condensation(
+        self,
+        *,
+        rtol_x,
+        rtol_thd,
+        counters,
+        RH_max,
+        success,
+        cell_order,
+        n_iterations,
+        dx_guess,
+        ml,
+    ):
         self.backend.condensation(
             solver=self.condensation_solver,
             n_cell=self.mesh.n_cell,
@@ -128,6 +143,9 @@ class Particulator:  # pylint: disable=too-many-public-methods
             RH_max=RH_max,
             success=success,
             cell_id=self.attributes["cell id"],
+            n_iterations=n_iterations,
+            dx_guess=dx_guess,
+            ml=ml,
         )
 
     def collision_coalescence_breakup(
@@ -283,7 +301,7 @@ class Particulator:  # pylint: disable=too-many-public-methods
             self.attributes["cell origin"],
             self.backend.Storage.from_ndarray(self.environment.mesh.strides),
         )
-        self.attributes._ParticleAttributes__sorted = False
+        self.attributes.mark_cell_id_changed()
 
     def sort_within_pair_by_attr(self, is_first_in_pair, attr_name):
         self.backend.sort_within_pair_by_attr(
@@ -347,8 +365,16 @@ class Particulator:  # pylint: disable=too-many-public-methods
         attr_name="volume",
         weighting_attribute="volume",
         weighting_rank=0,
+        attr_bins_spacing=ARBITRARY,
     ):
+        """`attr_bins_spacing` (see `PySDM.backends.impl_common.bin_spacing`)
+        selects the bin lookup method (direct index computation for uniformly
+        spaced bins, binary search otherwise); `rank` can be a tuple of ranks, all
+        evaluated in a single pass, with `moments` shaped (n_ranks, n_bins, n_cell)"""
         attr_data = self.attributes[attr]
+        ranks = self.backend.Storage.from_ndarray(
+            np.atleast_1d(np.asarray(rank, dtype=float))
+        )
         self.backend.spectrum_moments(
             moment_0=moment_0,
             moments=moments,
@@ -357,8 +383,9 @@ class Particulator:  # pylint: disable=too-many-public-methods
             cell_id=self.attributes["cell id"],
             idx=self.attributes._ParticleAttributes__idx,
             length=self.attributes.super_droplet_count,
-            rank=rank,
+            ranks=ranks,
             x_bins=attr_bins,
+            x_bins_spacing=attr_bins_spacing,
             x_attr=self.attributes[attr_name],
             weighting_attribute=self.attributes[weighting_attribute],
             weighting_rank=weighting_rank,
@@ -401,8 +428,58 @@ class Particulator:  # pylint: disable=too-many-public-methods
         )
         self.attributes.sanitize()
 
+    def displacement_substep(
+        self,
+        *,
+        displacement,
+        courant,
+        n_substeps,
+        substep,
+        enable_sedimentation,
+        precipitation_counting_level_index,
+    ) -> float:
+        cell_changes = self.attributes.track_cell_changes()
+        rainfall = self.backend.displacement_substep(
+            courant=courant,
+            displacement=displacement,
+            cell_origin=self.attributes["cell origin"],
+            position_in_cell=self.attributes["position in cell"],
+            cell_id=self.attributes["cell id"],
+            strides=self.environment.mesh.strides,
+            grid=np.asarray(self.environment.mesh.grid, dtype=np.int64),
+            idx=self.attributes._ParticleAttributes__idx,
+            length=self.attributes.super_droplet_count,
+            healthy=self.attributes._ParticleAttributes__healthy_memory,
+            volume=self.attributes["volume"],
+            multiplicity=self.attributes["n"],
+            terminal_velocity=self.attributes["terminal velocity"]
+            if enable_sedimentation
+            else None,
+            n_substeps=n_substeps,
+            substep=substep,
+            dt=self.dt,
+            dz=self.mesh.dz,
+            enable_sedimentation=enable_sedimentation,
+            precipitation_counting_level_index=precipitation_counting_level_index,
+            domain_top_level_index=self.mesh.grid[-1],
+            cell_changes=cell_changes,
+        )
+        self.attributes.healthy = bool(
+            self.attributes._ParticleAttributes__healthy_memory
+        )
+        self.attributes.sanitize()
+        self.attributes.mark_cell_id_changed(tracked=cell_changes is not None)
+        return rainfall
+
     def calculate_displacement(
-        self, *, displacement, courant, cell_origin, position_in_cell, n_substeps
+        self,
+        *,
+        displacement,
+        courant,
+        cell_origin,
+        position_in_cell,
+        n_substeps,
+        substep=0,
     ):
         for dim in range(len(self.environment.mesh.grid)):
             self.backend.calculate_displacement(
@@ -412,4 +489,5 @@ class Particulator:  # pylint: disable=too-many-public-methods
                 cell_origin=cell_origin,
                 position_in_cell=position_in_cell,
                 n_substeps=n_substeps,
+                substep=substep,
             )
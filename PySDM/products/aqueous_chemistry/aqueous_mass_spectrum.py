@@ -21,6 +21,7 @@ class AqueousMassSpectrum(SpectrumMomentProduct):
             Substance.from_formula(AQUEOUS_COMPOUNDS[key][0]).mass * si.g / si.mole
         )
         self.specific = specific
+        self.d_log10_diameter = None
 
     def register(self, builder):
         builder.request_attribute("dry volume")
@@ -33,27 +34,23 @@ class AqueousMassSpectrum(SpectrumMomentProduct):
             dry_volume_bins_edges
         )
 
+        self.d_log10_diameter = np.diff(np.log10(2 * self.dry_radius_bins_edges))
+
         super().register(builder)
 
         self.shape = (*builder.particulator.mesh.grid, len(self.attr_bins_edges) - 1)
 
     def _impl(self, **kwargs):
-        vals = np.empty([self.particulator.mesh.n_cell, len(self.attr_bins_edges) - 1])
         self._recalculate_spectrum_moment(
             attr=f"moles_{self.key}", rank=1, filter_attr="dry volume"
         )
-
-        for i in range(vals.shape[1]):
-            self._download_spectrum_moment_to_buffer(rank=1, bin_number=i)
-            vals[:, i] = self.buffer.ravel()
-            self._download_spectrum_moment_to_buffer(rank=0, bin_number=i)
-            vals[:, i] *= self.buffer.ravel()
-        d_log10_diameter = np.diff(np.log10(2 * self.dry_radius_bins_edges))
-        vals *= self.molar_mass / d_log10_diameter / self.particulator.mesh.dv
+        vals = self._download_spectrum_moment(rank=1)
+        vals *= self.moment_0.T
+        vals *= self.molar_mass / self.d_log10_diameter / self.particulator.mesh.dv
 
         if self.specific:
             self._download_to_buffer(self.particulator.environment["rhod"])
-            vals[:] /= self.buffer
+            vals /= self.buffer.ravel()[:, np.newaxis]
         return vals
 
 
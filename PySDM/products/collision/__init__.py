@@ -1,7 +1,14 @@
 """
 Collision rate products for breakup, coalescence, and collisions
+ as well as collision numerics diagnostics (timesteps, histograms, pair acceptance)
 """
 
+from .collision_histograms import (
+    CollisionGammaHistogram,
+    CollisionProbabilityHistogram,
+    CollisionSubstepHistogram,
+)
+from .collision_pair_acceptance_fraction import CollisionPairAcceptanceFraction
 from .collision_rates import (  # BreakupOnlyRatePerGridbox,; CoalescenceOnlyRatePerGridbox,
     BreakupRateDeficitPerGridbox,
     BreakupRatePerGridbox,
@@ -0,0 +1,90 @@
+"""
+Per-gridbox histograms accumulated by the `PySDM.dynamics.collisions.collision.Collision`
+ dynamic for tuning its numerical settings (`dt_coal_range`, `substeps`, `optimized_random`):
+ gamma values (number of collisions per candidate pair, with gamma>1 denoting
+ the multiple-collision path), collision probabilities and the number of substeps
+ taken within a timestep (fetching a value resets the histogram)
+"""
+from abc import abstractmethod
+
+import numpy as np
+
+from PySDM.products.impl.product import Product
+
+
+class _CollisionHistogram(Product):
+    def __init__(self, name, unit):
+        super().__init__(name=name, unit=unit)
+        self.collision = None
+
+    def register(self, builder):
+        super().register(builder)
+        self.collision = self.particulator.dynamics["Collision"]
+        self._request()
+        self.shape = (*self.particulator.mesh.grid, self._histogram.shape[0])
+
+    @abstractmethod
+    def _request(self):
+        raise NotImplementedError()
+
+    @property
+    @abstractmethod
+    def _histogram(self):
+        raise NotImplementedError()
+
+    def _impl(self, **kwargs):
+        histogram = self._histogram
+        if isinstance(histogram, np.ndarray):
+            vals = histogram.astype(float)
+        else:
+            vals = histogram.to_ndarray().astype(float)
+        histogram[:] = 0
+        return np.squeeze(vals.T.reshape(self.shape))
+
+
+class CollisionGammaHistogram(_CollisionHistogram):
+    """bin `k` counts candidate pairs for which gamma equalled `k`
+    (before limiting by multiplicity ratio), last bin is an overflow bin"""
+
+    def __init__(self, n_bins=8, name=None, unit="dimensionless"):
+        super().__init__(name=name, unit=unit)
+        self.n_bins = n_bins
+
+    def _request(self):
+        self.collision.request_gamma_histogram(self.n_bins)
+
+    @property
+    def _histogram(self):
+        return self.collision.stats_gamma_histogram
+
+
+class CollisionProbabilityHistogram(_CollisionHistogram):
+    """histogram of collision probabilities of candidate pairs; probability
+    quantiles can be estimated from its cumulative sum along the last axis"""
+
+    def __init__(self, prob_bins_edges, name=None, unit="dimensionless"):
+        super().__init__(name=name, unit=unit)
+        self.prob_bins_edges = prob_bins_edges
+
+    def _request(self):
+        self.collision.request_prob_histogram(self.prob_bins_edges)
+
+    @property
+    def _histogram(self):
+        return self.collision.stats_prob_histogram
+
+
+class CollisionSubstepHistogram(_CollisionHistogram):
+    """bin `k` counts timesteps in which `k` substeps were taken,
+    last bin is an overflow bin"""
+
+    def __init__(self, n_bins=32, name=None, unit="dimensionless"):
+        super().__init__(name=name, unit=unit)
+        self.n_bins = n_bins
+
+    def _request(self):
+        self.collision.request_substep_histogram(self.n_bins)
+
+    @property
+    def _histogram(self):
+        return self.collision.stats_substep_histogram
@@ -0,0 +1,27 @@
+"""
+Fraction of candidate pairs which underwent a collision in the
+ `PySDM.dynamics.collisions.collision.Collision` dynamic, accumulated over all
+ substeps and timesteps since last fetch (fetching a value resets the counters)
+"""
+import numpy as np
+
+from PySDM.products.impl.product import Product
+
+
+class CollisionPairAcceptanceFraction(Product):
+    def __init__(self, unit="dimensionless", name=None):
+        super().__init__(unit=unit, name=name)
+        self.collision = None
+
+    def register(self, builder):
+        super().register(builder)
+        self.collision = self.particulator.dynamics["Collision"]
+        self.collision.request_pair_counts()
+
+    def _impl(self, **kwargs):
+        counts = self.collision.stats_pair_counts.to_ndarray()
+        self.collision.stats_pair_counts[:] = 0
+        self.buffer.ravel()[:] = np.where(
+            counts[0, :] > 0, counts[1, :] / np.maximum(counts[0, :], 1), np.nan
+        )
+        return self.buffer
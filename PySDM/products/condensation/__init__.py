@@ -5,3 +5,10 @@ from .activable_fraction import ActivableFraction
 from .condensation_timestep import CondensationTimestepMax, CondensationTimestepMin
 from .event_rates import ActivatingRate, DeactivatingRate, RipeningRate
 from .peak_supersaturation import PeakSupersaturation
+from .solver_diagnostics import (
+    CondensationBracketExpansions,
+    CondensationNearEquilibriumDroplets,
+    CondensationRootFindingIterations,
+    CondensationSolverFailures,
+    CondensationSubstepProbes,
+)
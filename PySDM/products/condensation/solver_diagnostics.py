@@ -0,0 +1,69 @@
+"""
+per-gridbox condensation solver statistics for locating the cells and conditions
+ which dominate solver cost: root-finding iterations, bracket expansions, droplets
+ skipped as being in equilibrium with ambient air, failed droplet-growth solutions
+ and adaptive-substep probes (counts summed over timesteps since last fetch,
+ fetching a value resets the counter)
+"""
+import numpy as np
+
+from PySDM.products.impl.product import Product
+
+
+class _CondensationSolverCounter(Product):
+    def __init__(self, what, name, unit):
+        super().__init__(name=name, unit=unit)
+        self.what = what
+        self.condensation = None
+        self.count = None
+
+    def register(self, builder):
+        super().register(builder)
+        self.particulator.observers.append(self)
+        self.condensation = self.particulator.dynamics["Condensation"]
+        self.count = np.zeros_like(self.buffer)
+
+    def notify(self):
+        self._download_to_buffer(self.condensation.counters["n_" + self.what])
+        self.count[:] += self.buffer[:]
+
+    def _impl(self, **kwargs):
+        self.buffer[:] = self.count[:]
+        self.count[:] = 0
+        return self.buffer
+
+
+class CondensationRootFindingIterations(_CondensationSolverCounter):
+    """TOMS748 (or quasi-equilibrium Newton) iterations"""
+
+    def __init__(self, name=None, unit="dimensionless"):
+        super().__init__("root_finding_iterations", name=name, unit=unit)
+
+
+class CondensationBracketExpansions(_CondensationSolverCounter):
+    """bracket-widening iterations preceding root finding"""
+
+    def __init__(self, name=None, unit="dimensionless"):
+        super().__init__("bracket_expansions", name=name, unit=unit)
+
+
+class CondensationNearEquilibriumDroplets(_CondensationSolverCounter):
+    """droplets skipped as being in equilibrium with ambient air"""
+
+    def __init__(self, name=None, unit="dimensionless"):
+        super().__init__("near_equilibrium", name=name, unit=unit)
+
+
+class CondensationSolverFailures(_CondensationSolverCounter):
+    """droplets for which no growth solution was found (in probes, such failures
+    result in shortening the substep, otherwise in a failure of the whole step)"""
+
+    def __init__(self, name=None, unit="dimensionless"):
+        super().__init__("failed", name=name, unit=unit)
+
+
+class CondensationSubstepProbes(_CondensationSolverCounter):
+    """trial steps taken while adapting the number of substeps"""
+
+    def __init__(self, name=None, unit="dimensionless"):
+        super().__init__("probes", name=name, unit=unit)
@@ -1,8 +1,10 @@
 """
-Housekeeping products: time, parcel displacement, super-particle counts, wall-time timers...
+Housekeeping products: time, parcel displacement, super-particle counts, wall-time timers,
+ running time statistics of other products...
 """
 from .dynamic_wall_time import DynamicWallTime
 from .parcel_displacement import ParcelDisplacement
 from .super_droplet_count_per_gridbox import SuperDropletCountPerGridbox
 from .time import Time
+from .time_statistic import TimeStatistic
 from .timers import CPUTime, WallTime
@@ -0,0 +1,293 @@
+"""
+running time statistic (mean, minimum or maximum) of any moment or spectrum product
+ (`PySDM.products.impl.moment_product.MomentProduct` or
+ `PySDM.products.impl.spectrum_moment_product.SpectrumMomentProduct`):
+ the (binned) moments read by the wrapped product are evaluated and accumulated
+ in backend storage at every timestep (in `notify()`), and downloaded only when
+ the product is read - the statistic is thus applied to the moments, while the
+ remaining operations of the wrapped product (e.g., normalisation by dry-air density)
+ use the values current at the time of reading;
+ for the mean, moments are accumulated without normalisation by the zeroth moment
+ and normalised at read time (e.g., time-averaged effective radius is the ratio
+ of time-averaged third and second moments, time-averaged mean radius is weighted
+ by the particle number at each timestep);
+ minimum and maximum are applicable only to products reading a single moment
+ (e.g., particle concentration, mean radius or size spectrum, but not effective radius);
+ with `window=None` the statistic covers timesteps since the last read,
+ otherwise it covers the last complete window of `window` timesteps
+ (or, until the first one is complete, the timesteps elapsed so far)
+"""
+import numpy as np
+
+from PySDM.products.impl.product import Product
+
+STATISTICS = ("mean", "min", "max")
+
+
+class _Accumulator:  # pylint: disable=too-few-public-methods
+    def __init__(self, particulator, shapes):
+        self.current = tuple(
+            particulator.Storage.empty(shape, dtype=float) for shape in shapes
+        )
+        self.accumulated = tuple(
+            particulator.Storage.empty(shape, dtype=float) for shape in shapes
+        )
+        self.completed = None
+
+
+class _MomentAccumulator:
+    """drop-in replacement for `PySDM.impl.moment_planner.MomentPlanner`
+    as a `moment_source` of moment and spectrum products"""
+
+    def __init__(self, particulator, statistic, window):
+        self.particulator = particulator
+        self.statistic = statistic
+        self.window = window
+        self.count = 0
+        self.completed_count = 0
+        self.learning = False
+        self.n_reads = 0
+        self.__moments = {}
+        self.__spectra = {}
+
+    def moment(
+        self,
+        *,
+        attr,
+        rank,
+        filter_attr="volume",
+        filter_range=(-np.inf, np.inf),
+        weighting_attribute="volume",
+        weighting_rank=0,
+        skip_division_by_m0=False,
+    ) -> np.ndarray:
+        key = (
+            attr,
+            filter_attr,
+            tuple(float(bound) for bound in filter_range),
+            weighting_attribute,
+            weighting_rank,
+            skip_division_by_m0,
+        )
+        if self.learning:
+            self.n_reads += 1
+        if self.learning or key not in self.__moments:
+            ranks = self.__moments[key][0] if key in self.__moments else ()
+            if key not in self.__moments or (rank != 0 and rank not in ranks):
+                ranks += (rank,) if rank != 0 else ()
+                n_cell = self.particulator.mesh.n_cell
+                self.__moments[key] = (
+                    ranks,
+                    _Accumulator(
+                        self.particulator, (n_cell, (max(len(ranks), 1), n_cell))
+                    ),
+                )
+                self.__evaluate_moments(key, *self.__moments[key])
+        ranks, accumulator = self.__moments[key]
+        moment_0, moments = self.__read(accumulator)
+        if rank == 0:
+            return moment_0
+        moments = moments[ranks.index(rank)]
+        if self.statistic != "mean" or skip_division_by_m0 or self.learning:
+            return moments
+        return np.divide(
+            moments, moment_0, out=np.zeros_like(moments), where=moment_0 != 0
+        )
+
+    def spectrum(
+        self,
+        *,
+        attr,
+        rank,
+        attr_bins,
+        attr_bins_spacing,
+        filter_attr="volume",
+        weighting_attribute="volume",
+        weighting_rank=0,
+    ) -> tuple:
+        key = (
+            attr,
+            rank,
+            attr_bins,
+            attr_bins_spacing,
+            filter_attr,
+            weighting_attribute,
+            weighting_rank,
+        )
+        if self.learning:
+            self.n_reads += 1 if rank == 0 else 2
+        if key not in self.__spectra:
+            shape = (attr_bins.shape[0] - 1, self.particulator.mesh.n_cell)
+            self.__spectra[key] = _Accumulator(self.particulator, (shape, shape))
+            self.__evaluate_spectrum(key, self.__spectra[key])
+        moment_0, moments = self.__read(self.__spectra[key])
+        if rank == 0:
+            return moment_0, None
+        if self.statistic == "mean" and not self.learning:
+            moments = np.divide(
+                moments, moment_0, out=np.zeros_like(moments), where=moment_0 != 0
+            )
+        return moment_0, moments
+
+    def notify(self):
+        """evaluates and accumulates the moments registered so far (further ones
+        are registered, evaluated and accumulated upon first request)"""
+        for key, (ranks, accumulator) in self.__moments.items():
+            self.__evaluate_moments(key, ranks, accumulator)
+        for key, accumulator in self.__spectra.items():
+            self.__evaluate_spectrum(key, accumulator)
+
+    def notified(self):
+        self.count += 1
+        if self.window is not None and self.count == self.window:
+            for accumulator in self.__accumulators():
+                if accumulator.completed is None:
+                    accumulator.completed = tuple(
+                        self.particulator.Storage.empty(storage.shape, dtype=float)
+                        for storage in accumulator.accumulated
+                    )
+                for completed, accumulated in zip(
+                    accumulator.completed, accumulator.accumulated
+                ):
+                    completed[:] = accumulated
+            self.completed_count = self.count
+            self.count = 0
+
+    def reset(self):
+        self.count = 0
+
+    def __accumulators(self):
+        yield from (accumulator for _, accumulator in self.__moments.values())
+        yield from self.__spectra.values()
+
+    def __evaluate_moments(self, key, ranks, accumulator):
+        attr, filter_attr, filter_range, weighting_attribute, weighting_rank, skip = key
+        self.particulator.moments(
+            moment_0=accumulator.current[0],
+            moments=accumulator.current[1],
+            specs={attr: ranks or (0,)},
+            attr_name=filter_attr,
+            attr_range=filter_range,
+            weighting_attribute=weighting_attribute,
+            weighting_rank=weighting_rank,
+            skip_division_by_m0=skip or self.statistic == "mean",
+        )
+        self.__accumulate(accumulator)
+
+    def __evaluate_spectrum(self, key, accumulator):
+        (
+            attr,
+            rank,
+            attr_bins,
+            attr_bins_spacing,
+            filter_attr,
+            weighting_attribute,
+            weighting_rank,
+        ) = key
+        self.particulator.spectrum_moments(
+            moment_0=accumulator.current[0],
+            moments=accumulator.current[1],
+            attr=attr,
+            rank=rank,
+            attr_bins=attr_bins,
+            attr_bins_spacing=attr_bins_spacing,
+            attr_name=filter_attr,
+            weighting_attribute=weighting_attribute,
+            weighting_rank=weighting_rank,
+        )
+        if self.statistic == "mean" and rank != 0:
+            moment_0, moments = accumulator.current
+            moments *= moment_0
+        self.__accumulate(accumulator)
+
+    def __accumulate(self, accumulator):
+        for accumulated, current in zip(accumulator.accumulated, accumulator.current):
+            if self.count == 0:
+                accumulated[:] = current
+            elif self.statistic == "mean":
+                accumulated += current
+            elif self.statistic == "min":
+                accumulated.minimum(current)
+            else:
+                accumulated.maximum(current)
+
+    def __read(self, accumulator):
+        if self.learning:
+            return tuple(storage.to_ndarray() for storage in accumulator.current)
+        storages, count = accumulator.accumulated, self.count
+        if self.window is not None and accumulator.completed is not None:
+            storages, count = accumulator.completed, self.completed_count
+        if count == 0:
+            return tuple(np.full(storage.shape, np.nan) for storage in storages)
+        result = tuple(storage.to_ndarray() for storage in storages)
+        if self.statistic == "mean":
+            for array in result:
+                array /= count
+        return result
+
+
+class TimeStatistic(Product):
+    def __init__(
+        self,
+        product: Product,
+        *,
+        statistic="mean",
+        window: int = None,
+        get_kwargs: dict = None,
+        name=None,
+        unit="dimensionless",
+    ):
+        """`statistic` is one of "mean", "min" or "max", `window` is expressed in
+        the number of timesteps, `get_kwargs` are passed to the wrapped product;
+        `unit` is ignored (the wrapped product unit is used), arguments of `get()`
+        are ignored as well"""
+        if statistic not in STATISTICS:
+            raise ValueError(f"statistic '{statistic}' not among {STATISTICS}")
+        if not hasattr(product, "moment_source"):
+            raise ValueError("only moment and spectrum products are supported")
+        super().__init__(name=name or f"{product.name} ({statistic})", unit=unit)
+        self._unit = product._unit  # pylint: disable=protected-access
+        self.unit_magnitude_in_base_units = product.unit_magnitude_in_base_units
+        self.product = product
+        self.statistic = statistic
+        self.window = window
+        self.get_kwargs = get_kwargs or {}
+        self.accumulator = None
+        self.__learnt = False
+
+    def register(self, builder):
+        super().register(builder)
+        self.product.register(builder)
+        self.shape = self.product.shape
+        self.accumulator = _MomentAccumulator(
+            self.particulator, self.statistic, self.window
+        )
+        self.product.moment_source = self.accumulator
+        self.particulator.observers.append(self)
+
+    def set_buffer(self, buffer):
+        super().set_buffer(buffer)
+        self.product.set_buffer(buffer)
+
+    def notify(self):
+        self.accumulator.notify()
+        if not self.__learnt:
+            self.accumulator.learning = True
+            self.accumulator.n_reads = 0
+            self.product._impl(**self.get_kwargs)  # pylint: disable=protected-access
+            self.accumulator.learning = False
+            self.__learnt = True
+            if self.statistic != "mean" and self.accumulator.n_reads > 1:
+                raise ValueError(
+                    f"'{self.statistic}' not applicable to '{self.product.name}'"
+                    " which combines more than one moment (only 'mean' is)"
+                )
+        self.accumulator.notified()
+
+    def _impl(self, **kwargs):
+        result = self.product._impl(  # pylint: disable=protected-access
+            **self.get_kwargs
+        )
+        if self.window is None:
+            self.accumulator.reset()
+        return result
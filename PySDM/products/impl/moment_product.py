@@ -7,19 +7,15 @@ from PySDM.products.impl.product import Product
 
 
 class MomentProduct(Product, ABC):
+    memoisable = True
+
     def __init__(self, name, unit):
         super().__init__(name=name, unit=unit)
-        self.moment_0 = None
-        self.moments = None
+        self.moment_source = None
 
     def register(self, builder):
         super().register(builder)
-        self.moment_0 = self.particulator.Storage.empty(
-            self.particulator.mesh.n_cell, dtype=float
-        )
-        self.moments = self.particulator.Storage.empty(
-            (1, self.particulator.mesh.n_cell), dtype=float
-        )
+        self.moment_source = self.particulator.moment_planner
 
     def _download_moment_to_buffer(
         self,
@@ -32,17 +28,19 @@ class MomentProduct(Product, ABC):
         weighting_rank=0,
         skip_division_by_m0=False,
     ):
-        self.particulator.moments(
-            moment_0=self.moment_0,
-            moments=self.moments,
-            specs={attr: (rank,)},
-            attr_name=filter_attr,
-            attr_range=filter_range,
-            weighting_attribute=weighting_attribute,
-            weighting_rank=weighting_rank,
-            skip_division_by_m0=skip_division_by_m0,
+        """moments are evaluated (and cached within a timestep) by
+        `PySDM.impl.moment_planner.MomentPlanner` in passes fused
+        with other products sharing the filter and weighting (unless `moment_source`
+        is replaced, see `PySDM.products.housekeeping.time_statistic`)"""
+        np.copyto(
+            self.buffer.ravel(),
+            self.moment_source.moment(
+                attr=attr,
+                rank=rank,
+                filter_attr=filter_attr,
+                filter_range=filter_range,
+                weighting_attribute=weighting_attribute,
+                weighting_rank=weighting_rank,
+                skip_division_by_m0=skip_division_by_m0,
+            ),
         )
-        if rank == 0:  # TODO #217
-            self._download_to_buffer(self.moment_0)
-        else:
-            self._download_to_buffer(self.moments[0, :])
@@ -6,6 +6,7 @@ import re
 from abc import abstractmethod
 from typing import Optional
 
+import numpy as np
 import pint
 
 from PySDM.physics.constants import PPB, PPM, PPT
@@ -14,7 +15,29 @@ _UNIT_REGISTRY = pint.UnitRegistry()
 _CAMEL_CASE_PATTERN = re.compile(r"[A-Z]?[a-z]+|[A-Z]+(?![^A-Z])")
 
 
+class _RecordingEnvironment:  # pylint: disable=too-few-public-methods
+    """forwards to the environment recording the keys of the fields read"""
+
+    def __init__(self, environment):
+        self.target = environment
+        self.keys = set()
+
+    def __getitem__(self, key):
+        self.keys.add(key)
+        return self.target[key]
+
+    def __getattr__(self, name):
+        return getattr(self.target, name)
+
+
 class Product:
+    memoisable = False
+    """ whether the product value depends solely on particle attributes, environment
+    fields read through `particulator.environment[...]`, the timestep count and
+    the `get()` arguments (and hence can be memoised, see `Builder.build()`);
+    not the case for, e.g., products reset on read such as
+    `PySDM.products.impl.rate_product.RateProduct` or the timers """
+
     def __init__(self, *, unit: str, name: Optional[str] = None):
         self.name = name or self._camel_case_to_words(self.__class__.__name__)
 
@@ -26,11 +49,14 @@ class Product:
         self.buffer = None
         self.particulator = None
         self.formulae = None
+        self.memoise = False
+        self.__memo = {}
 
     def register(self, builder):
         self.particulator = builder.particulator
         self.formulae = self.particulator.formulae
         self.shape = self.particulator.mesh.grid
+        self.memoise = builder.memoise_products and self.memoisable
 
     def set_buffer(self, buffer):
         self.buffer = buffer
@@ -98,6 +124,57 @@ class Product:
         raise NotImplementedError()
 
     def get(self, **kwargs):
+        if not self.memoise:
+            return self.__evaluate(kwargs)
+        key = tuple(sorted(kwargs.items()))
+        try:
+            memo = self.__memo.get(key)
+        except TypeError:  # unhashable arguments
+            return self.__evaluate(kwargs)
+        if memo is not None and self.__memo_valid(memo):
+            return memo["result"].copy()
+
+        environment = self.particulator.environment
+        recording_environment = _RecordingEnvironment(environment)
+        self.particulator.environment = recording_environment
+        try:
+            with self.particulator.attributes.recording_reads() as attributes_read:
+                result = self.__evaluate(kwargs)
+        finally:
+            self.particulator.environment = environment
+
+        for stale_key in [
+            k
+            for k, v in self.__memo.items()
+            if v["stamp"][0] != self.particulator.n_steps
+        ]:
+            del self.__memo[stale_key]
+        self.__memo[key] = {
+            "result": result.copy(),
+            "stamp": self.__stamp(attributes_read),
+            "attributes": attributes_read,
+            "environment": {
+                field: environment[field].to_ndarray()
+                for field in recording_environment.keys
+            },
+        }
+        return result
+
+    def __evaluate(self, kwargs):
         result = self._impl(**kwargs)
         result /= self.unit_magnitude_in_base_units
         return result
+
+    def __stamp(self, attribute_names):
+        attributes = self.particulator.attributes
+        stamp = [self.particulator.n_steps, attributes.super_droplet_count]
+        for name in sorted(attribute_names):
+            _ = attributes[name]  # updates derived attributes
+            stamp.append(attributes.get_timestamp(name))
+        return tuple(stamp)
+
+    def __memo_valid(self, memo):
+        return memo["stamp"] == self.__stamp(memo["attributes"]) and all(
+            np.array_equal(self.particulator.environment[field].to_ndarray(), value)
+            for field, value in memo["environment"].items()
+        )
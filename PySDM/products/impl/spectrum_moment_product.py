@@ -4,25 +4,28 @@ common code for products computing **binned** statistical moments
 """
 from abc import ABC
 
+import numpy as np
+
+from PySDM.backends.impl_common.bin_spacing import detect_bin_spacing
 from PySDM.products.impl.product import Product
 
 
 class SpectrumMomentProduct(ABC, Product):
+    memoisable = True
+
     def __init__(self, name, unit, attr_unit):
         super().__init__(name=name, unit=unit)
         self.attr_bins_edges = None
+        self.attr_bins_spacing = None
         self.attr_unit = attr_unit
         self.moment_0 = None
         self.moments = None
+        self.moment_source = None
 
     def register(self, builder):
         super().register(builder)
-        self.moment_0 = self.particulator.Storage.empty(
-            (len(self.attr_bins_edges) - 1, self.particulator.mesh.n_cell), dtype=float
-        )
-        self.moments = self.particulator.Storage.empty(
-            (len(self.attr_bins_edges) - 1, self.particulator.mesh.n_cell), dtype=float
-        )
+        self.moment_source = self.particulator.moment_planner
+        self.attr_bins_spacing = detect_bin_spacing(self.attr_bins_edges.to_ndarray())
         _ = self._parse_unit(self.attr_unit)
 
     def _recalculate_spectrum_moment(
@@ -34,19 +37,25 @@ class SpectrumMomentProduct(ABC, Product):
         weighting_attribute="volume",
         weighting_rank=0,
     ):
-        self.particulator.spectrum_moments(
-            moment_0=self.moment_0,
-            moments=self.moments,
+        """binned moments are evaluated (and cached within a timestep) by
+        `PySDM.impl.moment_planner.MomentPlanner` in passes fused with other
+        products sharing the bins, filter and weighting (`self.moment_0` and
+        `self.moments` are read-only (n_bins, n_cell) arrays thereafter),
+        unless `moment_source` is replaced (see
+        `PySDM.products.housekeeping.time_statistic`)"""
+        self.moment_0, self.moments = self.moment_source.spectrum(
             attr=attr,
             rank=rank,
             attr_bins=self.attr_bins_edges,
-            attr_name=filter_attr,
+            attr_bins_spacing=self.attr_bins_spacing,
+            filter_attr=filter_attr,
             weighting_attribute=weighting_attribute,
             weighting_rank=weighting_rank,
         )
 
-    def _download_spectrum_moment_to_buffer(self, rank, bin_number):
+    def _download_spectrum_moment(self, rank):
+        """returns a (writable) (n_cell, n_bins) array with the binned moment
+        of given `rank` for all cells and bins at once"""
         if rank == 0:  # TODO #217
-            self._download_to_buffer(self.moment_0[bin_number, :])
-        else:
-            self._download_to_buffer(self.moments[bin_number, :])
+            return np.array(self.moment_0.T)
+        return np.array(self.moments.T)
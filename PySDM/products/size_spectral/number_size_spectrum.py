@@ -2,8 +2,6 @@
 n(V) particle volume spectrum per volume of air,
 i.e. number of particles per volume of air having in the size range bin
 """
-import numpy as np
-
 from PySDM.products.impl.spectrum_moment_product import SpectrumMomentProduct
 
 
@@ -30,12 +28,7 @@ class NumberSizeSpectrum(SpectrumMomentProduct):
         self.shape = (*builder.particulator.mesh.grid, len(self.attr_bins_edges) - 1)
 
     def _impl(self, **kwargs):
-        vals = np.empty([self.particulator.mesh.n_cell, len(self.attr_bins_edges) - 1])
-        self._recalculate_spectrum_moment(attr=self.attr, rank=1, filter_attr=self.attr)
-
-        for i in range(vals.shape[1]):
-            self._download_spectrum_moment_to_buffer(rank=0, bin_number=i)
-            vals[:, i] = self.buffer.ravel()
-
+        self._recalculate_spectrum_moment(attr=self.attr, rank=0, filter_attr=self.attr)
+        vals = self._download_spectrum_moment(rank=0)
         vals *= 1 / self.particulator.mesh.dv
         return vals
@@ -15,6 +15,7 @@ class ParticleSizeSpectrum(SpectrumMomentProduct, ABC):
         self.volume_attr = "dry volume" if dry else "volume"
         self.radius_bins_edges = radius_bins_edges
         self.normalise_by_dv = normalise_by_dv
+        self.radius_bins_widths = None
         super().__init__(name=name, unit=unit, attr_unit="m")
 
     def register(self, builder):
@@ -27,30 +28,25 @@ class ParticleSizeSpectrum(SpectrumMomentProduct, ABC):
             volume_bins_edges
         )
 
+        self.radius_bins_widths = np.diff(
+            builder.particulator.formulae.trivia.radius(volume=volume_bins_edges)
+        )
+
         super().register(builder)
 
         self.shape = (*builder.particulator.mesh.grid, len(self.attr_bins_edges) - 1)
 
     def _impl(self, **kwargs):
-        vals = np.empty([self.particulator.mesh.n_cell, len(self.attr_bins_edges) - 1])
         self._recalculate_spectrum_moment(
-            attr=self.volume_attr, rank=1, filter_attr=self.volume_attr
+            attr=self.volume_attr, rank=0, filter_attr=self.volume_attr
         )
-
-        for i in range(vals.shape[1]):
-            self._download_spectrum_moment_to_buffer(rank=0, bin_number=i)
-            vals[:, i] = self.buffer.ravel()
+        vals = self._download_spectrum_moment(rank=0)
 
         if self.normalise_by_dv:
-            vals[:] /= self.particulator.mesh.dv
+            vals /= self.particulator.mesh.dv
 
         self._download_to_buffer(self.particulator.environment["rhod"])
-        rhod = self.buffer.ravel()
-        for i in range(len(self.attr_bins_edges) - 1):
-            dr = self.formulae.trivia.radius(
-                volume=self.attr_bins_edges[i + 1]
-            ) - self.formulae.trivia.radius(volume=self.attr_bins_edges[i])
-            vals[:, i] /= rhod * dr
+        vals /= self.buffer.ravel()[:, np.newaxis] * self.radius_bins_widths
 
         return np.squeeze(vals.reshape(self.shape))
 
@@ -15,6 +15,7 @@ class ParticleVolumeVersusRadiusLogarithmSpectrum(SpectrumMomentProduct):
         self.moment_0 = None
         self.moments = None
         self.attr = ("dry " if dry else "") + "volume"
+        self.d_log_radius = None
 
     def register(self, builder):
         builder.request_attribute("volume")
@@ -26,19 +27,16 @@ class ParticleVolumeVersusRadiusLogarithmSpectrum(SpectrumMomentProduct):
             volume_bins_edges
         )
 
+        self.d_log_radius = np.diff(np.log(self.radius_bins_edges))
+
         super().register(builder)
 
         self.shape = (*builder.particulator.mesh.grid, len(self.attr_bins_edges) - 1)
 
     def _impl(self, **kwargs):
-        vals = np.empty([self.particulator.mesh.n_cell, len(self.attr_bins_edges) - 1])
         self._recalculate_spectrum_moment(attr=self.attr, rank=1, filter_attr=self.attr)
+        vals = self._download_spectrum_moment(rank=1)
+        vals *= self.moment_0.T
 
-        for i in range(vals.shape[1]):
-            self._download_spectrum_moment_to_buffer(rank=1, bin_number=i)
-            vals[:, i] = self.buffer.ravel()
-            self._download_spectrum_moment_to_buffer(rank=0, bin_number=i)
-            vals[:, i] *= self.buffer.ravel()
-
-        vals *= 1 / np.diff(np.log(self.radius_bins_edges)) / self.particulator.mesh.dv
+        vals *= 1 / self.d_log_radius / self.particulator.mesh.dv
         return vals
@@ -29,15 +29,10 @@ class RadiusBinnedNumberAveragedTerminalVelocity(SpectrumMomentProduct):
         self.shape = (*builder.particulator.mesh.grid, len(self.attr_bins_edges) - 1)
 
     def _impl(self, **kwargs):
-        vals = np.empty([self.particulator.mesh.n_cell, len(self.attr_bins_edges) - 1])
-
         self._recalculate_spectrum_moment(
             attr=ATTR,
             rank=RANK,
         )
-
-        for i in range(vals.shape[1]):
-            self._download_spectrum_moment_to_buffer(rank=RANK, bin_number=i)
-            vals[:, i] = self.buffer.ravel()
+        vals = self._download_spectrum_moment(rank=RANK)
 
         return np.squeeze(vals.reshape(self.shape))
@@ -4,10 +4,19 @@ import os
 import numpy as np
 import pytest
 
+from PySDM import Builder
+from PySDM.backends import CPU
 from PySDM.backends.impl_common.index import make_Index
 from PySDM.backends.impl_common.indexed_storage import make_IndexedStorage
 from PySDM.backends.impl_common.pair_indicator import make_PairIndicator
 from PySDM.backends.impl_numba.methods.collisions_methods import pair_indices
+from PySDM.dynamics.collisions.breakup_efficiencies import ConstEb
+from PySDM.dynamics.collisions.breakup_fragmentations import AlwaysN
+from PySDM.dynamics.collisions.coalescence_efficiencies import ConstEc, Schlottke2010
+from PySDM.dynamics.collisions.collision import Collision
+from PySDM.dynamics.collisions.collision_kernels import Golovin
+from PySDM.environments import Box
+from PySDM.physics import si
 
 from ...backends_fixture import backend_class
 
@@ -178,3 +187,145 @@ class TestAlgorithmicMethods:
                 )
         np.testing.assert_array_almost_equal(_gamma.to_ndarray(), expected_gamma)
         np.testing.assert_array_equal(_n_substep, np.asarray(expected_n_substep))
+
+
+@pytest.mark.parametrize(
+    "gamma, idx, is_first_in_pair, expected_pairs, expected_idx",
+    [
+        ((0, 0), (0, 1, 2, 3), (True, False, True, False), (), ()),
+        ((1, 0), (3, 2, 1, 0), (True, False, True, False), (0,), (3, 2)),
+        ((2, 1), (0, 1, 2, 3), (True, False, True, False), (0, 1), (0, 1, 2, 3)),
+        ((0, 3), (0, 1, 2, 3, 4), (False, True, False, True, False), (1,), (3, 4)),
+    ],
+)
+def test_gather_colliding_pairs(
+    gamma, idx, is_first_in_pair, expected_pairs, expected_idx
+):
+    # Arrange
+    backend = CPU()
+    n_sd = len(idx)
+    gamma = backend.Storage.from_ndarray(np.asarray(gamma, dtype=float))
+    idx = make_Index(backend).from_ndarray(np.asarray(idx))
+    pair_indicator = make_PairIndicator(backend)(n_sd)
+    pair_indicator.indicator[:] = np.asarray(is_first_in_pair)
+    colliding_pairs = backend.Storage.from_ndarray(np.full(n_sd // 2, -1))
+    colliding_pairs_idx = backend.Storage.from_ndarray(np.full(n_sd, -1))
+
+    # Act
+    n_colliding = backend.gather_colliding_pairs(
+        gamma=gamma,
+        idx=idx,
+        is_first_in_pair=pair_indicator,
+        colliding_pairs=colliding_pairs,
+        colliding_pairs_idx=colliding_pairs_idx,
+    )
+
+    # Assert
+    assert n_colliding == len(expected_pairs)
+    np.testing.assert_array_equal(
+        colliding_pairs.to_ndarray()[:n_colliding], expected_pairs
+    )
+    np.testing.assert_array_equal(
+        colliding_pairs_idx.to_ndarray()[: 2 * n_colliding], expected_idx
+    )
+
+
+class _EagerCollision(Collision):
+    """evaluates efficiencies and numbers of fragments for all candidate pairs"""
+
+    def compute_efficiencies_and_fragments_of_colliding_pairs(
+        self, gamma, rand_frag, is_first_in_pair
+    ):
+        self.compute_coalescence_efficiency(self.Ec_temp, is_first_in_pair)
+        self.compute_breakup_efficiency(self.Eb_temp, is_first_in_pair)
+        self.compute_number_of_fragments(self.n_fragment, rand_frag, is_first_in_pair)
+
+
+@pytest.mark.parametrize(
+    "coalescence_efficiency",
+    (lambda: ConstEc(Ec=0.5), Schlottke2010),
+    ids=("ConstEc", "Schlottke2010"),
+)
+def test_efficiencies_and_fragments_of_colliding_pairs_match_eager_evaluation(
+    coalescence_efficiency,
+):
+    # Arrange
+    n_sd = 64
+    n_steps = 5
+    rng = np.random.default_rng(seed=44)
+    attributes = {
+        "n": rng.integers(1, 1e3, n_sd).astype(float),
+        "volume": rng.uniform(1, 1e4, n_sd) * si.um**3,
+    }
+    n_colliding = []
+
+    def run(collision_class):
+        builder = Builder(n_sd, backend=CPU())
+        builder.set_environment(Box(dv=1 * si.cm**3, dt=1 * si.s))
+        builder.add_dynamic(
+            collision_class(
+                collision_kernel=Golovin(b=1e3 / si.s),
+                coalescence_efficiency=coalescence_efficiency(),
+                breakup_efficiency=ConstEb(Eb=0.5),
+                fragmentation_function=AlwaysN(n=3),
+                adaptive=False,
+            )
+        )
+        particulator = builder.build(
+            attributes={key: value.copy() for key, value in attributes.items()}
+        )
+        gather_colliding_pairs = particulator.backend.gather_colliding_pairs
+
+        def gather_and_count(**kwargs):
+            n_colliding.append(gather_colliding_pairs(**kwargs))
+            return n_colliding[-1]
+
+        particulator.backend.gather_colliding_pairs = gather_and_count
+        particulator.run(n_steps)
+        return {
+            attr: particulator.attributes[attr].to_ndarray() for attr in ("n", "volume")
+        }
+
+    # Act
+    expected = run(_EagerCollision)
+    actual = run(Collision)
+
+    # Assert
+    assert len(n_colliding) == n_steps
+    assert 0 < max(n_colliding) and min(n_colliding) < n_sd // 2
+    for attr, value in expected.items():
+        np.testing.assert_array_equal(actual[attr], value)
+
+
+@pytest.mark.parametrize("seed", (0, 1, 2))
+@pytest.mark.parametrize("n_movers", (0, 1, 17, 100))
+def test_incremental_sort_matches_counting_sort(seed, n_movers):
+    # arrange
+    rng = np.random.default_rng(seed)
+    n_sd, n_cell = 100, 7
+    cell_idx = rng.permutation(n_cell)
+    cell_id = rng.integers(0, n_cell, n_sd)
+    idx = rng.permutation(n_sd)
+    cell_start = np.empty(n_cell + 1, dtype=np.int64)
+    sorted_idx = np.empty_like(idx)
+    CPU._counting_sort_by_cell_id_and_update_cell_start(
+        sorted_idx, idx, cell_id, cell_idx, n_sd, cell_start
+    )
+    mover_positions = np.sort(rng.choice(n_sd, n_movers, replace=False))
+    cell_id[sorted_idx[mover_positions]] = rng.integers(0, n_cell, n_movers)
+
+    expected_idx = np.empty_like(idx)
+    expected_cell_start = np.empty_like(cell_start)
+    CPU._counting_sort_by_cell_id_and_update_cell_start(
+        expected_idx, sorted_idx, cell_id, cell_idx, n_sd, expected_cell_start
+    )
+
+    # act
+    actual_idx = np.empty_like(idx)
+    CPU._incremental_sort_by_cell_id_and_update_cell_start(
+        actual_idx, sorted_idx, cell_id, cell_idx, cell_start, mover_positions
+    )
+
+    # assert
+    np.testing.assert_array_equal(actual_idx, expected_idx)
+    np.testing.assert_array_equal(cell_start, expected_cell_start)
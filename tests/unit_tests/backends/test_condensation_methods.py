@@ -0,0 +1,109 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+import numba
+import numpy as np
+import pytest
+
+from PySDM.backends import CPU
+from PySDM.backends.impl_numba.methods.condensation_methods import (
+    STATS_N_ROOT_FINDING_ITERATIONS,
+)
+
+
+@numba.njit()
+# pylint: disable=too-many-arguments,unused-argument
+def _fake_solver(
+    v,
+    v_cr,
+    n,
+    vdry,
+    cell_idx,
+    kappa,
+    f_org,
+    n_iterations,
+    dx_guess,
+    stats,
+    thd,
+    qv,
+    dthd_dt,
+    dqv_dt,
+    m_d,
+    rhod_mean,
+    ml_old,
+    rtol_x,
+    rtol_thd,
+    timestep,
+    n_substeps,
+):
+    for drop in cell_idx:
+        v[drop] += 1
+    stats[STATS_N_ROOT_FINDING_ITERATIONS] = len(cell_idx)
+    return True, qv, thd, n_substeps + 1, len(cell_idx), 0, 0, 0.0, ml_old
+
+
+class TestCondensationMethods:
+    @staticmethod
+    @pytest.mark.parametrize("n_threads", (1, 2, 3, 8))
+    @pytest.mark.parametrize("n_sd_in_cell", ((1, 0, 3, 2, 5, 4, 1), (2,) * 33))
+    def test_cell_queue_visits_each_cell_once(n_threads, n_sd_in_cell):
+        # arrange
+        n_cell = len(n_sd_in_cell)
+        cell_start = np.concatenate(((0,), np.cumsum(n_sd_in_cell)))
+        n_sd = cell_start[-1]
+        cell_order = np.argsort(-np.asarray(n_sd_in_cell), kind="stable")
+        counter_n_substeps = np.zeros(n_cell, dtype=int)
+        counter_n_activating = np.full(n_cell, -1)
+        counter_n_root_finding_iterations = np.full(n_cell, -1)
+        volume = np.zeros(n_sd)
+        cell_vars = {key: np.ones(n_cell) for key in ("rhod", "thd", "qv")}
+
+        # act
+        CPU._condensation(
+            solver=_fake_solver,
+            n_threads=n_threads,
+            n_cell=n_cell,
+            cell_start_arg=cell_start,
+            v=volume,
+            v_cr=volume,
+            n=np.ones(n_sd, dtype=int),
+            vdry=volume,
+            idx=np.arange(n_sd),
+            rhod=cell_vars["rhod"],
+            thd=cell_vars["thd"],
+            qv=cell_vars["qv"],
+            dv_mean=np.ones(1),
+            prhod=cell_vars["rhod"].copy(),
+            pthd=cell_vars["thd"].copy(),
+            pqv=cell_vars["qv"].copy(),
+            kappa=volume,
+            f_org=volume,
+            rtol_x=0.0,
+            rtol_thd=0.0,
+            timestep=1.0,
+            counter_n_substeps=counter_n_substeps,
+            counter_n_activating=counter_n_activating,
+            counter_n_deactivating=np.zeros(n_cell, dtype=int),
+            counter_n_ripening=np.zeros(n_cell, dtype=int),
+            counter_n_root_finding_iterations=counter_n_root_finding_iterations,
+            counter_n_bracket_expansions=np.zeros(n_cell, dtype=int),
+            counter_n_near_equilibrium=np.zeros(n_cell, dtype=int),
+            counter_n_failed=np.zeros(n_cell, dtype=int),
+            counter_n_probes=np.zeros(n_cell, dtype=int),
+            cell_order=cell_order,
+            RH_max=np.zeros(n_cell),
+            success=np.zeros(n_cell, dtype=bool),
+            n_iterations=np.zeros(n_sd, dtype=int),
+            dx_guess=np.zeros(n_sd),
+            ml=np.full(n_cell, -1.0),
+        )
+
+        # assert
+        np.testing.assert_array_equal(volume, 1)
+        np.testing.assert_array_equal(counter_n_substeps, np.asarray(n_sd_in_cell) > 0)
+        np.testing.assert_array_equal(
+            counter_n_root_finding_iterations,
+            np.where(np.asarray(n_sd_in_cell) > 0, n_sd_in_cell, -1),
+        )
+        np.testing.assert_array_equal(
+            counter_n_activating,
+            np.where(np.asarray(n_sd_in_cell) > 0, n_sd_in_cell, -1),
+        )
@@ -0,0 +1,65 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+from PySDM.backends import CPU
+from PySDM.formulae import Formulae
+
+SOLVER_KWARGS = {
+    "dt_range": (1e-4, 1),
+    "adaptive": True,
+    "fuse": 32,
+    "multiplier": 2,
+    "RH_rtol": 1e-7,
+    "max_iters": 16,
+}
+
+
+class TestFormulaeCache:
+    @staticmethod
+    def test_kernels_shared_among_equivalent_formulae():
+        # arrange
+        backends = [CPU(Formulae(seed=seed)) for seed in (1, 2)]
+
+        # act
+        solvers = [
+            backend.make_condensation_solver(1, 1, **SOLVER_KWARGS)
+            for backend in backends
+        ]
+
+        # assert
+        assert solvers[0] is solvers[1]
+        assert backends[0].critical_volume_body is backends[1].critical_volume_body
+        assert backends[0].freeze_singular_body is backends[1].freeze_singular_body
+
+    @staticmethod
+    def test_kernels_not_shared_among_different_formulae():
+        # arrange
+        backends = [
+            CPU(Formulae(latent_heat=latent_heat))
+            for latent_heat in ("Kirchhoff", "Constant")
+        ]
+
+        # act
+        solvers = [
+            backend.make_condensation_solver(1, 1, **SOLVER_KWARGS)
+            for backend in backends
+        ]
+
+        # assert
+        assert solvers[0] is not solvers[1]
+        assert (
+            backends[0].temperature_pressure_RH_body
+            is not backends[1].temperature_pressure_RH_body
+        )
+
+    @staticmethod
+    def test_solver_not_shared_among_different_timesteps():
+        # arrange
+        backend = CPU()
+
+        # act
+        solvers = [
+            backend.make_condensation_solver(timestep, 1, **SOLVER_KWARGS)
+            for timestep in (1, 2)
+        ]
+
+        # assert
+        assert solvers[0] is not solvers[1]
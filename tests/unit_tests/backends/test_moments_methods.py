@@ -3,6 +3,7 @@ import numpy as np
 import pytest
 
 from PySDM import Formulae
+from PySDM.backends.impl_common import bin_spacing
 
 from ...backends_fixture import backend_class
 
@@ -48,3 +49,120 @@ def test_moments_range(backend_class, min_x, max_x, value, expected):
 
     # Assert
     assert moment_0.to_ndarray()[:] == moments.to_ndarray()[:] == expected
+
+
+@pytest.mark.parametrize(
+    "edges",
+    (
+        np.linspace(0, 1, 11),
+        np.logspace(-3, 0, 11),
+        np.asarray((0.1, 0.15, 0.2, 0.5, 0.55, 1)),
+        np.asarray((0, 0.5, np.inf)),
+    ),
+)
+@pytest.mark.parametrize(
+    "spacing",
+    (bin_spacing.ARBITRARY, bin_spacing.LINEAR, bin_spacing.LOGARITHMIC, None),
+)
+# pylint: disable=redefined-outer-name
+def test_spectrum_moments_bin_lookup(backend_class, edges, spacing):
+    # Arrange
+    if spacing is None:
+        spacing = bin_spacing.detect_bin_spacing(edges)
+    elif spacing == bin_spacing.LOGARITHMIC and edges[0] <= 0:
+        pytest.skip()
+    backend = backend_class(Formulae())
+    values = np.concatenate(
+        (edges[np.isfinite(edges)], np.random.default_rng(47).uniform(-0.1, 1.1, 64))
+    )
+    n_bins, n_sd = len(edges) - 1, len(values)
+    moment_0 = backend.Storage.empty((n_bins, 1), dtype=float)
+    moments = backend.Storage.empty((n_bins, 1), dtype=float)
+    storage = lambda x: backend.Storage.from_ndarray(np.asarray(x))
+
+    # Act
+    backend.spectrum_moments(
+        moment_0=moment_0,
+        moments=moments,
+        multiplicity=storage(np.arange(1, n_sd + 1)),
+        attr_data=storage(np.ones(n_sd)),
+        cell_id=storage(np.zeros(n_sd, dtype=np.int64)),
+        idx=storage(np.arange(n_sd)),
+        length=n_sd,
+        ranks=storage([1.0]),
+        x_bins=storage(edges),
+        x_attr=storage(values),
+        weighting_attribute=storage(np.ones(n_sd)),
+        weighting_rank=0,
+        x_bins_spacing=spacing,
+    )
+
+    # Assert
+    expected = [
+        np.arange(1, n_sd + 1)[(edges[k] <= values) & (values < edges[k + 1])].sum()
+        for k in range(n_bins)
+    ]
+    np.testing.assert_array_equal(moment_0.to_ndarray()[:, 0], expected)
+
+
+@pytest.mark.parametrize(
+    "edges, expected",
+    (
+        (np.linspace(0, 1, 11), bin_spacing.LINEAR),
+        (np.logspace(-3, 0, 11), bin_spacing.LOGARITHMIC),
+        (4 / 3 * np.pi * np.logspace(-8, -3, 101) ** 3, bin_spacing.LOGARITHMIC),
+        ((0.1, 0.15, 0.2, 0.5, 0.55, 1), bin_spacing.ARBITRARY),
+        ((0, 0.5, np.inf), bin_spacing.ARBITRARY),
+        ((0, 1), bin_spacing.LINEAR),
+    ),
+)
+def test_detect_bin_spacing(edges, expected):
+    assert bin_spacing.detect_bin_spacing(edges) == expected
+
+
+# pylint: disable=redefined-outer-name
+def test_spectrum_moments_multiple_ranks(backend_class):
+    # Arrange
+    backend = backend_class(Formulae())
+    rng = np.random.default_rng(48)
+    n_sd, n_cell = 64, 3
+    edges = np.linspace(0, 1, 6)
+    ranks = (0.5, 1, 2 / 3)
+    storage = lambda x: backend.Storage.from_ndarray(np.asarray(x))
+    args = {
+        "multiplicity": storage(rng.integers(1, 10, n_sd)),
+        "attr_data": storage(rng.uniform(1, 2, n_sd)),
+        "cell_id": storage(rng.integers(0, n_cell, n_sd)),
+        "idx": storage(np.arange(n_sd)),
+        "length": n_sd,
+        "x_bins": storage(edges),
+        "x_attr": storage(rng.uniform(0, 1, n_sd)),
+        "weighting_attribute": storage(np.ones(n_sd)),
+        "weighting_rank": 0,
+    }
+    shape = (len(edges) - 1, n_cell)
+    moment_0 = backend.Storage.empty(shape, dtype=float)
+    moments = backend.Storage.empty((len(ranks), *shape), dtype=float)
+
+    # Act
+    backend.spectrum_moments(
+        moment_0=moment_0, moments=moments, ranks=storage(ranks), **args
+    )
+
+    # Assert
+    multiplicity, attr_data, cell_id, x_attr = (
+        args[key].to_ndarray()
+        for key in ("multiplicity", "attr_data", "cell_id", "x_attr")
+    )
+    bin_id = np.digitize(x_attr, edges) - 1
+    for i, rank in enumerate(ranks):
+        expected = np.zeros(shape)
+        norm = np.zeros(shape)
+        np.add.at(expected, (bin_id, cell_id), multiplicity * attr_data**rank)
+        np.add.at(norm, (bin_id, cell_id), multiplicity)
+        np.testing.assert_allclose(moment_0.to_ndarray(), norm)
+        np.testing.assert_allclose(
+            moments.to_ndarray()[i],
+            np.divide(expected, norm, out=np.zeros(shape), where=norm != 0),
+            rtol=1e-6,
+        )
@@ -0,0 +1,66 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+import numpy as np
+import pytest
+
+from PySDM import Builder
+from PySDM.backends import CPU
+from PySDM.dynamics import AmbientThermodynamics, Condensation
+from PySDM.environments import Parcel
+from PySDM.physics import si
+
+
+def _make_particulator(n_sd, condensation):
+    builder = Builder(n_sd, backend=CPU())
+    env = Parcel(
+        dt=1 * si.s,
+        mass_of_dry_air=1 * si.kg,
+        p0=1000 * si.hPa,
+        q0=20 * si.g / si.kg,
+        T0=300 * si.K,
+        w=5 * si.m / si.s,
+    )
+    builder.set_environment(env)
+    builder.add_dynamic(AmbientThermodynamics())
+    builder.add_dynamic(condensation)
+    dry_volume = np.logspace(-22, -18, n_sd) * si.m**3
+    return builder.build(
+        attributes={
+            "n": np.full(n_sd, 1e8),
+            "dry volume": dry_volume,
+            "kappa times dry volume": 0.5 * dry_volume,
+            "volume": 10 * dry_volume,
+        }
+    )
+
+
+@pytest.mark.parametrize("rtol_thd", (1e-6, 1e-9))
+def test_adaptive_step_matches_fixed_step_with_same_substep_count(rtol_thd):
+    """the first substep of an adaptive step reuses droplet sizes obtained
+    while probing the substep count, results should not be affected by it"""
+    # arrange
+    n_sd = 8
+    adaptive = _make_particulator(
+        n_sd, Condensation(rtol_thd=rtol_thd, rtol_x=rtol_thd)
+    )
+    adaptive.run(1)
+    n_substeps = adaptive.dynamics["Condensation"].counters["n_substeps"][0]
+    assert n_substeps > 1
+
+    # act
+    fixed = _make_particulator(
+        n_sd,
+        Condensation(
+            rtol_thd=rtol_thd, rtol_x=rtol_thd, adaptive=False, substeps=n_substeps
+        ),
+    )
+    fixed.run(1)
+
+    # assert
+    np.testing.assert_array_equal(
+        adaptive.attributes["volume"].to_ndarray(),
+        fixed.attributes["volume"].to_ndarray(),
+    )
+    for var in ("thd", "qv"):
+        np.testing.assert_array_equal(
+            adaptive.environment[var].to_ndarray(), fixed.environment[var].to_ndarray()
+        )
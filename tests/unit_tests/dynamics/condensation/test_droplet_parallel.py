@@ -0,0 +1,89 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+import numpy as np
+import pytest
+
+from PySDM import Builder
+from PySDM.backends import CPU
+from PySDM.backends.impl_numba.methods.condensation_methods import (
+    CondensationMethods,
+)
+from PySDM.dynamics import AmbientThermodynamics, Condensation
+from PySDM.environments import Parcel
+from PySDM.physics import si
+
+
+def _particulator(n_sd, dry_volume, **condensation_kwargs):
+    builder = Builder(n_sd, backend=CPU())
+    env = Parcel(
+        dt=1 * si.s,
+        mass_of_dry_air=1 * si.kg,
+        p0=1000 * si.hPa,
+        q0=20 * si.g / si.kg,
+        T0=300 * si.K,
+        w=1 * si.m / si.s,
+    )
+    builder.set_environment(env)
+    builder.add_dynamic(AmbientThermodynamics())
+    builder.add_dynamic(Condensation(**condensation_kwargs))
+    return builder.build(
+        attributes={
+            "n": np.full(n_sd, 1e6),
+            "dry volume": dry_volume,
+            "kappa times dry volume": 0.5 * dry_volume,
+            "volume": 10 * dry_volume,
+        }
+    )
+
+
+def _run_parcel(n_sd, n_steps=10):
+    particulator = _particulator(n_sd, np.logspace(-21, -18, n_sd) * si.m**3)
+    particulator.run(n_steps)
+    return (
+        particulator.attributes["volume"].to_ndarray(),
+        particulator.environment["qv"].to_ndarray(),
+        particulator.dynamics["Condensation"].counters["n_substeps"].to_ndarray(),
+    )
+
+
+@pytest.mark.parametrize("n_sd", (4, 2 * CondensationMethods.DROPLET_PARALLEL_MIN_N_SD))
+def test_droplet_parallel_matches_serial(n_sd, monkeypatch):
+    # arrange
+    expected = _run_parcel(n_sd)
+    monkeypatch.setattr(
+        CondensationMethods, "droplet_parallel", staticmethod(lambda n_cell: False)
+    )
+
+    # act
+    actual = _run_parcel(n_sd)
+
+    # assert
+    for expected_item, actual_item in zip(expected, actual):
+        np.testing.assert_allclose(actual_item, expected_item, rtol=1e-10)
+
+
+@pytest.mark.parametrize("droplet_parallel", (True, False))
+def test_failed_droplets_discard_all_updates(droplet_parallel, monkeypatch):
+    # arrange
+    monkeypatch.setattr(
+        CondensationMethods,
+        "droplet_parallel",
+        staticmethod(lambda n_cell: droplet_parallel),
+    )
+    n_sd = 2 * CondensationMethods.DROPLET_PARALLEL_MIN_N_SD
+    particulator = _particulator(
+        n_sd, np.logspace(-22, -15, n_sd) * si.m**3, adaptive=False, max_iters=4
+    )
+    expected = particulator.attributes["volume"].to_ndarray().copy()
+
+    # act
+    with pytest.raises(RuntimeError):
+        particulator.run(1)
+
+    # assert
+    n_failed = particulator.dynamics["Condensation"].counters["n_failed"].to_ndarray()
+    assert 0 < n_failed[0] < n_sd
+    if not droplet_parallel:
+        assert n_failed[0] == 1  # serial solver stops at the first failure
+    np.testing.assert_array_equal(
+        particulator.attributes["volume"].to_ndarray(), expected
+    )
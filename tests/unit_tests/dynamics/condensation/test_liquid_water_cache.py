@@ -0,0 +1,82 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+import numpy as np
+import pytest
+
+from PySDM import Builder
+from PySDM.backends import CPU
+from PySDM.dynamics import AmbientThermodynamics, Condensation
+from PySDM.environments import Parcel
+from PySDM.physics import si
+
+
+def _make_particulator(n_sd=8):
+    builder = Builder(n_sd, backend=CPU())
+    env = Parcel(
+        dt=1 * si.s,
+        mass_of_dry_air=1 * si.kg,
+        p0=1000 * si.hPa,
+        q0=20 * si.g / si.kg,
+        T0=300 * si.K,
+        w=1 * si.m / si.s,
+    )
+    builder.set_environment(env)
+    builder.add_dynamic(AmbientThermodynamics())
+    builder.add_dynamic(Condensation())
+    dry_volume = np.logspace(-21, -18, n_sd) * si.m**3
+    return builder.build(
+        attributes={
+            "n": np.full(n_sd, 1e6),
+            "dry volume": dry_volume,
+            "kappa times dry volume": 0.5 * dry_volume,
+            "volume": 10 * dry_volume,
+        }
+    )
+
+
+def _liquid_water_mass(particulator):
+    return (
+        particulator.attributes["n"].to_ndarray()
+        @ particulator.attributes["volume"].to_ndarray()
+        * particulator.formulae.constants.rho_w
+    )
+
+
+def test_cached_liquid_water_matches_droplets():
+    # arrange
+    particulator = _make_particulator()
+
+    # act
+    particulator.run(3)
+
+    # assert
+    np.testing.assert_allclose(
+        particulator.dynamics["Condensation"].ml.to_ndarray(),
+        _liquid_water_mass(particulator),
+        rtol=1e-12,
+    )
+
+
+@pytest.mark.parametrize("attribute", ("n", "volume"))
+def test_cached_liquid_water_invalidated_by_attribute_update(attribute):
+    """changing multiplicities or volumes outside of condensation (and
+    marking them as updated) should give the same result as recomputing
+    the liquid water from scratch"""
+    # arrange
+    particulators = [_make_particulator() for _ in range(2)]
+    for particulator in particulators:
+        particulator.run(1)
+        data = particulator.attributes[attribute].data
+        data[:] = 2 * data
+        particulator.attributes.mark_updated(attribute)
+    particulators[1].dynamics["Condensation"].ml[:] = -1
+
+    # act
+    for particulator in particulators:
+        particulator.run(1)
+
+    # assert
+    for var in ("thd", "qv"):
+        np.testing.assert_array_equal(
+            particulators[0].environment[var].to_ndarray(),
+            particulators[1].environment[var].to_ndarray(),
+        )
@@ -0,0 +1,52 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+import numpy as np
+
+from PySDM import Builder
+from PySDM.backends import CPU
+from PySDM.dynamics import AmbientThermodynamics, Condensation
+from PySDM.environments import Parcel
+from PySDM.physics import si
+
+
+def _run_parcel(*, quasi_equilibrium, n_sd=16, n_steps=30):
+    builder = Builder(n_sd, backend=CPU())
+    env = Parcel(
+        dt=1 * si.s,
+        mass_of_dry_air=1 * si.kg,
+        p0=1000 * si.hPa,
+        q0=20 * si.g / si.kg,
+        T0=300 * si.K,
+        w=1 * si.m / si.s,
+    )
+    builder.set_environment(env)
+    builder.add_dynamic(AmbientThermodynamics())
+    builder.add_dynamic(Condensation(quasi_equilibrium=quasi_equilibrium))
+    dry_volume = np.logspace(-24, -18, n_sd) * si.m**3
+    particulator = builder.build(
+        attributes={
+            "n": np.full(n_sd, 1e8),
+            "dry volume": dry_volume,
+            "kappa times dry volume": 0.5 * dry_volume,
+            "volume": 10 * dry_volume,
+        }
+    )
+    n_iterations = 0
+    for _ in range(n_steps):
+        particulator.run(1)
+        n_iterations += particulator.dynamics["Condensation"].n_iterations.to_ndarray()
+    return particulator.attributes["volume"].to_ndarray(), n_iterations
+
+
+def test_quasi_equilibrium_saves_iterations_without_affecting_results():
+    """the smallest haze droplets relax to their Koehler equilibrium within
+    a fraction of the timestep, setting them directly to the equilibrium
+    size is cheaper than solving the implicit growth equation"""
+    # arrange
+    volume_implicit, n_iterations_implicit = _run_parcel(quasi_equilibrium=False)
+
+    # act
+    volume_hybrid, n_iterations_hybrid = _run_parcel(quasi_equilibrium=True)
+
+    # assert
+    np.testing.assert_allclose(volume_hybrid, volume_implicit, rtol=1e-3)
+    assert n_iterations_hybrid.sum() < n_iterations_implicit.sum()
@@ -0,0 +1,53 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+import numpy as np
+
+from PySDM import Builder
+from PySDM.backends import CPU
+from PySDM.dynamics import AmbientThermodynamics, Condensation
+from PySDM.environments import Parcel
+from PySDM.physics import si
+
+
+def _run_parcel(*, warm_start, n_sd=16, n_steps=30, n_steps_counted=10):
+    builder = Builder(n_sd, backend=CPU())
+    env = Parcel(
+        dt=1 * si.s,
+        mass_of_dry_air=1 * si.kg,
+        p0=1000 * si.hPa,
+        q0=20 * si.g / si.kg,
+        T0=300 * si.K,
+        w=1 * si.m / si.s,
+    )
+    builder.set_environment(env)
+    builder.add_dynamic(AmbientThermodynamics())
+    builder.add_dynamic(Condensation(warm_start=warm_start))
+    dry_volume = np.logspace(-22, -18, n_sd) * si.m**3
+    particulator = builder.build(
+        attributes={
+            "n": np.full(n_sd, 1e8),
+            "dry volume": dry_volume,
+            "kappa times dry volume": 0.5 * dry_volume,
+            "volume": 10 * dry_volume,
+        }
+    )
+    particulator.run(n_steps - n_steps_counted)
+    n_iterations = 0
+    for _ in range(n_steps_counted):
+        particulator.run(1)
+        n_iterations += particulator.dynamics["Condensation"].n_iterations.to_ndarray()
+    return particulator.attributes["volume"].to_ndarray(), n_iterations
+
+
+def test_warm_start_saves_iterations_without_affecting_results():
+    """once the initial transient is over, droplet growth increments change
+    little from step to step and warm-started root finding pays off"""
+    # arrange
+    volume_cold, n_iterations_cold = _run_parcel(warm_start=False)
+
+    # act
+    volume_warm, n_iterations_warm = _run_parcel(warm_start=True)
+
+    # assert
+    np.testing.assert_allclose(volume_warm, volume_cold, rtol=1e-4)
+    assert (n_iterations_cold > 0).all()
+    assert n_iterations_warm.sum() < n_iterations_cold.sum()
@@ -18,7 +18,14 @@ class DisplacementSettings:
         self.sedimentation = False
         self.dt = None
 
-    def get_displacement(self, backend, scheme, adaptive=True):
+    def get_displacement(
+        self,
+        backend,
+        scheme,
+        adaptive=True,
+        spatially_variable_substeps=False,
+        fused=False,
+    ):
         formulae = Formulae(particle_advection=scheme)
         particulator = DummyParticulator(backend, n_sd=len(self.n), formulae=formulae)
         particulator.environment = DummyEnvironment(
@@ -36,7 +43,12 @@ class DisplacementSettings:
             "position in cell": position_in_cell,
         }
         particulator.build(attributes)
-        sut = Displacement(enable_sedimentation=self.sedimentation, adaptive=adaptive)
+        sut = Displacement(
+            enable_sedimentation=self.sedimentation,
+            adaptive=adaptive,
+            spatially_variable_substeps=spatially_variable_substeps,
+            fused=fused,
+        )
         sut.register(particulator)
         sut.upload_courant_field(self.courant_field_data)
 
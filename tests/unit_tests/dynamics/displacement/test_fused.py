@@ -0,0 +1,163 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+import numpy as np
+import pytest
+
+from PySDM.backends import CPU
+from PySDM.backends.impl_numba.methods.collisions_methods import CollisionsMethods
+
+from .displacement_settings import DisplacementSettings
+
+
+class _TerminalVelocity:
+    def __init__(self, particulator, values):
+        self.values = particulator.backend.Storage.from_ndarray(values)
+
+    def get(self):
+        return self.values
+
+
+def _settings(n_dims, n_sd=64, seed=44):
+    rng = np.random.default_rng(seed)
+    settings = DisplacementSettings()
+    settings.dt = 1
+    settings.sedimentation = True
+    settings.n = np.ones(n_sd, dtype=np.int64)
+    settings.volume = rng.uniform(1, 2, n_sd)
+    if n_dims == 1:
+        settings.grid = (8,)
+        settings.courant_field_data = (rng.uniform(-0.3, 0.3, 9),)
+    else:
+        settings.grid = (6, 8)
+        settings.courant_field_data = (
+            rng.uniform(-0.3, 0.3, (7, 8)),
+            rng.uniform(-0.3, 0.3, (6, 9)),
+        )
+    settings.positions = [
+        rng.uniform(0, n_cells, n_sd).tolist() for n_cells in settings.grid
+    ]
+    return settings, rng.uniform(0, 0.5, n_sd)
+
+
+@pytest.mark.parametrize("n_dims", (1, 2))
+@pytest.mark.parametrize("spatially_variable_substeps", (False, True))
+def test_fused_matches_unfused(n_dims, spatially_variable_substeps):
+    # arrange
+    results = {}
+    for fused in (False, True):
+        settings, terminal_velocity = _settings(n_dims)
+        sut, particulator = settings.get_displacement(
+            CPU,
+            scheme="ImplicitInSpace",
+            spatially_variable_substeps=spatially_variable_substeps,
+            fused=fused,
+        )
+        particulator.attributes._ParticleAttributes__attributes[
+            "terminal velocity"
+        ] = _TerminalVelocity(particulator, terminal_velocity)
+
+        # act
+        precipitation = []
+        for _ in range(3):
+            sut()
+            precipitation.append(sut.precipitation_in_last_step)
+
+        results[fused] = {
+            "precipitation": precipitation,
+            "super_droplet_count": particulator.attributes.super_droplet_count,
+            **{
+                attr: particulator.attributes[attr].to_ndarray()
+                for attr in ("cell id", "cell origin", "position in cell", "volume")
+            },
+        }
+
+    # assert
+    assert results[True]["super_droplet_count"] < len(terminal_velocity)
+    assert sum(results[True]["precipitation"]) > 0
+    for key, value in results[False].items():
+        np.testing.assert_array_equal(results[True][key], value)
+
+
+@pytest.mark.parametrize("n_dims", (1, 2))
+def test_incremental_cell_sort_matches_full_sort(n_dims, monkeypatch):
+    # arrange
+    n_incremental_sorts = [0]
+    incremental_sort = (
+        CollisionsMethods._incremental_sort_by_cell_id_and_update_cell_start
+    )
+
+    def counting_incremental_sort(*args):
+        n_incremental_sorts[0] += 1
+        incremental_sort(*args)
+
+    monkeypatch.setattr(
+        CollisionsMethods,
+        "_incremental_sort_by_cell_id_and_update_cell_start",
+        staticmethod(counting_incremental_sort),
+    )
+
+    results = {}
+    for max_movers_fraction in (0, 1):
+        monkeypatch.setattr(
+            CollisionsMethods,
+            "INCREMENTAL_SORT_MAX_MOVERS_FRACTION",
+            max_movers_fraction,
+        )
+        settings, _ = _settings(n_dims)
+        settings.sedimentation = False
+        sut, particulator = settings.get_displacement(
+            CPU, scheme="ImplicitInSpace", fused=True
+        )
+
+        # act
+        results[max_movers_fraction] = []
+        for _ in range(3):
+            _ = particulator.attributes.cell_start
+            sut()
+            results[max_movers_fraction].append(
+                (
+                    particulator.attributes.cell_start.to_ndarray(),
+                    particulator.attributes._ParticleAttributes__idx.to_ndarray(),
+                )
+            )
+
+    # assert
+    assert n_incremental_sorts[0] == 3
+    for (cell_start, idx), (expected_cell_start, expected_idx) in zip(
+        results[1], results[0]
+    ):
+        np.testing.assert_array_equal(cell_start, expected_cell_start)
+        np.testing.assert_array_equal(idx, expected_idx)
+
+
+@pytest.mark.parametrize("n_dims", (1, 2))
+def test_fused_after_removal_of_particles(n_dims):
+    # arrange
+    n_sd = 256
+    results = {}
+    for fused in (False, True):
+        settings, _ = _settings(n_dims, n_sd=n_sd)
+        settings.sedimentation = False
+        sut, particulator = settings.get_displacement(
+            CPU, scheme="ImplicitInSpace", fused=fused
+        )
+        n = particulator.attributes["n"].to_ndarray()
+        n[np.random.default_rng(44).choice(n_sd, n_sd // 4, replace=False)] = 0
+        particulator.attributes["n"].upload(n)
+        particulator.attributes.healthy = False
+        particulator.attributes.sanitize()
+
+        # act
+        for _ in range(3):
+            _ = particulator.attributes.cell_start
+            sut()
+        results[fused] = {
+            attr: particulator.attributes[attr].to_ndarray()
+            for attr in ("cell id", "cell origin", "position in cell")
+        }
+        results[fused]["cell start"] = particulator.attributes.cell_start.to_ndarray()
+
+    # assert
+    epoch_markers, _, positions, _ = particulator.attributes.track_cell_changes()
+    assert len(epoch_markers) == len(positions) == n_sd
+    for key, value in results[False].items():
+        np.testing.assert_array_equal(results[True][key], value)
@@ -0,0 +1,80 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+import numpy as np
+import pytest
+
+from PySDM.backends import CPU
+
+from .displacement_settings import DisplacementSettings
+
+
+def _settings(sedimentation=False):
+    settings = DisplacementSettings()
+    settings.grid = (5, 5)
+    courant_x = np.full((6, 5), 0.1)
+    courant_x[1, :] = 0.5
+    settings.courant_field_data = (courant_x, np.zeros((5, 6)))
+    settings.n = np.ones(2, dtype=np.int64)
+    settings.volume = np.ones(2)
+    settings.positions = [[1.5, 3.5], [2.5, 2.5]]
+    settings.sedimentation = sedimentation
+    settings.dt = 1
+    return settings
+
+
+class TestSpatiallyVariableSubsteps:
+    @staticmethod
+    def test_n_substeps_follow_local_courant_gradient():
+        # arrange
+        sut, _ = _settings().get_displacement(
+            CPU, scheme="ImplicitInSpace", spatially_variable_substeps=True
+        )
+        uniform, _ = _settings().get_displacement(CPU, scheme="ImplicitInSpace")
+
+        # act
+        n_substeps = sut._n_substeps_in_cell.reshape(5, 5)
+
+        # assert
+        assert sut._n_substeps == uniform._n_substeps > 1
+        np.testing.assert_array_equal(n_substeps[(0, 1, 2, 4), :], sut._n_substeps)
+        np.testing.assert_array_equal(n_substeps[3, :], 1)
+
+    @staticmethod
+    @pytest.mark.parametrize("sedimentation", (False, True))
+    def test_results_match_uniform_substeps(sedimentation):
+        # arrange
+        sut, particulator = _settings(sedimentation).get_displacement(
+            CPU, scheme="ImplicitInSpace", spatially_variable_substeps=True
+        )
+        uniform, uniform_particulator = _settings(sedimentation).get_displacement(
+            CPU, scheme="ImplicitInSpace"
+        )
+        for prtcl in (particulator, uniform_particulator):
+            prtcl.attributes._ParticleAttributes__attributes[
+                "terminal velocity"
+            ] = _ConstantTerminalVelocity(prtcl)
+
+        # act
+        sut()
+        uniform()
+
+        # assert
+        np.testing.assert_array_equal(sut._n_substeps_of_particle.to_ndarray(), (64, 1))
+        positions, expected = (
+            prtcl.attributes["cell origin"].to_ndarray()
+            + prtcl.attributes["position in cell"].to_ndarray()
+            for prtcl in (particulator, uniform_particulator)
+        )
+        np.testing.assert_array_equal(positions[:, 0], expected[:, 0])
+        np.testing.assert_allclose(positions[:, 1], expected[:, 1], rtol=1e-12)
+        if sedimentation:
+            assert positions[1, 1] < 2.5
+
+
+class _ConstantTerminalVelocity:
+    def __init__(self, particulator):
+        self.values = particulator.backend.Storage.from_ndarray(
+            np.full(particulator.n_sd, 0.1)
+        )
+
+    def get(self):
+        return self.values
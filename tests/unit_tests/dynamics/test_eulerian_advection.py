@@ -1,6 +1,16 @@
 # pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+import os
+import subprocess
+import sys
+from pathlib import Path
+from threading import Event
+
+import numba
 import numpy as np
+import pytest
 
+import PySDM
+from PySDM.backends import CPU
 from PySDM.dynamics import EulerianAdvection
 
 from ...backends_fixture import backend_class
@@ -10,6 +20,13 @@ from ..dummy_particulator import DummyParticulator
 assert hasattr(backend_class, "_pytestfixturefunction")
 
 
+@numba.njit(parallel=True)
+def _parallel_kernel(array, n_repeats):
+    for _ in range(n_repeats):
+        for i in numba.prange(array.shape[0]):  # pylint: disable=not-an-iterable
+            array[i] = np.sin(array[i]) + 1
+
+
 class TestEulerianAdvection:
     @staticmethod
     # pylint: disable=redefined-outer-name
@@ -39,3 +56,105 @@ class TestEulerianAdvection:
         np.testing.assert_array_equal(
             env.get_thd(), env.get_predicted("thd").to_ndarray().reshape(grid)
         )
+
+    @staticmethod
+    def test_pipelined_solvers_run_in_background():
+        # Arrange
+        particulator = DummyParticulator(CPU)
+        grid = (11, 13)
+        env = DummyEnvironment(grid=grid, halo=3)
+        env.register(particulator)
+        particulator.environment = env
+        started, release = Event(), Event()
+
+        def solvers():
+            started.set()
+            assert release.wait(timeout=10)
+
+        sut = EulerianAdvection(solvers, pipelined=True)
+        sut.register(particulator)
+
+        # Act
+        sut()
+        assert started.wait(timeout=10)
+        still_running = sut.thread.is_alive()
+        release.set()
+        sut.wait()
+
+        # Assert
+        assert still_running
+        assert sut.thread is None
+
+    @staticmethod
+    def test_pipelined_solvers_exception_reraised_on_wait():
+        # Arrange
+        particulator = DummyParticulator(CPU)
+        env = DummyEnvironment(grid=(11, 13), halo=3)
+        env.register(particulator)
+        particulator.environment = env
+
+        def solvers():
+            raise ValueError()
+
+        sut = EulerianAdvection(solvers, pipelined=True)
+        sut.register(particulator)
+
+        # Act
+        sut()
+
+        # Assert
+        with pytest.raises(ValueError):
+            sut.wait()
+
+    @staticmethod
+    def test_pipelined_parallel_solvers_overlapping_parallel_kernels():
+        # Arrange
+        particulator = DummyParticulator(CPU)
+        env = DummyEnvironment(grid=(11, 13), halo=3)
+        env.register(particulator)
+        particulator.environment = env
+        field, particles = np.zeros(10000), np.zeros(10000)
+
+        sut = EulerianAdvection(lambda: _parallel_kernel(field, 1000), pipelined=True)
+        sut.register(particulator)
+
+        # Act
+        for _ in range(3):
+            sut()
+            _parallel_kernel(particles, 1000)
+        sut.wait()
+
+        # Assert
+        np.testing.assert_array_equal(field, particles)
+
+    @staticmethod
+    def test_pipelined_raises_with_workqueue_threading_layer():
+        # Arrange
+        code = "; ".join(
+            (
+                "from PySDM.dynamics import EulerianAdvection",
+                "from PySDM.dynamics.eulerian_advection import _parallel_noop",
+                "import numpy as np",
+                "_parallel_noop(np.empty(1))",
+                "builder = type('Builder', (), {'particulator': None})()",
+                "EulerianAdvection(lambda: None, pipelined=True).register(builder)",
+            )
+        )
+        env = {
+            **os.environ,
+            "NUMBA_THREADING_LAYER": "workqueue",
+            "PYTHONPATH": str(Path(PySDM.__file__).parent.parent),
+        }
+
+        # Act
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            env=env,
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+
+        # Assert
+        assert result.returncode != 0
+        assert "thread-safe Numba threading layer" in result.stderr
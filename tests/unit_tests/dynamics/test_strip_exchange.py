@@ -0,0 +1,180 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+import multiprocessing
+
+import numpy as np
+import pytest
+
+from PySDM import Formulae
+from PySDM.backends import CPU
+from PySDM.dynamics import Displacement, StripFieldExchange, StripParticleMigration
+from PySDM.impl.strip_decomposition import StripDecomposition
+
+from ..dummy_environment import DummyEnvironment
+from ..dummy_particulator import DummyParticulator
+
+GRID = (6, 4)
+N_SD = 48
+N_STEPS = 5
+
+
+def _attributes_and_courant_field():
+    rng = np.random.default_rng(44)
+    positions = np.array([rng.uniform(0, n_cells, N_SD) for n_cells in GRID])
+    attributes = {
+        "n": rng.integers(1, 100, N_SD),
+        "volume": rng.uniform(1, 2, N_SD),
+        "freezing temperature": rng.uniform(250, 270, N_SD),
+        "position": positions,
+    }
+    courant_field = (
+        np.full((GRID[0] + 1, GRID[1]), 0.45),
+        np.zeros((GRID[0], GRID[1] + 1)),
+    )
+    return attributes, courant_field
+
+
+def _particulator(n_sd, courant_field, attributes):
+    particulator = DummyParticulator(
+        CPU, n_sd=n_sd, formulae=Formulae(particle_advection="ImplicitInSpace")
+    )
+    particulator.environment = DummyEnvironment(
+        timestep=1, grid=GRID, courant_field_data=courant_field, halo=1
+    )
+    particulator.environment.register(particulator)
+    cell_id, cell_origin, position_in_cell = particulator.mesh.cellular_attributes(
+        attributes.pop("position")
+    )
+    attributes["cell id"] = cell_id
+    attributes["cell origin"] = cell_origin
+    attributes["position in cell"] = position_in_cell
+    return particulator
+
+
+def _displacement(particulator, courant_field, fused=False):
+    displacement = Displacement(fused=fused)
+    displacement.register(particulator)
+    displacement.upload_courant_field(courant_field)
+    return displacement
+
+
+def _state(particulator):
+    attributes = particulator.attributes
+    return np.column_stack(
+        (
+            attributes["volume"].to_ndarray(),
+            attributes["freezing temperature"].to_ndarray(),
+            attributes["n"].to_ndarray(),
+            attributes["cell origin"].to_ndarray().T,
+            attributes["position in cell"].to_ndarray().T,
+        )
+    )
+
+
+def _worker(decomposition, rank, queue, fused):
+    attributes, courant_field = _attributes_and_courant_field()
+    particulator = _particulator(N_SD, courant_field, attributes)
+    particulator.build(decomposition.select(rank, attributes, N_SD))
+    displacement = _displacement(particulator, courant_field, fused)
+    migration = StripParticleMigration(decomposition, rank)
+    migration.register(particulator)
+    field_exchange = StripFieldExchange(decomposition, rank)
+    field_exchange.register(particulator)
+
+    for _ in range(N_STEPS):
+        migration()  # note: removes padding, see StripDecomposition.select()
+        _ = particulator.attributes.cell_start  # as if sorted by, e.g., collisions
+        displacement()
+    migration()
+
+    for var in ("thd", "qv"):
+        particulator.environment.get_predicted(var).upload(
+            np.full(particulator.mesh.n_cell, rank + (var == "qv") * 10.0)
+        )
+    field_exchange()
+
+    queue.put(
+        (
+            rank,
+            _state(particulator),
+            {
+                var: particulator.environment.get_predicted(var).to_ndarray()
+                for var in ("thd", "qv")
+            },
+        )
+    )
+    decomposition.close()
+
+
+@pytest.mark.parametrize("n_strips", (2, 3))
+@pytest.mark.parametrize("fused", (False, True))
+def test_strip_decomposition_matches_single_process(n_strips, fused):
+    # arrange
+    attributes, courant_field = _attributes_and_courant_field()
+    particulator = _particulator(N_SD, courant_field, attributes)
+    particulator.build(attributes)
+    displacement = _displacement(particulator, courant_field)
+    for _ in range(N_STEPS):
+        displacement()
+    expected = _state(particulator)
+
+    context = multiprocessing.get_context("spawn")
+    decomposition = StripDecomposition(
+        grid=GRID,
+        n_strips=n_strips,
+        n_extensive_attributes=1,
+        n_maximum_attributes=1,
+        capacity=N_SD,
+        barrier=context.Barrier(n_strips),
+    )
+    queue = context.Queue()
+    workers = [
+        context.Process(target=_worker, args=(decomposition, rank, queue, fused))
+        for rank in range(n_strips)
+    ]
+
+    # act
+    for worker in workers:
+        worker.start()
+    results = sorted(queue.get(timeout=300) for _ in workers)
+    for worker in workers:
+        worker.join()
+    decomposition.close()
+    decomposition.unlink()
+
+    # assert
+    assert all(worker.exitcode == 0 for worker in workers)
+    for rank, state, _ in results:
+        np.testing.assert_array_equal(
+            decomposition.owner_of(state[:, 3].astype(int)), rank
+        )
+    actual = np.concatenate([state for _, state, _ in results])
+    assert actual.shape == expected.shape
+    np.testing.assert_allclose(
+        actual[np.lexsort(actual.T)], expected[np.lexsort(expected.T)], rtol=1e-12
+    )
+    owner = np.repeat(decomposition.owner_of(np.arange(GRID[0])), GRID[1])
+    for _, _, fields in results:
+        np.testing.assert_array_equal(fields["thd"], owner)
+        np.testing.assert_array_equal(fields["qv"], owner + 10)
+
+
+def test_strip_migration_raises_for_unexpected_attributes():
+    # arrange
+    attributes, courant_field = _attributes_and_courant_field()
+    particulator = _particulator(N_SD, courant_field, attributes)
+    particulator.build(attributes)
+    barrier = multiprocessing.get_context("spawn").Barrier(1)
+    decomposition = StripDecomposition(
+        grid=GRID, n_strips=1, n_extensive_attributes=1, capacity=N_SD, barrier=barrier
+    )
+    migration = StripParticleMigration(decomposition, 0)
+    migration.register(particulator)
+
+    # act
+    with pytest.raises(ValueError, match="maximum"):
+        migration()
+
+    # assert
+    assert barrier.broken
+    decomposition.close()
+    decomposition.unlink()
@@ -0,0 +1,125 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+import numpy as np
+import pytest
+
+from PySDM import Builder
+from PySDM.backends import CPU
+from PySDM.backends.impl_numba.storage import Storage
+from PySDM.dynamics import AmbientThermodynamics, Condensation
+from PySDM.environments import HostCoupled
+from PySDM.physics import si
+
+GRID = (3, 4)
+N_SD_PER_CELL = 4
+DT = 1 * si.s
+
+
+class _StandInHost:
+    """minimal stand-in for a dynamical core: horizontal mixing of moisture
+    and heat and compression of the dry air, the microphysics coupled through
+    `HostCoupled.step()`"""
+
+    def __init__(self):
+        self.qv = np.linspace(18, 22, np.prod(GRID)).reshape(GRID) * si.g / si.kg
+        self.thd = np.full(GRID, 300 * si.K)
+        self.rhod = np.linspace(1, 1.1, np.prod(GRID)).reshape(GRID) * si.kg / si.m**3
+
+    def step(self):
+        for field in (self.qv, self.thd):
+            field[:] = (field + np.roll(field, 1, axis=0)) / 2
+        self.rhod *= 1.01
+
+
+class _Probe:
+    """records current and predicted dry-air density as seen by dynamics"""
+
+    def __init__(self):
+        self.particulator = None
+        self.records = []
+
+    def register(self, builder):
+        self.particulator = builder.particulator
+
+    def __call__(self):
+        environment = self.particulator.environment
+        self.records.append(
+            (
+                environment["rhod"].to_ndarray().copy(),
+                environment.get_predicted("rhod").to_ndarray().copy(),
+            )
+        )
+
+
+def _run(n_steps=4):
+    host = _StandInHost()
+    env = HostCoupled(
+        dt=DT,
+        grid=GRID,
+        size=(300 * si.m, 400 * si.m),
+        qv=host.qv,
+        thd=host.thd,
+        rhod=host.rhod,
+    )
+    n_sd = N_SD_PER_CELL * env.mesh.n_cell
+    builder = Builder(n_sd, backend=CPU())
+    builder.set_environment(env)
+    builder.add_dynamic(AmbientThermodynamics())
+    builder.add_dynamic(Condensation())
+    probe = _Probe()
+    builder.add_dynamic(probe)
+    dry_volume = np.tile(np.logspace(-22, -20, N_SD_PER_CELL), env.mesh.n_cell)
+    particulator = builder.build(
+        attributes={
+            "n": np.full(n_sd, 1e9),
+            "dry volume": dry_volume,
+            "kappa times dry volume": 0.5 * dry_volume,
+            "volume": 10 * dry_volume,
+            "cell id": np.repeat(np.arange(env.mesh.n_cell), N_SD_PER_CELL),
+        }
+    )
+
+    tendencies = []
+    for step in range(n_steps):
+        rhod = host.rhod.copy()
+        host.step()
+        before = host.qv.copy(), host.thd.copy()
+        result = env.step(DT)
+        np.testing.assert_allclose(result["qv"], (host.qv - before[0]) / DT)
+        np.testing.assert_allclose(result["thd"], (host.thd - before[1]) / DT)
+        tendencies.append({key: value.copy() for key, value in result.items()})
+        np.testing.assert_array_equal(probe.records[step][0], rhod.ravel())
+        np.testing.assert_array_equal(probe.records[step][1], host.rhod.ravel())
+    return host, particulator, tendencies
+
+
+@pytest.mark.parametrize("shared", (True, False))
+def test_host_coupled_matches_copying(monkeypatch, shared):
+    # arrange
+    with monkeypatch.context() as patch:
+        patch.setattr(Storage, "view_of_ndarray", staticmethod(lambda _: None))
+        expected_host, _, expected_tendencies = _run()
+    if not shared:
+        monkeypatch.setattr(Storage, "view_of_ndarray", staticmethod(lambda _: None))
+
+    # act
+    host, particulator, tendencies = _run()
+
+    # assert
+    for var in ("qv", "thd", "rhod"):
+        # pylint: disable=protected-access
+        assert shared == particulator.environment._shares_memory(var)
+    assert (tendencies[-1]["qv"] != 0).all()
+    np.testing.assert_array_equal(host.qv, expected_host.qv)
+    np.testing.assert_array_equal(host.thd, expected_host.thd)
+    for actual_item, expected_item in zip(tendencies, expected_tendencies):
+        for key, value in expected_item.items():
+            np.testing.assert_array_equal(actual_item[key], value)
+
+
+def test_host_coupled_timestep_mismatch():
+    # arrange
+    _, particulator, _ = _run(n_steps=0)
+
+    # act & assert
+    with pytest.raises(ValueError):
+        particulator.environment.step(2 * DT)
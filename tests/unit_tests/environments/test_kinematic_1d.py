@@ -0,0 +1,133 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+import numpy as np
+import pytest
+
+from PySDM import Builder
+from PySDM.backends import CPU
+from PySDM.backends.impl_numba.storage import Storage
+from PySDM.dynamics import AmbientThermodynamics, Condensation, EulerianAdvection
+from PySDM.environments.kinematic_1d import Kinematic1D
+from PySDM.impl.mesh import Mesh
+from PySDM.initialisation.sampling import spatial_sampling, spectral_sampling
+from PySDM.initialisation.spectra import Lognormal
+from PySDM.physics import si
+
+GRID = (16,)
+HALO = 2
+
+
+class _Advectee:
+    def __init__(self, data):
+        self.data = np.pad(data, HALO)
+
+    def get(self):
+        return self.data[HALO:-HALO]
+
+
+class _Solver:
+    """mimicking PyMPDATA solver with a haloed advectee"""
+
+    def __init__(self, qv):
+        self.advectee = _Advectee(qv)
+
+    def __call__(self):
+        interior = self.advectee.get()
+        interior[:] = (interior + np.roll(interior, 1)) / 2
+
+
+class _Probe:
+    """records current and predicted fields as seen by dynamics following
+    the Eulerian advection"""
+
+    def __init__(self):
+        self.particulator = None
+        self.records = []
+
+    def register(self, builder):
+        self.particulator = builder.particulator
+
+    def __call__(self):
+        environment = self.particulator.environment
+        self.records.append(
+            [environment[var].to_ndarray().copy() for var in ("qv", "thd")]
+            + [
+                environment.get_predicted(var).to_ndarray().copy()
+                for var in ("qv", "thd")
+            ]
+        )
+
+
+def _run(n_steps=5, n_sd=64):
+    z_max = 1600 * si.m
+    env = Kinematic1D(
+        dt=1 * si.s,
+        mesh=Mesh(grid=GRID, size=(z_max,)),
+        thd_of_z=lambda z: 300 * si.K + z * si.K / si.km,
+        rhod_of_z=lambda z: 1.1 * si.kg / si.m**3
+        - z * 0.1 * si.kg / si.m**3 / si.km,
+    )
+    builder = Builder(n_sd, backend=CPU())
+    builder.set_environment(env)
+    solver = _Solver(np.linspace(15, 5, GRID[0]) * si.g / si.kg)
+    builder.add_dynamic(AmbientThermodynamics())
+    builder.add_dynamic(Condensation())
+    builder.add_dynamic(EulerianAdvection(solver))
+    probe = _Probe()
+    builder.add_dynamic(probe)
+    attributes = env.init_attributes(
+        spatial_discretisation=spatial_sampling.Pseudorandom(),
+        spectral_discretisation=spectral_sampling.ConstantMultiplicity(
+            Lognormal(norm_factor=1e8 / si.kg, m_mode=50 * si.nm, s_geom=1.4)
+        ),
+        kappa=0.5,
+    )
+    particulator = builder.build(attributes=attributes)
+    particulator.run(n_steps)
+    result = {
+        "qv": env["qv"].to_ndarray(),
+        "thd": env["thd"].to_ndarray(),
+        "volume": particulator.attributes["volume"].to_ndarray(),
+        "advectee": solver.advectee.get().copy(),
+        "probe": np.asarray(probe.records),
+    }
+    env.sync()
+    return result, np.shares_memory(env.get_predicted("qv").data, solver.advectee.data)
+
+
+def test_advectee_memory_shared_matches_copies(monkeypatch):
+    # arrange
+    np.random.seed(44)
+    expected, expected_shared = _run()
+    monkeypatch.setattr(Storage, "view_of_ndarray", staticmethod(lambda _: None))
+
+    # act
+    np.random.seed(44)
+    actual, actual_shared = _run()
+
+    # assert
+    assert expected_shared
+    assert not actual_shared
+    for key, value in expected.items():
+        np.testing.assert_array_equal(actual[key], value)
+
+
+@pytest.mark.parametrize(
+    "array, shared",
+    (
+        (np.zeros(5), True),
+        (np.zeros((3, 4)), True),
+        (np.zeros((5, 7))[1:-1, 1:-1], False),
+        (np.zeros(5, dtype=int), False),
+    ),
+)
+def test_view_of_ndarray(array, shared):
+    # act
+    sut = Storage.view_of_ndarray(array)
+
+    # assert
+    if shared:
+        assert sut.shape == (array.size,)
+        sut[:] = 1
+        np.testing.assert_array_equal(array, 1)
+    else:
+        assert sut is None
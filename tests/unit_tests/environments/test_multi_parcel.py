@@ -0,0 +1,116 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+import numpy as np
+import pytest
+
+from PySDM import Builder
+from PySDM.backends import CPU
+from PySDM.dynamics import AmbientThermodynamics, Coalescence, Condensation
+from PySDM.dynamics.collisions.collision_kernels import Golovin
+from PySDM.environments import MultiParcel, Parcel
+from PySDM.physics import si
+
+N_SD_PER_PARCEL = 8
+N_STEPS = 20
+
+PARAMS = {
+    "mass_of_dry_air": np.asarray((1, 2, 0.5)) * si.kg,
+    "p0": np.asarray((1000, 950, 1000)) * si.hPa,
+    "q0": np.asarray((20, 18, 22)) * si.g / si.kg,
+    "T0": np.asarray((300, 298, 301)) * si.K,
+    "w": np.asarray((0.5, 1, 2)) * si.m / si.s,
+}
+KAPPA = np.asarray((0.5, 1.2, 0.2))
+R_DRY = np.logspace(-8, -6.5, N_SD_PER_PARCEL) * si.m
+N_IN_DV = np.asarray((1e8, 5e8, 2e9))[:, None] * np.ones(N_SD_PER_PARCEL)
+
+
+def _run(environment, n_sd, kappa, n_in_dv):
+    builder = Builder(n_sd, backend=CPU())
+    builder.set_environment(environment)
+    builder.add_dynamic(AmbientThermodynamics())
+    builder.add_dynamic(Condensation())
+    particulator = builder.build(
+        attributes=environment.init_attributes(
+            n_in_dv=n_in_dv, kappa=kappa, r_dry=R_DRY
+        )
+    )
+    particulator.run(N_STEPS)
+    return {
+        "volume": particulator.attributes["volume"].to_ndarray(),
+        "qv": particulator.environment["qv"].to_ndarray(),
+        "T": particulator.environment["T"].to_ndarray(),
+        "z": particulator.environment["z"].to_ndarray(),
+        "dv": np.atleast_1d(particulator.mesh.dv),
+    }
+
+
+def test_multi_parcel_matches_separate_parcels():
+    # arrange
+    expected = [
+        _run(
+            Parcel(dt=1 * si.s, **{key: value[i] for key, value in PARAMS.items()}),
+            N_SD_PER_PARCEL,
+            KAPPA[i],
+            N_IN_DV[i],
+        )
+        for i in range(len(KAPPA))
+    ]
+
+    # act
+    actual = _run(
+        MultiParcel(dt=1 * si.s, **PARAMS),
+        len(KAPPA) * N_SD_PER_PARCEL,
+        KAPPA,
+        N_IN_DV,
+    )
+
+    # assert
+    for key, value in actual.items():
+        np.testing.assert_allclose(
+            value, np.concatenate([item[key] for item in expected]), rtol=1e-10
+        )
+
+
+def test_multi_parcel_with_callable_updraft():
+    # arrange
+    sut = MultiParcel(
+        dt=1 * si.s,
+        mass_of_dry_air=1 * si.kg,
+        p0=1000 * si.hPa,
+        q0=20 * si.g / si.kg,
+        T0=300 * si.K,
+        w=lambda t: np.asarray((1, 2)) * si.m / si.s * (1 + t / si.s),
+        n_parcels=2,
+    )
+
+    # act
+    result = _run(sut, 2 * N_SD_PER_PARCEL, 0.5, N_IN_DV[0])
+
+    # assert
+    np.testing.assert_allclose(result["z"], np.asarray((220, 440)) * si.m)
+
+
+def test_multi_parcel_inconsistent_shapes():
+    with pytest.raises(ValueError):
+        MultiParcel(
+            dt=1 * si.s,
+            mass_of_dry_air=1 * si.kg,
+            p0=1000 * si.hPa,
+            q0=20 * si.g / si.kg,
+            T0=np.asarray((300, 301)) * si.K,
+            w=np.asarray((1, 2, 3)) * si.m / si.s,
+        )
+
+
+def test_multi_parcel_with_collisions_raises():
+    # arrange
+    sut = MultiParcel(dt=1 * si.s, **PARAMS)
+    builder = Builder(len(KAPPA) * N_SD_PER_PARCEL, backend=CPU())
+    builder.set_environment(sut)
+    builder.add_dynamic(Coalescence(collision_kernel=Golovin(b=1.5e3 / si.s)))
+
+    # act & assert
+    with pytest.raises(NotImplementedError):
+        builder.build(
+            attributes=sut.init_attributes(n_in_dv=N_IN_DV, kappa=KAPPA, r_dry=R_DRY)
+        )
@@ -0,0 +1,70 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+import numpy as np
+import pytest
+
+from PySDM import Builder
+from PySDM.backends import CPU
+from PySDM.dynamics import AmbientThermodynamics, Condensation
+from PySDM.environments import Parcel
+from PySDM.physics import si
+
+W_TIMES = np.asarray((0, 5, 10, 30)) * si.s
+W_VALUES = np.asarray((0.5, 2, 1, 1)) * si.m / si.s
+
+
+def _run(w, n_sd=4, n_steps=15):
+    builder = Builder(n_sd, backend=CPU())
+    builder.set_environment(
+        Parcel(
+            dt=1 * si.s,
+            mass_of_dry_air=1 * si.kg,
+            p0=1000 * si.hPa,
+            q0=20 * si.g / si.kg,
+            T0=300 * si.K,
+            w=w,
+        )
+    )
+    builder.add_dynamic(AmbientThermodynamics())
+    builder.add_dynamic(Condensation())
+    particulator = builder.build(
+        attributes=builder.particulator.environment.init_attributes(
+            n_in_dv=np.full(n_sd, 1e8),
+            kappa=0.5,
+            r_dry=np.logspace(-8, -7, n_sd) * si.m,
+        )
+    )
+    particulator.run(n_steps)
+    return {
+        "volume": particulator.attributes["volume"].to_ndarray(),
+        "z": particulator.environment["z"].to_ndarray(),
+        "t": particulator.environment["t"].to_ndarray(),
+        "rhod": particulator.environment["rhod"].to_ndarray(),
+        "dv": particulator.mesh.dv,
+    }
+
+
+@pytest.mark.parametrize(
+    "w, w_callable",
+    (
+        (1 * si.m / si.s, lambda _: 1 * si.m / si.s),
+        ((W_TIMES, W_VALUES), lambda t: np.interp(t, W_TIMES, W_VALUES)),
+    ),
+)
+def test_compiled_updraft_matches_callable(w, w_callable):
+    # act
+    actual = _run(w)
+    expected = _run(w_callable)
+
+    # assert
+    for key, value in expected.items():
+        np.testing.assert_allclose(actual[key], value, rtol=1e-12)
+
+
+def test_tabulated_updraft_displacement():
+    # act
+    result = _run((W_TIMES, W_VALUES), n_steps=10)
+
+    # assert
+    expected_z = sum(np.interp(t + 0.5, W_TIMES, W_VALUES) for t in range(10))
+    np.testing.assert_allclose(result["z"], expected_z * si.m)
+    np.testing.assert_allclose(result["t"], 10 * si.s)
@@ -0,0 +1,158 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+import numpy as np
+import pytest
+
+from PySDM import Builder
+from PySDM.backends import CPU
+from PySDM.dynamics import AmbientThermodynamics, Displacement, EulerianAdvection
+from PySDM.environments.prescribed_flow_2d import PrescribedFlow2D
+from PySDM.impl.time_slice_stream import TimeSliceStream
+from PySDM.initialisation.sampling import spatial_sampling
+from PySDM.physics import si
+
+GRID = (4, 3)
+TIMES = np.asarray((0, 2, 4, 6, 8)) * si.s
+
+
+class _Advectee:
+    def __init__(self, data):
+        self.data = data
+
+    def get(self):
+        return self.data
+
+
+class _Advector:
+    def __init__(self):
+        self.components = (
+            np.zeros((GRID[0] + 1, GRID[1])),
+            np.zeros((GRID[0], GRID[1] + 1)),
+        )
+
+    def get_component(self, i):
+        return self.components[i]
+
+
+class _Solver:
+    def __init__(self, data):
+        self.advectee = _Advectee(data)
+        self.advector = _Advector()
+
+
+class _Solvers:
+    """mimicking PyMPDATA solvers (with no advection)"""
+
+    def __init__(self):
+        self.solvers = {
+            "th": _Solver(np.full(GRID, 300 * si.K)),
+            "qv": _Solver(np.full(GRID, 10 * si.g / si.kg)),
+        }
+
+    def __getitem__(self, key):
+        return self.solvers[key]
+
+    def __call__(self):
+        pass
+
+    def wait(self):
+        pass
+
+
+def _fields(rng):
+    return {
+        "courant_field": (
+            rng.uniform(-0.1, 0.1, (len(TIMES), GRID[0] + 1, GRID[1])),
+            rng.uniform(-0.1, 0.1, (len(TIMES), GRID[0], GRID[1] + 1)),
+        ),
+        "rhod": rng.uniform(1, 1.2, (len(TIMES),) + GRID) * si.kg / si.m**3,
+        "tendencies": {
+            "qv": np.full((len(TIMES),) + GRID, 1e-4) * si.g / si.kg / si.s,
+        },
+    }
+
+
+def _interpolated(field, time):
+    i = min(np.searchsorted(TIMES, time, side="right") - 1, len(TIMES) - 2)
+    weight = (time - TIMES[i]) / (TIMES[i + 1] - TIMES[i])
+    return (1 - weight) * field[i] + weight * field[i + 1]
+
+
+@pytest.mark.parametrize("from_files", (False, True))
+def test_prescribed_flow_2d(tmp_path, from_files):
+    # arrange
+    fields = _fields(np.random.default_rng(44))
+    arguments = fields
+    if from_files:
+        arguments = {
+            "courant_field": tuple(
+                str(tmp_path / f"courant_{i}.npy") for i in range(2)
+            ),
+            "rhod": str(tmp_path / "rhod.npy"),
+            "tendencies": {"qv": str(tmp_path / "qv_tendency.npy")},
+        }
+        for i in range(2):
+            np.save(arguments["courant_field"][i], fields["courant_field"][i])
+        np.save(arguments["rhod"], fields["rhod"])
+        np.save(arguments["tendencies"]["qv"], fields["tendencies"]["qv"])
+
+    dt = 1 * si.s
+    env = PrescribedFlow2D(
+        dt=dt, grid=GRID, size=(400 * si.m, 300 * si.m), times=TIMES, **arguments
+    )
+    n_sd = 16
+    builder = Builder(n_sd, backend=CPU())
+    builder.set_environment(env)
+    solvers = _Solvers()
+    builder.add_dynamic(AmbientThermodynamics())
+    builder.add_dynamic(EulerianAdvection(solvers))
+    builder.add_dynamic(Displacement())
+    positions = spatial_sampling.Pseudorandom.sample(GRID, n_sd)
+    cell_id, cell_origin, position_in_cell = env.mesh.cellular_attributes(positions)
+    particulator = builder.build(
+        attributes={
+            "n": np.full(n_sd, 1e6),
+            "volume": np.full(n_sd, 1 * si.um**3),
+            "cell id": cell_id,
+            "cell origin": cell_origin,
+            "position in cell": position_in_cell,
+        }
+    )
+
+    for step in range(7):
+        # act
+        particulator.run(1)
+
+        # assert
+        np.testing.assert_allclose(
+            env["rhod"].to_ndarray(),
+            _interpolated(fields["rhod"], step * dt).ravel(),
+        )
+        for i, expected in enumerate(fields["courant_field"]):
+            expected = _interpolated(expected, (step + 0.5) * dt)
+            np.testing.assert_allclose(
+                particulator.dynamics["Displacement"].courant[i].to_ndarray(),
+                expected,
+            )
+            for key in ("th", "qv"):
+                np.testing.assert_allclose(
+                    solvers[key].advector.get_component(i), expected
+                )
+    np.testing.assert_allclose(env["qv"].to_ndarray(), (10 + 7 * 1e-4) * si.g / si.kg)
+    env.close()
+
+
+def test_time_slice_stream_bounded_memory():
+    # arrange
+    data = np.arange(10 * 3, dtype=float).reshape(10, 3)
+    with TimeSliceStream(data, times=np.arange(10) * 2) as sut:
+        for time in np.linspace(-1, 21, 45):
+            # act
+            actual = sut(time)
+
+            # assert
+            np.testing.assert_allclose(
+                actual,
+                [np.interp(time, np.arange(10) * 2, data[:, j]) for j in range(3)],
+            )
+            assert sut.n_slices_in_memory <= 3
+    assert sut.n_slices_in_memory <= 2
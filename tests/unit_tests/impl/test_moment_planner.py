@@ -0,0 +1,166 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+import numpy as np
+import pytest
+
+from PySDM import Builder
+from PySDM.backends import CPU
+from PySDM.backends.impl_common import bin_spacing
+from PySDM.environments import Box
+from PySDM.physics import si
+from PySDM.products import (
+    EffectiveRadius,
+    MeanRadius,
+    ParticleConcentration,
+    ParticleSizeSpectrumPerVolume,
+    ParticleVolumeVersusRadiusLogarithmSpectrum,
+    TotalParticleConcentration,
+)
+from PySDM.products.size_spectral.number_size_spectrum import NumberSizeSpectrum
+
+N_SD = 64
+RADIUS_BINS = np.logspace(-7, -4, 12) * si.m
+
+
+def _products():
+    return (
+        TotalParticleConcentration(),
+        MeanRadius(),
+        EffectiveRadius(),
+        EffectiveRadius(radius_range=(1 * si.um, np.inf), name="Reff > 1um"),
+        ParticleConcentration(radius_range=(1 * si.um, np.inf)),
+        ParticleSizeSpectrumPerVolume(radius_bins_edges=RADIUS_BINS),
+        NumberSizeSpectrum(radius_bins_edges=RADIUS_BINS),
+        ParticleVolumeVersusRadiusLogarithmSpectrum(radius_bins_edges=RADIUS_BINS),
+    )
+
+
+def _particulator():
+    builder = Builder(N_SD, backend=CPU())
+    builder.set_environment(Box(dt=1 * si.s, dv=1 * si.m**3))
+    particulator = builder.build(
+        attributes={
+            "n": np.full(N_SD, 1e6),
+            "volume": np.logspace(-20, -12, N_SD) * si.m**3,
+        },
+        products=_products(),
+    )
+    particulator.environment["rhod"] = 1 * si.kg / si.m**3
+    return particulator
+
+
+def _get_all(particulator):
+    return {
+        name: product.get().copy() for name, product in particulator.products.items()
+    }
+
+
+def _reference_moment(particulator, rank, filter_range=(-np.inf, np.inf)):
+    moment_0 = particulator.Storage.empty(1, dtype=float)
+    moments = particulator.Storage.empty((1, 1), dtype=float)
+    particulator.moments(
+        moment_0=moment_0,
+        moments=moments,
+        specs={"volume": (rank,)},
+        attr_range=filter_range,
+    )
+    return (moments if rank != 0 else moment_0).to_ndarray().ravel()
+
+
+def test_moment_planner_fuses_passes():
+    # arrange
+    particulator = _particulator()
+    _get_all(particulator)
+    planner = particulator.moment_planner
+    planner.n_passes = 0
+
+    # act
+    particulator.run(1)
+    _get_all(particulator)
+
+    # assert
+    assert planner.n_passes == 3 + 1  # three filter ranges, one set of bins
+
+
+def test_moment_planner_results():
+    # arrange
+    particulator = _particulator()
+
+    # act
+    products = _get_all(particulator)
+
+    # assert
+    np.testing.assert_allclose(
+        products["total particle concentration"], _reference_moment(particulator, 0)
+    )
+    np.testing.assert_allclose(
+        products["mean radius"],
+        _reference_moment(particulator, 1 / 3) / (4 / 3 * np.pi) ** (1 / 3),
+    )
+    np.testing.assert_allclose(
+        products["effective radius"],
+        _reference_moment(particulator, 1)
+        / _reference_moment(particulator, 2 / 3)
+        / (4 / 3 * np.pi) ** (1 / 3),
+    )
+
+
+@pytest.mark.parametrize("mark_updated", (True, False))
+def test_moment_planner_cache_invalidation(mark_updated):
+    # arrange
+    particulator = _particulator()
+    before = _get_all(particulator)
+
+    # act
+    particulator.attributes["volume"].data[:] *= 8
+    if mark_updated:
+        particulator.attributes.mark_updated("volume")
+    else:
+        particulator.moment_planner.invalidate()
+    after = _get_all(particulator)
+
+    # assert
+    np.testing.assert_allclose(after["mean radius"], 2 * before["mean radius"])
+    np.testing.assert_allclose(
+        after["total particle concentration"], before["total particle concentration"]
+    )
+
+
+def test_spectrum_products_detect_bin_spacing():
+    # act
+    particulator = _particulator()
+
+    # assert
+    for product in particulator.products.values():
+        if hasattr(product, "attr_bins_spacing"):
+            assert product.attr_bins_spacing == bin_spacing.LOGARITHMIC
+
+
+def test_moment_planner_fuses_spectrum_ranks():
+    # arrange
+    particulator = _particulator()
+    planner = particulator.moment_planner
+    bins = particulator.Storage.from_ndarray(
+        particulator.formulae.trivia.volume(RADIUS_BINS)
+    )
+    ranks = (1, 2 / 3, 1 / 3)
+    for rank in ranks:
+        planner.spectrum(attr="volume", rank=rank, attr_bins=bins)
+    planner.n_passes = 0
+
+    # act
+    particulator.run(1)
+    actual = {
+        rank: planner.spectrum(attr="volume", rank=rank, attr_bins=bins)[1].copy()
+        for rank in ranks
+    }
+
+    # assert
+    assert planner.n_passes == 1
+    shape = (len(RADIUS_BINS) - 1, 1)
+    for rank in ranks:
+        moment_0 = particulator.Storage.empty(shape, dtype=float)
+        moments = particulator.Storage.empty(shape, dtype=float)
+        particulator.spectrum_moments(
+            moment_0=moment_0, moments=moments, attr="volume", rank=rank, attr_bins=bins
+        )
+        np.testing.assert_allclose(actual[rank], moments.to_ndarray())
@@ -163,3 +163,18 @@ class TestFormulae:
 
         # Assert
         assert len(result) > 0
+
+    @staticmethod
+    def test_cache_key():
+        # Arrange
+        sut = Formulae()
+
+        # Act
+        key = sut.cache_key
+
+        # Assert
+        assert hash(key) == hash(Formulae(seed=sut.seed + 1).cache_key)
+        assert key == Formulae(seed=sut.seed + 1).cache_key
+        assert key != Formulae(latent_heat="Constant").cache_key
+        assert key != Formulae(fastmath=not sut.fastmath).cache_key
+        assert key != Formulae(constants={"rho_w": 2 * sut.constants.rho_w}).cache_key
@@ -0,0 +1,113 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+import numpy as np
+import pytest
+
+from PySDM import Builder
+from PySDM.backends import CPU
+from PySDM.dynamics import Coalescence
+from PySDM.dynamics.collisions.collision_kernels import ConstantK
+from PySDM.environments import Box
+from PySDM.physics import si
+from PySDM.products import (
+    CollisionGammaHistogram,
+    CollisionPairAcceptanceFraction,
+    CollisionProbabilityHistogram,
+    CollisionSubstepHistogram,
+)
+
+
+def _make_particulator(*, n_init, adaptive, products, kernel_a=1e6 * si.cm**3 / si.s):
+    n_sd = len(n_init)
+    builder = Builder(n_sd, CPU())
+    builder.set_environment(Box(dv=1 * si.m**3, dt=1 * si.s))
+    builder.add_dynamic(
+        Coalescence(collision_kernel=ConstantK(a=kernel_a), adaptive=adaptive)
+    )
+    return builder.build(
+        attributes={
+            "n": np.asarray(n_init),
+            "volume": np.asarray([100 * si.um**3] * n_sd),
+        },
+        products=products,
+    )
+
+
+class TestCollisionDiagnostics:
+    @staticmethod
+    def test_gamma_histogram_counts_all_candidate_pairs():
+        # arrange
+        n_init = [5, 2] * 4
+        n_bins = 4
+        particulator = _make_particulator(
+            n_init=n_init,
+            adaptive=False,
+            products=(CollisionGammaHistogram(n_bins=n_bins, name="gamma"),),
+            kernel_a=1e2 * si.cm**3 / si.s,
+        )
+
+        # act
+        particulator.run(1)
+        histogram = particulator.products["gamma"].get()
+
+        # assert
+        assert histogram.shape == (n_bins,)
+        assert histogram.sum() == len(n_init) // 2
+        np.testing.assert_equal(particulator.products["gamma"].get(), 0)
+
+    @staticmethod
+    def test_multiple_collision_path_lands_in_overflow_bin():
+        # arrange
+        particulator = _make_particulator(
+            n_init=[5, 2],
+            adaptive=False,
+            products=(
+                CollisionGammaHistogram(n_bins=3, name="gamma"),
+                CollisionProbabilityHistogram(
+                    prob_bins_edges=(0, 1, 10, np.inf), name="prob"
+                ),
+            ),
+        )
+
+        # act
+        particulator.run(1)
+
+        # assert
+        np.testing.assert_equal(particulator.products["gamma"].get(), (0, 0, 1))
+        np.testing.assert_equal(particulator.products["prob"].get(), (0, 1, 0))
+
+    @staticmethod
+    def test_pair_acceptance_fraction():
+        # arrange
+        particulator = _make_particulator(
+            n_init=[5, 2] * 8,
+            adaptive=False,
+            products=(CollisionPairAcceptanceFraction(name="acc"),),
+        )
+
+        # act
+        particulator.run(1)
+
+        # assert
+        assert particulator.products["acc"].get()[0] == 1
+        assert np.isnan(particulator.products["acc"].get()[0])
+
+    @staticmethod
+    @pytest.mark.parametrize("adaptive", (True, False))
+    def test_substep_histogram(adaptive):
+        # arrange
+        n_steps = 3
+        particulator = _make_particulator(
+            n_init=[5, 2] * 4,
+            adaptive=adaptive,
+            products=(CollisionSubstepHistogram(n_bins=16, name="substeps"),),
+        )
+
+        # act
+        particulator.run(n_steps)
+        histogram = particulator.products["substeps"].get()
+
+        # assert
+        assert histogram.sum() == n_steps
+        n_substeps = particulator.dynamics["Collision"].stats_n_substep.to_ndarray()
+        expected_total = n_substeps[0] if adaptive else n_steps * n_substeps[0]
+        assert (histogram * np.arange(histogram.shape[0])).sum() == expected_total
@@ -0,0 +1,86 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+import numpy as np
+import pytest
+
+from PySDM import Builder
+from PySDM.backends import CPU
+from PySDM.dynamics import AmbientThermodynamics, Condensation
+from PySDM.environments import Parcel
+from PySDM.physics import si
+from PySDM.products import (
+    CondensationBracketExpansions,
+    CondensationNearEquilibriumDroplets,
+    CondensationRootFindingIterations,
+    CondensationSolverFailures,
+    CondensationSubstepProbes,
+)
+
+
+def _make_particulator(*, adaptive, n_sd=8):
+    builder = Builder(n_sd, backend=CPU())
+    builder.set_environment(
+        Parcel(
+            dt=1 * si.s,
+            mass_of_dry_air=1 * si.kg,
+            p0=1000 * si.hPa,
+            q0=20 * si.g / si.kg,
+            T0=300 * si.K,
+            w=1 * si.m / si.s,
+        )
+    )
+    builder.add_dynamic(AmbientThermodynamics())
+    builder.add_dynamic(Condensation(adaptive=adaptive))
+    dry_volume = np.logspace(-21, -18, n_sd) * si.m**3
+    return builder.build(
+        attributes={
+            "n": np.full(n_sd, 1e6),
+            "dry volume": dry_volume,
+            "kappa times dry volume": 0.5 * dry_volume,
+            "volume": 10 * dry_volume,
+        },
+        products=(
+            CondensationRootFindingIterations(name="iters"),
+            CondensationBracketExpansions(name="expansions"),
+            CondensationNearEquilibriumDroplets(name="skipped"),
+            CondensationSolverFailures(name="failures"),
+            CondensationSubstepProbes(name="probes"),
+        ),
+    )
+
+
+class TestCondensationSolverDiagnostics:
+    @staticmethod
+    @pytest.mark.parametrize("adaptive", (True, False))
+    def test_counts_accumulated_over_timesteps(adaptive):
+        # arrange
+        n_steps = 3
+        particulator = _make_particulator(adaptive=adaptive)
+
+        # act
+        particulator.run(n_steps)
+        values = {
+            name: particulator.products[name].get()[0]
+            for name in ("iters", "expansions", "skipped", "failures", "probes")
+        }
+
+        # assert
+        iterations = particulator.dynamics["Condensation"].n_iterations.to_ndarray()
+        assert values["iters"] + values["expansions"] > iterations.sum()
+        assert values["failures"] == 0
+        if adaptive:
+            assert values["probes"] >= 2 * n_steps
+        else:
+            assert values["probes"] == 0
+        assert values["skipped"] >= 0
+
+    @staticmethod
+    def test_fetching_resets_counters():
+        # arrange
+        particulator = _make_particulator(adaptive=True)
+        particulator.run(1)
+
+        # act
+        particulator.products["iters"].get()
+
+        # assert
+        assert particulator.products["iters"].get()[0] == 0
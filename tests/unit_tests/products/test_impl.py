@@ -12,6 +12,7 @@ from PySDM.backends import CPU
 from PySDM.products import (
     AqueousMassSpectrum,
     AqueousMoleFraction,
+    CollisionProbabilityHistogram,
     DynamicWallTime,
     FlowVelocityComponent,
     FreezableSpecificConcentration,
@@ -22,7 +23,9 @@ from PySDM.products import (
     ParticleSizeSpectrumPerVolume,
     ParticleVolumeVersusRadiusLogarithmSpectrum,
     RadiusBinnedNumberAveragedTerminalVelocity,
+    TimeStatistic,
     TotalDryMassMixingRatio,
+    TotalParticleConcentration,
 )
 from PySDM.products.impl.product import Product
 from PySDM.products.impl.rate_product import RateProduct
@@ -30,6 +33,7 @@ from PySDM.products.impl.rate_product import RateProduct
 _ARGUMENTS = {
     AqueousMassSpectrum: {"key": "S_VI", "dry_radius_bins_edges": (0, np.inf)},
     AqueousMoleFraction: {"key": "S_VI"},
+    CollisionProbabilityHistogram: {"prob_bins_edges": (0, 1, np.inf)},
     TotalDryMassMixingRatio: {"density": 1},
     ParticleSizeSpectrumPerMass: {"radius_bins_edges": (0, np.inf)},
     GaseousMoleFraction: {"key": "O3"},
@@ -44,6 +48,7 @@ _ARGUMENTS = {
         "count_unactivated": True,
         "count_activated": True,
     },
+    TimeStatistic: {"product": TotalParticleConcentration()},
 }
 
 
@@ -0,0 +1,132 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+import numpy as np
+import pytest
+
+from PySDM import Builder
+from PySDM.backends import CPU
+from PySDM.environments import Box
+from PySDM.physics import si
+from PySDM.products import (
+    ActivableFraction,
+    EffectiveRadius,
+    ParticleSizeSpectrumPerMass,
+    Time,
+    WaterMixingRatio,
+)
+
+N_SD = 32
+
+
+def _particulator(memoise_products):
+    builder = Builder(N_SD, backend=CPU())
+    builder.set_environment(Box(dt=1 * si.s, dv=1 * si.m**3))
+    dry_volume = np.logspace(-22, -20, N_SD) * si.m**3
+    particulator = builder.build(
+        attributes={
+            "n": np.full(N_SD, 1e6),
+            "volume": 100 * dry_volume,
+            "dry volume": dry_volume,
+            "kappa times dry volume": 0.5 * dry_volume,
+            "dry volume organic": np.zeros(N_SD),
+        },
+        products=(
+            EffectiveRadius(),
+            WaterMixingRatio(),
+            ActivableFraction(),
+            ParticleSizeSpectrumPerMass(radius_bins_edges=np.logspace(-7, -4, 8)),
+            Time(),
+        ),
+        memoise_products=memoise_products,
+    )
+    particulator.environment["rhod"] = 1 * si.kg / si.m**3
+    particulator.environment["T"] = 300 * si.K
+    return particulator
+
+
+def _get_all(particulator):
+    """copies needed as products may return the buffer shared among them"""
+    return {
+        "reff": particulator.products["effective radius"].get().copy(),
+        "lwc": particulator.products["water mixing ratio"].get().copy(),
+        "af": particulator.products["activable fraction"].get(S_max=0.1).copy(),
+        "spectrum": particulator.products["particle size spectrum per mass"]
+        .get()
+        .copy(),
+    }
+
+
+def test_memoisation_flags():
+    # act
+    particulator = _particulator(memoise_products=True)
+
+    # assert
+    assert particulator.products["effective radius"].memoise
+    assert not particulator.products["time"].memoise
+
+
+@pytest.mark.parametrize(
+    "change",
+    (
+        None,
+        "run",
+        "rhod",
+        "volume",
+    ),
+)
+def test_memoisation(change):
+    # arrange
+    particulator = _particulator(memoise_products=True)
+    reference = _particulator(memoise_products=False)
+    _get_all(particulator)
+    n_passes = particulator.moment_planner.n_passes
+
+    # act
+    for sut in (particulator, reference):
+        if change == "run":
+            sut.run(1)
+        elif change == "rhod":
+            sut.environment["rhod"] = 2 * si.kg / si.m**3
+        elif change == "volume":
+            sut.attributes["volume"].data[:] *= 2
+            sut.attributes.mark_updated("volume")
+    actual = _get_all(particulator)
+    expected = _get_all(reference)
+
+    # assert
+    assert (particulator.moment_planner.n_passes == n_passes) == (
+        change in (None, "rhod")
+    )
+    for key, value in expected.items():
+        np.testing.assert_array_equal(actual[key], value)
+
+
+def test_memoised_values_are_copies():
+    # arrange
+    particulator = _particulator(memoise_products=True)
+    product = particulator.products["effective radius"]
+    expected = product.get().copy()
+
+    # act
+    product.get()[:] = 0
+
+    # assert
+    np.testing.assert_array_equal(product.get(), expected)
+
+
+@pytest.mark.parametrize("memoise_products", (True, False))
+def test_memoisation_skips_evaluation(monkeypatch, memoise_products):
+    # arrange
+    particulator = _particulator(memoise_products=memoise_products)
+    product = particulator.products["activable fraction"]
+    calls = []
+    impl = product._impl  # pylint: disable=protected-access
+    monkeypatch.setattr(
+        product, "_impl", lambda **kwargs: calls.append(kwargs) or impl(**kwargs)
+    )
+
+    # act
+    for s_max in (0.1, 0.1, 0.2, 0.1):
+        product.get(S_max=s_max)
+
+    # assert
+    assert len(calls) == (2 if memoise_products else 4)
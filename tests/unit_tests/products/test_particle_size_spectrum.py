@@ -0,0 +1,71 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+import numpy as np
+import pytest
+
+from PySDM import Builder
+from PySDM.environments import Box
+from PySDM.physics import si
+from PySDM.products import (
+    ParticleSizeSpectrumPerMass,
+    ParticleSizeSpectrumPerVolume,
+    ParticleVolumeVersusRadiusLogarithmSpectrum,
+)
+
+from ...backends_fixture import backend_class
+
+assert hasattr(backend_class, "_pytestfixturefunction")
+
+N_SD = 64
+DV = 2 * si.m**3
+RHOD = 1.2 * si.kg / si.m**3
+RADIUS_BINS = np.asarray([0.1, 0.3, 1, 2, 5, 10, 50, 100]) * si.um
+
+
+@pytest.mark.parametrize(
+    "product_class, normalisation",
+    (
+        (ParticleSizeSpectrumPerVolume, 1 / RHOD),
+        (ParticleSizeSpectrumPerMass, 1 / DV / RHOD),
+    ),
+)
+# pylint: disable=redefined-outer-name
+def test_particle_size_spectrum(backend_class, product_class, normalisation):
+    # arrange
+    builder = Builder(N_SD, backend=backend_class())
+    builder.set_environment(Box(dt=1 * si.s, dv=DV))
+    radii = np.logspace(-7.5, -4.5, N_SD) * si.m
+    multiplicities = np.arange(1, N_SD + 1) * 1e3
+    particulator = builder.build(
+        attributes={
+            "n": multiplicities,
+            "volume": builder.formulae.trivia.volume(radii),
+        },
+        products=(
+            product_class(radius_bins_edges=RADIUS_BINS),
+            ParticleVolumeVersusRadiusLogarithmSpectrum(radius_bins_edges=RADIUS_BINS),
+        ),
+    )
+    particulator.environment["rhod"] = RHOD
+
+    # act
+    spectrum = product_class(radius_bins_edges=RADIUS_BINS).name
+    actual = particulator.products[spectrum].get().copy()
+    actual_volume = particulator.products[
+        "particle volume versus radius logarithm spectrum"
+    ].get()
+
+    # assert
+    histogram, _ = np.histogram(radii, bins=RADIUS_BINS, weights=multiplicities)
+    np.testing.assert_allclose(
+        actual, histogram / np.diff(RADIUS_BINS) * normalisation, rtol=1e-5
+    )
+    histogram, _ = np.histogram(
+        radii,
+        bins=RADIUS_BINS,
+        weights=multiplicities * builder.formulae.trivia.volume(radii),
+    )
+    np.testing.assert_allclose(
+        actual_volume.ravel(),
+        histogram / np.diff(np.log(RADIUS_BINS)) / DV,
+        rtol=1e-5,
+    )
@@ -0,0 +1,168 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+import numpy as np
+import pytest
+
+from PySDM import Builder
+from PySDM.backends import CPU
+from PySDM.environments import Box
+from PySDM.physics import si
+from PySDM.products import (
+    EffectiveRadius,
+    MeanRadius,
+    ParticleSizeSpectrumPerVolume,
+    ParticleVolumeVersusRadiusLogarithmSpectrum,
+    TimeStatistic,
+    TotalParticleConcentration,
+)
+
+from ...backends_fixture import backend_class
+
+assert hasattr(backend_class, "_pytestfixturefunction")
+
+N_SD = 32
+N_STEPS = 5
+RADIUS_BINS = np.logspace(-7, -4, 8) * si.m
+REDUCTIONS = {"mean": np.mean, "min": np.min, "max": np.max}
+
+
+def _products(statistic="mean"):
+    return (
+        TotalParticleConcentration(),
+        MeanRadius(),
+        ParticleSizeSpectrumPerVolume(radius_bins_edges=RADIUS_BINS),
+    ) + (
+        (
+            EffectiveRadius(),
+            ParticleVolumeVersusRadiusLogarithmSpectrum(radius_bins_edges=RADIUS_BINS),
+        )
+        if statistic == "mean"
+        else ()
+    )
+
+
+def _particulator(backend_class, statistic, window):
+    builder = Builder(N_SD, backend=backend_class())
+    builder.set_environment(Box(dt=1 * si.s, dv=1 * si.m**3))
+    particulator = builder.build(
+        attributes={
+            "n": np.linspace(1e6, 2e6, N_SD),
+            "volume": np.logspace(-20, -14, N_SD) * si.m**3,
+        },
+        products=_products()
+        + tuple(
+            TimeStatistic(product, statistic=statistic, window=window)
+            for product in _products(statistic)
+        ),
+    )
+    particulator.environment["rhod"] = 1 * si.kg / si.m**3
+    return particulator
+
+
+def _step(particulator, step):
+    """alters particle volumes and multiplicities (differently in each step)"""
+    volume = particulator.attributes["volume"].to_ndarray()
+    volume *= 1 + 0.5 * np.sin(step + np.arange(N_SD))
+    particulator.attributes["volume"].upload(volume)
+    particulator.attributes.mark_updated("volume")
+    multiplicity = particulator.attributes["n"].to_ndarray()
+    multiplicity[step % N_SD :: 2] *= 2
+    particulator.attributes["n"].upload(multiplicity)
+    particulator.attributes.mark_updated("n")
+    particulator.run(1)
+
+
+def _moment(particulator, rank):
+    volume = particulator.attributes["volume"].to_ndarray()
+    return np.sum(particulator.attributes["n"].to_ndarray() * volume**rank)
+
+
+@pytest.mark.parametrize("statistic", REDUCTIONS.keys())
+@pytest.mark.parametrize("window", (None, 2))
+# pylint: disable=redefined-outer-name
+def test_time_statistic(backend_class, statistic, window):
+    # arrange
+    particulator = _particulator(backend_class, statistic, window)
+    names = tuple(product.name for product in _products(statistic))
+    history = {name: [] for name in names + ("m1", "m2/3")}
+
+    # act
+    for step in range(N_STEPS):
+        _step(particulator, step)
+        for name in names:
+            history[name].append(particulator.products[name].get().copy())
+        history["m1"].append(_moment(particulator, 1))
+        history["m2/3"].append(_moment(particulator, 2 / 3))
+    actual = {
+        name: particulator.products[f"{name} ({statistic})"].get().copy()
+        for name in names
+    }
+
+    # assert
+    steps = slice(None) if window is None else slice(2, 4)
+    history = {name: np.asarray(values[steps]) for name, values in history.items()}
+    for name in ("total particle concentration", "particle size spectrum per volume"):
+        np.testing.assert_allclose(
+            actual[name], REDUCTIONS[statistic](history[name], axis=0), rtol=1e-5
+        )
+    concentration = history["total particle concentration"]
+    np.testing.assert_allclose(
+        actual["mean radius"],
+        np.sum(history["mean radius"] * concentration, axis=0)
+        / np.sum(concentration, axis=0)
+        if statistic == "mean"
+        else REDUCTIONS[statistic](history["mean radius"], axis=0),
+        rtol=1e-5,
+    )
+    if statistic == "mean":
+        name = "particle volume versus radius logarithm spectrum"
+        np.testing.assert_allclose(
+            actual[name], np.mean(history[name], axis=0), rtol=1e-5
+        )
+        np.testing.assert_allclose(
+            actual["effective radius"],
+            np.sum(history["m1"])
+            / np.sum(history["m2/3"])
+            / (4 / 3 * np.pi) ** (1 / 3),
+            rtol=1e-5,
+        )
+
+
+@pytest.mark.parametrize("statistic", ("min", "max"))
+def test_time_statistic_rejects_min_max_of_multi_moment_products(statistic):
+    # arrange
+    builder = Builder(N_SD, backend=CPU())
+    builder.set_environment(Box(dt=1 * si.s, dv=1 * si.m**3))
+    particulator = builder.build(
+        attributes={
+            "n": np.full(N_SD, 1e6),
+            "volume": np.logspace(-20, -14, N_SD) * si.m**3,
+        },
+        products=(TimeStatistic(EffectiveRadius(), statistic=statistic),),
+    )
+
+    # act & assert
+    with pytest.raises(ValueError):
+        particulator.run(1)
+
+
+def test_time_statistic_resets_on_read():
+    # arrange
+    particulator = _particulator(CPU, statistic="max", window=None)
+    product = particulator.products["total particle concentration (max)"]
+    reference = particulator.products["total particle concentration"]
+
+    # act
+    _step(particulator, 0)
+    product.get()
+    particulator.attributes["n"].data[:] //= 2
+    particulator.attributes.mark_updated("n")
+    particulator.run(1)
+
+    # assert
+    np.testing.assert_allclose(product.get(), reference.get())
+    assert np.isnan(product.get()).all()
+
+
+def test_time_statistic_raises_for_unsupported_arguments():
+    with pytest.raises(ValueError):
+        TimeStatistic(TotalParticleConcentration(), statistic="median")